@@ -0,0 +1,24 @@
+-- 강의 완료 집계(rollup) 테이블 추가
+-- MySQLPipeline이 강의 완료(False → True)를 감지할 때마다 일별/주별 집계를 바로 갱신합니다.
+-- daily_completion_queries.sql의 통계 쿼리는 lectures 전체를 스캔하지 않고 이 테이블의 몇 행만 읽습니다.
+
+CREATE TABLE IF NOT EXISTS `lecture_completion_daily` (
+  `completion_date` date NOT NULL COMMENT '완료 날짜',
+  `course_id` int NOT NULL COMMENT '강의 ID',
+  `completed_count` int NOT NULL DEFAULT 0 COMMENT '완료한 강의 수',
+  `completed_minutes` decimal(10,2) NOT NULL DEFAULT 0 COMMENT '완료한 강의 시간 합계(분)',
+  PRIMARY KEY (`completion_date`, `course_id`),
+  KEY `idx_course_date` (`course_id`, `completion_date`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='일별 강의 완료 집계';
+
+CREATE TABLE IF NOT EXISTS `lecture_completion_weekly` (
+  `week_start` date NOT NULL COMMENT '주 시작일 (월요일)',
+  `course_id` int NOT NULL COMMENT '강의 ID',
+  `completed_count` int NOT NULL DEFAULT 0 COMMENT '완료한 강의 수',
+  `completed_minutes` decimal(10,2) NOT NULL DEFAULT 0 COMMENT '완료한 강의 시간 합계(분)',
+  PRIMARY KEY (`week_start`, `course_id`),
+  KEY `idx_course_week` (`course_id`, `week_start`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='주별 강의 완료 집계';
+
+-- 테이블 생성 후 기존 lectures.completed_at 데이터로 집계 채우기:
+--   scrapy backfill_rollups
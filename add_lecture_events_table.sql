@@ -0,0 +1,23 @@
+-- 강의 완료 이벤트 로그 (append-only)
+-- lectures.completed_at은 마지막 완료 시각만 남기므로 완료 → 미완료 → 완료 같은 변경 이력이 사라집니다.
+-- MySQLPipeline이 완료 상태가 바뀔 때마다 이 테이블에 한 행씩 추가하며, 수정/삭제하지 않습니다.
+-- 후속 집계는 마지막으로 처리한 event_id 이후의 행만 읽어서 증분 처리할 수 있습니다.
+
+CREATE TABLE IF NOT EXISTS `lecture_events` (
+  `event_id` bigint NOT NULL AUTO_INCREMENT,
+  `course_id` int NOT NULL COMMENT '강의 ID',
+  `lecture_id` int NOT NULL COMMENT 'lectures.lecture_id',
+  `event_type` enum('completed','uncompleted') NOT NULL COMMENT '완료 / 완료 취소',
+  `lecture_time` decimal(10,2) DEFAULT NULL COMMENT '이벤트 시점의 강의 시간(분)',
+  `occurred_at` datetime NOT NULL COMMENT '상태 변경을 감지한 시각',
+  PRIMARY KEY (`event_id`),
+  KEY `idx_occurred_at` (`occurred_at`),
+  KEY `idx_course_occurred_at` (`course_id`, `occurred_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='강의 완료 상태 변경 이벤트 (append-only)';
+
+-- 기간 조회 예시 (idx_occurred_at 사용)
+-- SELECT * FROM lecture_events
+-- WHERE occurred_at >= '2025-10-01' AND occurred_at < '2025-11-01';
+
+-- 증분 처리 예시 (마지막으로 처리한 event_id 이후만)
+-- SELECT * FROM lecture_events WHERE event_id > 12345 ORDER BY event_id;
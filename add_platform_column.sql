@@ -0,0 +1,11 @@
+-- courses 테이블에 platform 컬럼 추가
+-- 인프런/Udemy 강의도 같은 테이블에 저장하므로 FastCampus spider(daily/recrawl)는 platform = 'fastcampus'만 읽음
+-- 강의 ID가 겹치지 않도록 인프런은 1,000,000,000 + ID, Udemy는 1,500,000,000 + ID를 course_id로 저장함
+
+ALTER TABLE courses
+ADD COLUMN platform VARCHAR(20) NOT NULL DEFAULT 'fastcampus' COMMENT '플랫폼 (fastcampus / inflearn / udemy)',
+ADD INDEX idx_platform (platform);
+
+-- 이 컬럼이 생기기 전에 inflearn/udemy spider로 저장한 행은 원래 ID 그대로라 FastCampus 강의와 겹칠 수 있음
+-- 아래로 확인한 뒤 해당 행을 지우고 inflearn/udemy spider를 다시 실행하면 새 ID로 저장됨
+-- SELECT course_id, url FROM courses WHERE url LIKE '%inflearn.com%' OR url LIKE '%udemy.com%';
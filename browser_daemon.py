@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+상주(warm) 브라우저 데몬
+
+Chromium을 한 번 띄워 로그인된 상태로 유지하고, spider들은 CDP로 접속해서
+브라우저 시작과 카카오 로그인(2단계 인증)을 생략합니다.
+
+사용 방법:
+    # 1. 데몬 실행 (최초 1회 로그인/2단계 인증 필요)
+    python browser_daemon.py --port 9222
+
+    # 2. 다른 터미널에서 spider 실행 (discover → daily → recrawl 연속 실행 가능)
+    BROWSER_DAEMON_CDP_URL=http://127.0.0.1:9222 scrapy crawl fastcampus_daily
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import time
+import urllib.request
+
+from playwright.async_api import async_playwright
+from scrapy.utils.project import get_project_settings
+
+from course_scraper.browser import process_tree_rss_mb
+from course_scraper.credentials import kakao_credentials
+from course_scraper.login import MY_COURSES_URL, ensure_logged_in
+
+logger = logging.getLogger('browser_daemon')
+
+
+def wait_for_cdp(cdp_url, timeout):
+    """CDP 엔드포인트가 응답할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'{cdp_url}/json/version', timeout=1):
+                return True
+        except Exception:
+            time.sleep(0.2)
+    return False
+
+
+async def refresh_session(page, settings, storage_state_path):
+    """로그인 세션 확인 후 storage state 갱신 (만료 시 재로그인)"""
+    await page.goto(MY_COURSES_URL, wait_until='domcontentloaded')
+    await page.wait_for_timeout(2000)
+
+    kakao_email, kakao_password = kakao_credentials(settings)
+    logged_in = await ensure_logged_in(page, kakao_email, kakao_password, logger)
+    if logged_in:
+        await page.context.storage_state(path=storage_state_path)
+        logger.info(f"✓ Storage state saved: {storage_state_path}")
+    return logged_in
+
+
+async def run_daemon(port, refresh_interval, headless):
+    settings = get_project_settings()
+    storage_state_path = settings.get('BROWSER_STORAGE_STATE')
+    user_data_dir = os.path.join(os.path.dirname(storage_state_path), 'user_data')
+    os.makedirs(user_data_dir, exist_ok=True)
+
+    cdp_url = f'http://127.0.0.1:{port}'
+    launch_timeout = settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS').get('timeout', 120000) / 1000
+
+    async with async_playwright() as p:
+        args = [
+            p.chromium.executable_path,
+            f'--remote-debugging-port={port}',
+            f'--user-data-dir={user_data_dir}',
+            '--no-first-run',
+            '--no-default-browser-check',
+        ]
+        if headless:
+            args.append('--headless=new')
+
+        started = time.monotonic()
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        try:
+            if not await asyncio.to_thread(wait_for_cdp, cdp_url, launch_timeout):
+                logger.error(f"✗ Browser did not expose CDP on {cdp_url}")
+                return
+
+            browser = await p.chromium.connect_over_cdp(cdp_url)
+            startup_secs = time.monotonic() - started
+            logger.info(f"✓ Browser started in {startup_secs:.2f}s (pid={process.pid}, "
+                        f"rss={process_tree_rss_mb(process.pid)}MB)")
+
+            context = browser.contexts[0]
+            page = context.pages[0] if context.pages else await context.new_page()
+
+            login_started = time.monotonic()
+            if not await refresh_session(page, settings, storage_state_path):
+                logger.error("✗ Could not establish a logged-in session")
+                return
+            logger.info(f"✓ Session ready in {time.monotonic() - login_started:.2f}s")
+
+            logger.info("=" * 70)
+            logger.info(f"Spider 실행: BROWSER_DAEMON_CDP_URL={cdp_url} scrapy crawl fastcampus_daily")
+            logger.info("=" * 70)
+
+            while True:
+                await asyncio.sleep(refresh_interval)
+                if process.poll() is not None:
+                    logger.error("✗ Browser process exited")
+                    return
+                await refresh_session(page, settings, storage_state_path)
+                logger.info(f"Browser rss={process_tree_rss_mb(process.pid)}MB, "
+                            f"pages={sum(len(c.pages) for c in browser.contexts)}")
+
+        finally:
+            process.terminate()
+            process.wait()
+            logger.info("Browser stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='FastCampus 상주 브라우저 데몬')
+    parser.add_argument('--port', type=int, default=9222, help='CDP 포트 (기본: 9222)')
+    parser.add_argument('--refresh', type=int, default=600, help='세션 갱신 주기(초) (기본: 600)')
+    parser.add_argument('--headless', action='store_true', help='화면 없이 실행 (세션이 이미 저장된 경우)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(name)s] %(levelname)s: %(message)s')
+
+    try:
+        asyncio.run(run_daemon(args.port, args.refresh, args.headless))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+"""
+주간 스냅샷 학습 분석 (선택 기능, pandas/numpy 필요: pip install pandas)
+
+analysis_queries.sql의 리포트를 pandas로 계산합니다.
+SQL은 리포트마다 course_progress_snapshots를 DATE_SUB(..., INTERVAL 7 DAY)로 self-join 하고
+MAX(snapshot_date) 서브쿼리를 반복하지만, 여기서는 스냅샷을 한 번 읽어서
+주간 증가량(weekly_study)을 한 번만 계산한 뒤 모든 리포트를 만듭니다.
+일별 스냅샷(SNAPSHOT_GRANULARITY=daily)은 주마다 마지막 값 하나로 합친 뒤 계산합니다 (to_weekly).
+
+`scrapy study_report --sql`로 같은 DB에서 analysis_queries.sql을 실행하여 시간과 결과를 비교할 수 있습니다.
+사용 방법은 `scrapy study_report -h` 참고.
+"""
+
+import math
+import os
+import re
+import time
+from datetime import date, datetime, timedelta
+
+
+def import_pandas():
+    """pandas/numpy를 불러옴 (설치되어 있지 않으면 설치 방법을 알려주는 ImportError)"""
+    try:
+        import numpy
+        import pandas
+    except ImportError as e:
+        raise ImportError("Study analytics requires pandas: pip install pandas") from e
+    return pandas, numpy
+
+
+SNAPSHOT_FIELDS = ['course_id', 'snapshot_date', 'progress_rate', 'study_time', 'total_lecture_time']
+COURSE_FIELDS = ['course_id', 'course_title', 'progress_rate', 'study_time', 'total_lecture_time']
+
+WEEKLY_GOAL_MINUTES = 180  # 주 3시간 목표 (analysis_queries.sql 6번)
+
+SQL_QUERIES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'analysis_queries.sql')
+
+# 리포트 이름 → (analysis_queries.sql 번호, {SQL 열 이름: 리포트 열 이름}) - 비교할 열만
+SQL_REPORTS = {
+    'current': (1, {'강의명': 'course_title', '현재진도(%)': 'progress_rate',
+                    '현재학습시간(분)': 'study_time', '스냅샷날짜': 'snapshot_date'}),
+    'this_week': (2, {'강의명': 'course_title', '이번주학습(분)': 'weekly_study', '진도증가(%)': 'weekly_progress',
+                      '현재진도(%)': 'progress_rate', '남은시간(분)': 'remaining_time'}),
+    'trend': (3, {'주차': 'snapshot_date', '학습강의수': 'course_count',
+                  '누적학습시간(분)': 'total_study_time', '평균진도(%)': 'avg_progress_rate'}),
+    'weekly_changes': (4, {'주차': 'snapshot_date', '학습한강의수': 'studied_courses',
+                           '주간학습량(분)': 'weekly_study', '평균학습량(분)': 'avg_weekly_study'}),
+    'course_patterns': (5, {'강의명': 'course_title', '기록주차': 'weeks', '주평균학습(분)': 'avg_weekly_study',
+                            '최대주간학습(분)': 'max_weekly_study', '현재진도(%)': 'progress_rate',
+                            '남은시간(분)': 'remaining_time'}),
+    'goal': (6, {'주차': 'snapshot_date', '총학습시간(분)': 'total_study_time', '주목표(분)': 'goal',
+                 '목표달성률(%)': 'goal_rate', '상태': 'status'}),
+    'eta': (7, {'강의명': 'course_title', '현재진도(%)': 'progress_rate', '남은시간(분)': 'remaining_time',
+                '주평균학습(분)': 'avg_weekly_study', '완강예상주차': 'weeks_to_complete',
+                '예상완강일': 'expected_completion'}),
+    'idle': (9, {'강의명': 'course_title', '진도율': 'progress_rate', '남은시간(분)': 'remaining_time',
+                 '마지막학습주차': 'last_snapshot_date'}),
+}
+
+
+def sql_round(values, digits=2):
+    """MySQL ROUND와 같은 반올림 (0.5는 0에서 먼 쪽으로, pandas.round는 짝수 쪽으로 반올림)"""
+    _, np = import_pandas()
+    factor = 10 ** digits
+    return np.sign(values) * np.floor(np.abs(values) * factor + 0.5) / factor
+
+
+def load_from_db(connection):
+    """DB에서 스냅샷과 강의 목록을 읽어 DataFrame으로 반환"""
+    pd, _ = import_pandas()
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(SNAPSHOT_FIELDS)} FROM course_progress_snapshots")
+        snapshots = pd.DataFrame(list(cursor.fetchall()), columns=SNAPSHOT_FIELDS)
+        cursor.execute(f"SELECT {', '.join(COURSE_FIELDS)} FROM courses")
+        courses = pd.DataFrame(list(cursor.fetchall()), columns=COURSE_FIELDS)
+    return normalize(snapshots, courses)
+
+
+def load_from_parquet(export_dir):
+    """scrapy export_parquet으로 내보낸 파일에서 스냅샷과 강의 목록을 읽음"""
+    pd, _ = import_pandas()
+    snapshots = pd.read_parquet(os.path.join(export_dir, 'snapshots'), columns=SNAPSHOT_FIELDS)
+    courses = pd.read_parquet(os.path.join(export_dir, 'courses'), columns=COURSE_FIELDS)
+    return normalize(snapshots, courses)
+
+
+def normalize(snapshots, courses):
+    """DB DECIMAL/NULL 값을 float로, snapshot_date를 datetime64로 맞춤"""
+    pd, _ = import_pandas()
+    snapshots = snapshots.copy()
+    snapshots['snapshot_date'] = pd.to_datetime(snapshots['snapshot_date'])
+    for frame in (snapshots, courses):
+        for column in ('progress_rate', 'study_time', 'total_lecture_time'):
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').astype('float64')
+    return snapshots, courses
+
+
+def to_weekly(snapshots):
+    """일별 스냅샷을 주마다 마지막 값 하나로 합치고 snapshot_date를 그 주 월요일로 맞춤
+
+    리포트는 스냅샷 한 행을 한 주로 계산하므로 일별 행이 그대로 있으면 하루가 한 주로 집계됩니다.
+    downsample_snapshots와 같은 기준이며, 주별(월요일) 스냅샷만 있으면 그대로 반환합니다.
+    """
+    pd, _ = import_pandas()
+    dates = snapshots['snapshot_date']
+    weeks = (dates - pd.to_timedelta(dates.dt.weekday, unit='D')).dt.normalize()
+    if (weeks == dates).all() and not snapshots.duplicated(['course_id', 'snapshot_date']).any():
+        return snapshots
+    weekly = snapshots.assign(snapshot_date=weeks, crawled_date=dates) \
+        .sort_values('crawled_date', kind='stable') \
+        .drop_duplicates(['course_id', 'snapshot_date'], keep='last')
+    return weekly.drop(columns='crawled_date').sort_index()
+
+
+def weekly_study(snapshots):
+    """스냅샷마다 7일 전 스냅샷 대비 증가량 계산 (SQL의 LEFT JOIN prev ... INTERVAL 7 DAY)
+
+    7일 전 스냅샷이 없으면 IFNULL(prev, 0)과 같이 0을 기준으로 계산합니다.
+    """
+    pd, _ = import_pandas()
+    prev = snapshots[['course_id', 'snapshot_date', 'study_time', 'progress_rate']].copy()
+    prev['snapshot_date'] = prev['snapshot_date'] + pd.Timedelta(days=7)
+    prev = prev.rename(columns={'study_time': 'prev_study_time', 'progress_rate': 'prev_progress_rate'})
+
+    weekly = snapshots.merge(prev, on=['course_id', 'snapshot_date'], how='left')
+    weekly['weekly_study'] = weekly['study_time'] - weekly['prev_study_time'].fillna(0)
+    weekly['weekly_progress'] = weekly['progress_rate'] - weekly['prev_progress_rate'].fillna(0)
+    return weekly
+
+
+def build_reports(snapshots, courses, today=None, weekly_goal=WEEKLY_GOAL_MINUTES):
+    """analysis_queries.sql 1~7, 9번 리포트를 한 번에 계산하여 {이름: DataFrame} 반환"""
+    pd, np = import_pandas()
+    today = pd.Timestamp(today or date.today())
+    four_weeks_ago = today - pd.Timedelta(weeks=4)
+    two_weeks_ago = today - pd.Timedelta(weeks=2)
+
+    snapshots = to_weekly(snapshots)
+    weekly = weekly_study(snapshots)
+    titled = weekly.merge(courses[['course_id', 'course_title']], on='course_id', how='inner')
+    latest_date = snapshots['snapshot_date'].max()
+    latest = titled[titled['snapshot_date'] == latest_date]
+    recent = weekly[weekly['snapshot_date'] >= four_weeks_ago]
+    remaining = courses['total_lecture_time'] - courses['study_time']
+
+    reports = {}
+
+    # 1. 이번 주 학습 현황
+    reports['current'] = latest[['course_title', 'progress_rate', 'study_time', 'snapshot_date']] \
+        .sort_values('study_time', ascending=False, kind='stable').reset_index(drop=True)
+
+    # 2. 이번 주 학습량 (지난주 대비)
+    this_week = latest[latest['weekly_study'] > 0].assign(
+        remaining_time=latest['total_lecture_time'] - latest['study_time']
+    )
+    reports['this_week'] = this_week[
+        ['course_title', 'weekly_study', 'weekly_progress', 'progress_rate', 'remaining_time']
+    ].sort_values('weekly_study', ascending=False, kind='stable').reset_index(drop=True)
+
+    # 3. 최근 4주간 전체 학습 추이
+    trend = recent.groupby('snapshot_date').agg(
+        course_count=('course_id', 'nunique'),
+        total_study_time=('study_time', 'sum'),
+        avg_progress_rate=('progress_rate', 'mean'),
+    )
+    trend['avg_progress_rate'] = sql_round(trend['avg_progress_rate'])
+    reports['trend'] = trend.sort_index(ascending=False).reset_index()
+
+    # 4. 최근 4주간 주간 학습량 변화
+    studied = recent['weekly_study'].where(recent['weekly_study'] > 0)
+    changes = recent.assign(studied=studied).groupby('snapshot_date').agg(
+        studied_courses=('studied', 'count'),
+        weekly_study=('weekly_study', 'sum'),
+        avg_weekly_study=('studied', 'mean'),
+    )
+    changes['avg_weekly_study'] = sql_round(changes['avg_weekly_study'])
+    reports['weekly_changes'] = changes.sort_index(ascending=False).reset_index()
+
+    # 5. 강의별 학습 패턴 (전체 기간, 2주 이상 기록)
+    pattern = titled.assign(studied=titled['weekly_study'].where(titled['weekly_study'] > 0)) \
+        .groupby('course_id').agg(
+            weeks=('weekly_study', 'size'),
+            avg_weekly_study=('studied', 'mean'),
+            max_weekly_study=('weekly_study', 'max'),
+        )
+    pattern = pattern[pattern['weeks'] >= 2]
+    pattern = courses.assign(remaining_time=remaining).merge(pattern, left_on='course_id', right_index=True)
+    pattern = pattern.sort_values('avg_weekly_study', ascending=False, kind='stable', na_position='last')
+    pattern['avg_weekly_study'] = sql_round(pattern['avg_weekly_study'])
+    reports['course_patterns'] = pattern[
+        ['course_title', 'weeks', 'avg_weekly_study', 'max_weekly_study', 'progress_rate', 'remaining_time']
+    ].reset_index(drop=True)
+
+    # 6. 학습 목표 대비 달성률
+    total = float(latest['weekly_study'].sum())
+    if total >= weekly_goal:
+        status = '✅ 목표달성'
+    elif total >= weekly_goal * 2 / 3:
+        status = '⚠️ 양호'
+    else:
+        status = '❌ 미달성'
+    reports['goal'] = pd.DataFrame([{
+        'snapshot_date': latest_date,
+        'total_study_time': total,
+        'goal': weekly_goal,
+        'goal_rate': float(sql_round(np.float64(total / weekly_goal * 100))),
+        'status': status,
+    }])
+
+    # 7. 강의별 완강 예상 (최근 4주 평균 기준)
+    avg_recent = recent[recent['weekly_study'] > 0].groupby('course_id')['weekly_study'].mean() \
+        .rename('avg_weekly_study')
+    eta = courses.assign(remaining_time=remaining).merge(avg_recent, left_on='course_id', right_index=True)
+    eta = eta[eta['total_lecture_time'] > eta['study_time']]
+    eta['weeks_to_complete'] = np.ceil(eta['remaining_time'] / eta['avg_weekly_study'])
+    eta['expected_completion'] = [
+        (today + timedelta(weeks=int(weeks))).date() if not math.isnan(weeks) else None
+        for weeks in eta['weeks_to_complete']
+    ]
+    eta = eta.sort_values('weeks_to_complete', kind='stable')
+    eta['avg_weekly_study'] = sql_round(eta['avg_weekly_study'])
+    reports['eta'] = eta[
+        ['course_title', 'progress_rate', 'remaining_time', 'avg_weekly_study',
+         'weeks_to_complete', 'expected_completion']
+    ].reset_index(drop=True)
+
+    # 9. 최근 2주간 학습 안 한 강의
+    last_snapshot = snapshots.groupby('course_id')['snapshot_date'].max().rename('last_snapshot_date')
+    idle = courses.assign(remaining_time=remaining).merge(
+        last_snapshot, left_on='course_id', right_index=True, how='left'
+    )
+    idle = idle[(idle['total_lecture_time'] > idle['study_time'])
+                & (idle['last_snapshot_date'].isna() | (idle['last_snapshot_date'] < two_weeks_ago))]
+    reports['idle'] = idle.sort_values('progress_rate', ascending=False, kind='stable')[
+        ['course_title', 'progress_rate', 'remaining_time', 'last_snapshot_date']
+    ].reset_index(drop=True)
+
+    return reports
+
+
+def sql_queries(path=SQL_QUERIES_PATH):
+    """analysis_queries.sql → {번호: 쿼리} (-- N. 제목 주석으로 나뉜 쿼리)"""
+    queries = {}
+    number = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            header = re.match(r'--\s*(\d+)\.', line)
+            if header:
+                number = int(header.group(1))
+                queries[number] = []
+            elif number is not None and not line.lstrip().startswith('--'):
+                queries[number].append(line)
+    return {number: ''.join(lines).strip().rstrip(';') for number, lines in queries.items()}
+
+
+def run_sql_reports(connection, names=None, path=SQL_QUERIES_PATH):
+    """analysis_queries.sql의 리포트 쿼리 실행 → ({이름: (열 이름, 행)}, {이름: 실행 시간(초)})"""
+    queries = sql_queries(path)
+    results = {}
+    timings = {}
+    with connection.cursor() as cursor:
+        for name in names or SQL_REPORTS:
+            started = time.monotonic()
+            cursor.execute(queries[SQL_REPORTS[name][0]])
+            rows = cursor.fetchall()
+            timings[name] = time.monotonic() - started
+            results[name] = ([column[0] for column in cursor.description], [tuple(row) for row in rows])
+    return results, timings
+
+
+def _comparable(value):
+    """SQL 결과와 DataFrame 값을 같은 형태로 (숫자는 소수 둘째 자리, 날짜는 date, NULL/NaN/NaT는 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime) or hasattr(value, 'to_pydatetime'):
+        return None if value != value else value.date()  # NaT != NaT
+    if isinstance(value, date) or isinstance(value, str):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return None if math.isnan(number) else round(number, 2)
+
+
+def compare_reports(reports, sql_results):
+    """pandas 리포트와 SQL 결과 비교 → 다른 리포트의 설명 목록 (같으면 빈 목록)
+
+    ORDER BY가 같은 값이면 순서가 정해지지 않으므로 행 순서는 무시하고 행 집합으로 비교합니다.
+    """
+    mismatches = []
+    for name, (sql_columns, sql_rows) in sql_results.items():
+        columns = SQL_REPORTS[name][1]
+        indexes = [sql_columns.index(column) for column in columns]
+        expected = sorted((tuple(_comparable(row[i]) for i in indexes) for row in sql_rows), key=repr)
+        frame = reports[name][list(columns.values())]
+        actual = sorted((tuple(_comparable(value) for value in row)
+                         for row in frame.itertuples(index=False, name=None)), key=repr)
+        if actual != expected:
+            only_sql = [row for row in expected if row not in actual]
+            only_pandas = [row for row in actual if row not in expected]
+            mismatches.append(f"{name}: SQL {len(expected)} rows / pandas {len(actual)} rows, "
+                              f"SQL only {only_sql[:3]}, pandas only {only_pandas[:3]}")
+    return mismatches
+
+
+def synthetic_data(course_count=50, years=3, seed=0, today=None):
+    """벤치마크용 가상 데이터 (매주 월요일 스냅샷, 강의마다 학습 시간이 조금씩 증가)"""
+    pd, np = import_pandas()
+    rng = np.random.default_rng(seed)
+    today = today or date.today()
+    last_monday = today - timedelta(days=today.weekday())
+    weeks = years * 52
+    dates = pd.date_range(end=pd.Timestamp(last_monday), periods=weeks, freq='7D')
+
+    course_ids = np.arange(1, course_count + 1)
+    total_time = rng.uniform(600, 3000, course_count).round(2)
+    increments = rng.exponential(30, (weeks, course_count)) * (rng.random((weeks, course_count)) < 0.4)
+    study_time = np.minimum(np.cumsum(increments, axis=0), total_time).round(2)
+
+    snapshots = pd.DataFrame({
+        'course_id': np.tile(course_ids, weeks),
+        'snapshot_date': np.repeat(dates.values, course_count),
+        'progress_rate': (study_time / total_time * 100).round(2).ravel(),
+        'study_time': study_time.ravel(),
+        'total_lecture_time': np.tile(total_time, weeks),
+    })
+    courses = pd.DataFrame({
+        'course_id': course_ids,
+        'course_title': [f'Course {course_id}' for course_id in course_ids],
+        'progress_rate': (study_time[-1] / total_time * 100).round(2),
+        'study_time': study_time[-1],
+        'total_lecture_time': total_time,
+    })
+    return snapshots, courses
@@ -0,0 +1,214 @@
+"""
+브라우저 프로세스 관련 유틸리티
+
+상주 브라우저 데몬(browser_daemon.py)과 spider가 공유하는 세션 저장/메모리 측정 함수 모음
+"""
+
+import json
+import os
+import subprocess
+import time
+
+from course_scraper.metrics import observe
+
+
+def process_tree_rss_mb(root_pid=None, include_root=True):
+    """root_pid와 모든 자식 프로세스의 RSS 합계(MB)
+
+    Chromium은 renderer/GPU 프로세스를 따로 띄우므로 프로세스 트리 전체를 합산합니다.
+    include_root가 False면 root_pid 자신(Scrapy의 Python 프로세스)은 빼고 자식만 합산합니다.
+    ps 명령 기반이라 Linux/macOS에서 동작하며, 측정 실패 시 None을 반환합니다.
+    """
+    root_pid = root_pid or os.getpid()
+    try:
+        output = subprocess.run(
+            ['ps', '-A', '-o', 'pid=,ppid=,rss='],
+            capture_output=True, text=True, check=True
+        ).stdout
+    except Exception:
+        return None
+
+    children = {}
+    rss = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        pid, ppid, rss_kb = (int(p) for p in parts)
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = rss_kb
+
+    total_kb = 0
+    stack = [root_pid] if include_root else list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        total_kb += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return round(total_kb / 1024, 1)
+
+
+def has_valid_storage_state(path):
+    """저장된 로그인 세션에 만료되지 않은 fastcampus.co.kr 쿠키가 있는지 확인
+
+    실제 세션 유효성은 페이지 이동 시 확인하며, 여기서는 브라우저를 띄우기 전에
+    headless 여부를 결정할 수 있을 정도로만 가볍게 판단합니다.
+    """
+    if not path or not os.path.exists(path):
+        return False
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except Exception:
+        return False
+
+    now = time.time()
+    for cookie in state.get('cookies', []):
+        if 'fastcampus.co.kr' not in cookie.get('domain', ''):
+            continue
+        # expires == -1 은 세션 쿠키
+        if cookie.get('expires', -1) == -1 or cookie['expires'] > now:
+            return True
+    return False
+
+
+def apply_stored_session(settings):
+    """저장된 로그인 세션으로 headless 여부와 컨텍스트의 storage_state를 정함
+
+    세션 파일을 읽어야 하므로 settings.py가 아니라 브라우저를 쓰는 spider가 시작될 때
+    (FastCampusBaseSpider.update_settings) 호출합니다.
+    - BROWSER_HEADLESS=auto: 유효한 세션이 있으면 headless, 없으면 2단계 인증을 위해 브라우저 표시
+    - 유효한 세션이 있으면 PLAYWRIGHT_CONTEXTS의 default 컨텍스트가 그 세션으로 시작
+    """
+    path = settings.get('BROWSER_STORAGE_STATE')
+    session_valid = has_valid_storage_state(path)
+
+    launch_options = settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS')
+    if 'headless' not in launch_options:
+        policy = settings.get('BROWSER_HEADLESS', 'auto').lower()
+        launch_options['headless'] = session_valid if policy == 'auto' else policy == 'true'
+        settings.set('PLAYWRIGHT_LAUNCH_OPTIONS', launch_options,
+                     priority=settings.getpriority('PLAYWRIGHT_LAUNCH_OPTIONS'))
+
+    if session_valid:
+        # settings 모듈의 dict를 바꾸지 않도록 컨텍스트별로 복사
+        contexts = {name: dict(kwargs) for name, kwargs in settings.getdict('PLAYWRIGHT_CONTEXTS').items()}
+        contexts.setdefault('default', {}).setdefault('storage_state', path)
+        settings.set('PLAYWRIGHT_CONTEXTS', contexts, priority=settings.getpriority('PLAYWRIGHT_CONTEXTS'))
+
+
+async def save_storage_state(context, path):
+    """브라우저 컨텍스트의 쿠키/로컬스토리지를 파일로 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return await context.storage_state(path=path)
+
+
+class PagePool:
+    """코스 요청 간 탭(page)을 재사용하는 풀
+
+    size개의 요청 체인이 각자 탭 하나를 계속 재사용하며 다음 강의로 이동합니다.
+    (scrapy-playwright는 meta['playwright_page']로 기존 탭을 넘기면 새 탭을 만들지 않음)
+    탭은 max_uses번 사용했거나 JS 힙이 max_heap_mb를 넘으면 닫고 새로 만듭니다.
+    draining이 True인 동안(컨텍스트 교체 대기 중)에는 반납되는 탭을 모두 닫습니다.
+    """
+
+    def __init__(self, size=2, max_uses=20, max_heap_mb=300, stats=None):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+        self.stats = stats
+        self.uses = {}
+        self.navigation_times = []
+        self.draining = False
+
+    @classmethod
+    def from_settings(cls, settings, stats=None):
+        return cls(
+            # 요청 체인 수 = 탭 수이므로 따로 정하지 않으면 도메인당 동시 요청 수에 맞춤
+            size=settings.getint('PAGE_POOL_SIZE') or settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN', 2),
+            max_uses=settings.getint('PAGE_POOL_MAX_USES', 20),
+            max_heap_mb=settings.getfloat('PAGE_POOL_MAX_HEAP_MB', 300),
+            stats=stats,
+        )
+
+    def _inc(self, key, count=1):
+        if self.stats:
+            self.stats.inc_value(f'page_pool/{key}', count)
+
+    def meta(self, page=None):
+        """다음 요청의 meta - page가 있으면 해당 탭을 재사용"""
+        meta = {
+            'playwright': True,
+            'playwright_include_page': True,
+        }
+        if page is not None:
+            meta['playwright_page'] = page
+        return meta
+
+    def acquire(self, response):
+        """응답에 연결된 탭을 가져오고 사용 횟수와 네비게이션 시간을 기록"""
+        page = response.meta.get('playwright_page')
+        if page is not None:
+            self.track(page, response.meta.get('download_latency'))
+        return page
+
+    def track(self, page, latency=None):
+        """탭으로 강의 하나를 열었음을 기록"""
+        key = id(page)
+        if key not in self.uses:
+            self.uses[key] = 0
+            self._inc('pages_created')
+        else:
+            self._inc('pages_reused')
+        self.uses[key] += 1
+
+        if latency is not None:
+            self.navigation_times.append(latency)
+            observe(self.stats, 'navigation_seconds', latency)
+
+    async def release(self, page):
+        """탭 반납 - 재사용 가능하면 page를, 닫았으면 None을 반환"""
+        if page is None or page.is_closed():
+            return None
+
+        key = id(page)
+        recycle = self.draining or self.uses.get(key, 0) >= self.max_uses
+        if not recycle and self.max_heap_mb:
+            try:
+                heap_bytes = await page.evaluate(
+                    '() => performance.memory ? performance.memory.usedJSHeapSize : 0'
+                )
+                recycle = heap_bytes / (1024 * 1024) > self.max_heap_mb
+            except Exception:
+                recycle = True
+
+        if recycle:
+            self.uses.pop(key, None)
+            self._inc('pages_recycled')
+            await page.close()
+            return None
+        return page
+
+    async def discard(self, page):
+        """오류가 난 탭은 재사용하지 않고 닫기"""
+        if page is None:
+            return
+        self.uses.pop(id(page), None)
+        if not page.is_closed():
+            await page.close()
+
+    def log_summary(self, logger):
+        times = sorted(self.navigation_times)
+        if not times:
+            return
+        avg = sum(times) / len(times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        logger.info(
+            f"Page pool: created={self.stats.get_value('page_pool/pages_created', 0) if self.stats else '-'}, "
+            f"navigations={len(times)}, avg={avg:.2f}s, p95={p95:.2f}s, max={times[-1]:.2f}s"
+        )
+        if self.stats:
+            self.stats.set_value('page_pool/navigation_time_avg', round(avg, 3))
+            self.stats.set_value('page_pool/navigation_time_p95', round(p95, 3))
+            self.stats.set_value('page_pool/navigation_time_max', round(times[-1], 3))
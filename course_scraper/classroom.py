@@ -0,0 +1,143 @@
+"""
+FastCampus 강의실 사이드바 커리큘럼 추출
+
+모든 FastCampus spider가 FastCampusBaseSpider를 통해 같은 추출 경로를 사용합니다.
+아코디언을 모두 펼친 뒤 섹션(Part)마다 evaluate 한 번으로 제목/챕터/강의/완료 여부를 가져오므로
+강의마다 query_selector / inner_text / get_attribute를 여러 번 호출하지 않습니다.
+섹션 / 아코디언 단위 로그는 DEBUG로만 남기고, 강의 단위 요약은 spider가 INFO로 남깁니다.
+"""
+
+SECTION_SELECTOR = '.classroom-sidebar-clip__chapter'
+HEADER_SELECTOR = '.common-accordion-menu__header'
+
+# 아코디언 헤더 상태: 화살표 아이콘이 없으면 null, 있으면 열림 여부
+HEADER_STATE_JS = '''
+(header) => {
+    const icon = header.querySelector('.common-accordion-menu__header__arrow-icon');
+    const menu = header.closest('.common-accordion-menu');
+    if (!icon || !menu) return null;
+    return menu.classList.contains('common-accordion-menu--open');
+}
+'''
+
+# 섹션 하나의 제목, 완료/전체 강의 수, 챕터별(없으면 섹션 바로 아래) 강의 목록
+SECTION_JS = '''
+(section) => {
+    const text = (el) => (el ? el.innerText.trim() : '');
+    const count = (selector) => parseInt(text(section.querySelector(selector)), 10) || 0;
+    const lesson = (clip, idx) => ({
+        title: text(clip.querySelector('.classroom-sidebar-clip__chapter__clip__title')) || `Lecture ${idx + 1}`,
+        duration: text(clip.querySelector('.classroom-sidebar-clip__chapter__clip__time')),
+        is_completed: clip.classList.contains('classroom-sidebar-clip__chapter__clip--complete'),
+    });
+    const clips = (root) => Array.from(root.querySelectorAll('.classroom-sidebar-clip__chapter__clip')).map(lesson);
+
+    const chapters = Array.from(section.querySelectorAll('.classroom-sidebar-clip__chapter__part__title'))
+        .map((title, idx) => {
+            const part = title.closest('.classroom-sidebar-clip__chapter__part');
+            return {
+                chapter_number: idx + 1,
+                chapter_title: text(title) || `Chapter ${idx + 1}`,
+                lessons: part ? clips(part) : [],
+            };
+        });
+
+    return {
+        title: text(section.querySelector('.classroom-sidebar-clip__chapter__title__text')),
+        complete_count: count('.classroom-sidebar-clip__chapter__title__number__complete'),
+        total_count: count('.classroom-sidebar-clip__chapter__title__number__total'),
+        chapters: chapters,
+        lessons: chapters.length ? [] : clips(section),
+    };
+}
+'''
+
+
+async def open_closed_headers(page, logger, scroll_wait=300, click_wait=800, retry=True):
+    """닫혀 있는 아코디언 헤더를 클릭하여 펼치고 새로 연 개수를 반환"""
+    opened_count = 0
+    headers = await page.query_selector_all(HEADER_SELECTOR)
+    logger.debug("Found %d accordion headers", len(headers))
+
+    for idx, header in enumerate(headers, 1):
+        try:
+            is_open = await header.evaluate(HEADER_STATE_JS)
+            if is_open is None or is_open:
+                continue
+
+            # 화면에 보이도록 스크롤 후 클릭 (애니메이션 대기)
+            await header.scroll_into_view_if_needed()
+            await page.wait_for_timeout(scroll_wait)
+            await header.click()
+            await page.wait_for_timeout(click_wait)
+
+            if retry and not await header.evaluate(HEADER_STATE_JS):
+                # 재시도
+                await page.wait_for_timeout(scroll_wait)
+                await header.click()
+                await page.wait_for_timeout(click_wait)
+            opened_count += 1
+
+        except Exception as e:
+            logger.warning("  Error opening header %d: %.100s", idx, e)
+            continue
+
+    return opened_count
+
+
+async def expand_curriculum(page, logger):
+    """커리큘럼 사이드바가 로드되면 모든 nested 아코디언 섹션 펼치기 (새로 연 섹션 수 반환)"""
+    await page.wait_for_selector(SECTION_SELECTOR, timeout=10000)
+    await page.wait_for_timeout(2000)
+
+    opened_count = await open_closed_headers(page, logger)
+    logger.debug("Opened %d accordion sections", opened_count)
+
+    # 섹션을 펼치면서 새로 나타난 헤더가 있을 수 있으므로 한 번 더 확인
+    await page.wait_for_timeout(2000)
+    additional_opened = await open_closed_headers(page, logger, scroll_wait=200, click_wait=600, retry=False)
+    if additional_opened > 0:
+        logger.debug("Opened %d additional sections on second pass", additional_opened)
+
+    # 모든 섹션이 열린 후 충분히 대기
+    await page.wait_for_timeout(3000)
+    return opened_count + additional_opened
+
+
+async def extract_sections(page, logger):
+    """펼쳐진 커리큘럼에서 섹션을 하나씩 추출 (async generator)
+
+    섹션 하나를 파싱할 때마다 바로 yield하여 파이프라인 저장이 나머지 섹션 추출과 겹쳐 진행되고,
+    큰 강의도 메모리에 전체 목차를 쌓지 않습니다. 강의가 없는 섹션/챕터는 건너뜁니다.
+    """
+    section_elements = await page.query_selector_all(SECTION_SELECTOR)
+
+    for section_idx, section_elem in enumerate(section_elements, 1):
+        try:
+            section = await section_elem.evaluate(SECTION_JS)
+        except Exception as e:
+            logger.warning("  Error parsing section %d: %s", section_idx, e)
+            continue
+
+        section_title = section['title'] or f'Section {section_idx}'
+        chapters = [chapter for chapter in section['chapters'] if chapter['lessons']]
+
+        if section['chapters']:
+            logger.debug("  Section %d: %s (has %d chapters)", section_idx, section_title, len(section['chapters']))
+            if not chapters:
+                continue
+        elif section['lessons']:
+            logger.debug("  Section %d: %s (%d/%d) - %d lectures", section_idx, section_title,
+                         section['complete_count'], section['total_count'], len(section['lessons']))
+        else:
+            logger.warning("  No lectures found in section %d", section_idx)
+            continue
+
+        yield {
+            'section': section_title,
+            'section_number': section_idx,
+            'chapters': chapters or None,  # 챕터가 없으면 섹션 바로 아래 강의
+            'lessons': section['lessons'],
+            'complete_count': section['complete_count'],
+            'total_count': section['total_count'],
+        }
@@ -0,0 +1 @@
+# 커스텀 scrapy 명령 (settings.py의 COMMANDS_MODULE)
@@ -0,0 +1,56 @@
+"""
+기존 lectures.completed_at 데이터로 완료 집계 테이블 다시 만들기
+
+사용 방법:
+    scrapy backfill_rollups
+
+add_completion_rollup_tables.sql 적용 직후 한 번 실행합니다.
+집계가 lectures와 어긋났다고 의심될 때 다시 실행해도 됩니다 (전체를 지우고 새로 계산).
+"""
+
+from scrapy.commands import ScrapyCommand
+
+from course_scraper.db import ConnectionPool
+
+BACKFILL_SQL = {
+    'lecture_completion_daily': """
+        INSERT INTO lecture_completion_daily (completion_date, course_id, completed_count, completed_minutes)
+        SELECT DATE(completed_at), course_id, COUNT(*), COALESCE(SUM(lecture_time), 0)
+        FROM lectures
+        WHERE completed_at IS NOT NULL
+        GROUP BY DATE(completed_at), course_id
+    """,
+    'lecture_completion_weekly': """
+        INSERT INTO lecture_completion_weekly (week_start, course_id, completed_count, completed_minutes)
+        SELECT DATE_SUB(DATE(completed_at), INTERVAL WEEKDAY(completed_at) DAY), course_id,
+               COUNT(*), COALESCE(SUM(lecture_time), 0)
+        FROM lectures
+        WHERE completed_at IS NOT NULL
+        GROUP BY DATE_SUB(DATE(completed_at), INTERVAL WEEKDAY(completed_at) DAY), course_id
+    """,
+}
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_LEVEL": "WARNING"}
+
+    def short_desc(self):
+        return "Rebuild lecture completion rollup tables from lectures"
+
+    def run(self, args, opts):
+        connection = ConnectionPool.from_settings(self.settings).connect()
+        try:
+            with connection.cursor() as cursor:
+                # 한 트랜잭션으로 지우고 다시 채움 (중간에 실패하면 기존 집계 유지)
+                for table, sql in BACKFILL_SQL.items():
+                    cursor.execute(f"DELETE FROM {table}")
+                    cursor.execute(sql)
+                    print(f"✓ {table}: {cursor.rowcount} rows")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
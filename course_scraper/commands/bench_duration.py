@@ -0,0 +1,101 @@
+"""
+강의 시간 파싱 비용 측정
+
+사용 방법:
+    scrapy bench_duration
+    scrapy bench_duration --lectures 200000
+
+같은 수의 가상 강의 시간 문자열(클립 시간이 반복되는 실제 분포와 비슷하게)에 대해 아래 방식을 비교합니다.
+- regex: 호출마다 re를 import하고 패턴 세 개로 검색 (통합 전 spider들의 방식)
+- parse_duration: 공용 파서 (MM:SS / H:MM:SS / N시간 M분 빠른 경로 + LRU 캐시)
+- uncached: 공용 파서에서 LRU 캐시만 뺀 경우
+"""
+
+import random
+import time
+
+from scrapy.commands import ScrapyCommand
+
+from course_scraper import duration
+from course_scraper.duration import parse_duration
+
+
+def regex_parse_duration(duration_str):
+    import re
+
+    if not duration_str:
+        return 0
+    match = re.search(r'^(\d+):(\d+):(\d+)$', duration_str)
+    if match:
+        hours, minutes, seconds = (int(g) for g in match.groups())
+        return round(hours * 60 + minutes + round(seconds / 60, 2), 2)
+    match = re.search(r'^(\d+):(\d+)$', duration_str)
+    if match:
+        minutes, seconds = (int(g) for g in match.groups())
+        return round(minutes + round(seconds / 60, 2), 2)
+    total_minutes = 0
+    hours_match = re.search(r'(\d+)\s*시간', duration_str)
+    if hours_match:
+        total_minutes += int(hours_match.group(1)) * 60
+    minutes_match = re.search(r'(\d+)\s*분', duration_str)
+    if minutes_match:
+        total_minutes += int(minutes_match.group(1))
+    return total_minutes
+
+
+def uncached_parse_duration(duration_str):
+    if not duration_str:
+        return 0
+    return duration._parse_duration.__wrapped__(duration_str.strip())
+
+
+def sample_durations(count, seed=0):
+    """클립 시간 대부분은 몇 백 가지 값이 반복되고, 일부는 H:MM:SS / N시간 M분 형식"""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.85:
+            values.append(f'{rng.randrange(1, 30)}:{rng.randrange(0, 60):02d}')
+        elif kind < 0.95:
+            values.append(f'{rng.randrange(0, 3)}:{rng.randrange(0, 60):02d}:{rng.randrange(0, 60):02d}')
+        else:
+            values.append(f'{rng.randrange(0, 5)}시간 {rng.randrange(0, 60)}분')
+    return values
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_ENABLED": False}
+
+    def short_desc(self):
+        return "Measure lecture duration parsing cost (regex vs shared memoized parser)"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--lectures", type=int, default=100000, help="number of sample durations (default: 100000)")
+
+    def run(self, args, opts):
+        values = sample_durations(opts.lectures)
+
+        results = {}
+        for name, func in (
+            ('regex', regex_parse_duration),
+            ('parse_duration', parse_duration),
+            ('uncached', uncached_parse_duration),
+        ):
+            duration._parse_duration.cache_clear()
+            started = time.perf_counter()
+            results[name] = [func(value) for value in values]
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"{name:<15} {opts.lectures} durations: {elapsed_ms:8.1f}ms "
+                  f"({elapsed_ms * 1000 / opts.lectures:.2f}us each)")
+            if func is parse_duration:
+                info = duration._parse_duration.cache_info()
+                print(f"{'':<15} LRU cache: {info.hits} hits, {info.currsize} distinct values")
+
+        mismatches = sum(a != b for a, b in zip(results['regex'], results['parse_duration']))
+        if mismatches:
+            print(f"✗ {mismatches} results differ from the regex implementation")
+            self.exitcode = 1
@@ -0,0 +1,78 @@
+"""
+강의 단위 로그 비용 측정
+
+사용 방법:
+    scrapy bench_logging
+    scrapy bench_logging --lectures 20000
+
+같은 수의 가상 강의에 대해 아래 방식의 로그 시간을 비교합니다 (출력은 os.devnull).
+- eager: 강의마다 f-string으로 INFO 로그 (이전 방식)
+- sampled: LogSampler로 LOG_ITEM_SAMPLE_EVERY개마다 DEBUG 로그 (% 지연 포맷팅) + 강의 요약 한 줄
+- sampled_json: sampled와 같고 LOG_JSON 형식으로 출력
+"""
+
+import logging
+import os
+import time
+
+from scrapy.commands import ScrapyCommand
+
+from course_scraper.logs import JsonFormatter, LogSampler
+
+LECTURES_PER_COURSE = 200
+
+
+def eager(logger, lectures, sample_every):
+    for idx, title in enumerate(lectures, 1):
+        logger.info(f"  Lecture {idx}: {title} (12.5 min, completed=True)")
+        logger.info(f"✓ Lecture completed: {title}")
+
+
+def sampled(logger, lectures, sample_every):
+    sampler = LogSampler(sample_every)
+    for idx, title in enumerate(lectures, 1):
+        if sampler():
+            logger.debug("  Lecture %d: %s (%s min, completed=%s)", idx, title, 12.5, True)
+        if idx % LECTURES_PER_COURSE == 0:
+            summary = {'course_id': idx // LECTURES_PER_COURSE, 'lectures': LECTURES_PER_COURSE}
+            logger.info("✓ Course %s: %d lectures", summary['course_id'], LECTURES_PER_COURSE,
+                        extra={'summary': summary})
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_ENABLED": False}
+
+    def short_desc(self):
+        return "Measure per-lecture logging overhead (eager vs sampled)"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--lectures", type=int, default=10000, help="number of sample lectures (default: 10000)")
+
+    def run(self, args, opts):
+        lectures = [f'Lecture title {idx}' for idx in range(opts.lectures)]
+        sample_every = self.settings.getint('LOG_ITEM_SAMPLE_EVERY', 100)
+        text_formatter = logging.Formatter(self.settings.get('LOG_FORMAT'), self.settings.get('LOG_DATEFORMAT'))
+
+        logger = logging.getLogger('bench_logging')
+        logger.propagate = False
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            handler = logging.StreamHandler(devnull)
+            logger.addHandler(handler)
+
+            for level in ('DEBUG', 'INFO'):
+                logger.setLevel(level)
+                for name, func, formatter in (
+                    ('eager', eager, text_formatter),
+                    ('sampled', sampled, text_formatter),
+                    ('sampled_json', sampled, JsonFormatter()),
+                ):
+                    handler.setFormatter(formatter)
+                    started = time.perf_counter()
+                    func(logger, lectures, sample_every)
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    print(f"LOG_LEVEL={level:<5} {name:<12} {opts.lectures} lectures: {elapsed_ms:8.1f}ms")
+
+            logger.removeHandler(handler)
@@ -0,0 +1,219 @@
+"""
+FastCampus spider들이 모두 같은 크롤링 경로(FastCampusBaseSpider)를 사용하는지 확인하고 강의 하나의 처리 시간을 측정
+
+사용 방법:
+    scrapy check_fast_path
+    scrapy check_fast_path --lectures 5000
+
+1. 강의 요청/파싱/커리큘럼 추출/아이템 생성/에러 처리 메서드를 spider가 재정의했는지 검사
+2. 강의 요청 하나가 실제로 거치는 경로를 spider별로 측정
+   - parse_course(): 진도 요약/아코디언/섹션 evaluate 결과를 돌려주는 가짜 Playwright 탭에서 추출
+   - MySQLPipeline.save_item(): 나온 아이템을 모두 가짜 커서로 저장 (SQL 생성/이벤트/스냅샷 포함, 아이템마다 커밋)
+
+재정의한 spider가 있으면 종료 코드 1을 반환합니다.
+브라우저/로그인/MySQL 없이 실행되므로 페이지 로딩, 아코디언 대기, DB 왕복 시간은 포함되지 않고
+spider별 후처리(inspect_page: 스크린샷 등)도 건너뜁니다. Python 쪽 처리 시간이 느려졌는지 확인하는 용도입니다.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from scrapy.commands import ScrapyCommand
+from scrapy.spiderloader import get_spider_loader
+from scrapy.statscollectors import MemoryStatsCollector
+
+from course_scraper.classroom import HEADER_SELECTOR, SECTION_SELECTOR
+from course_scraper.logs import LogSampler
+from course_scraper.pipelines import MySQLPipeline
+from course_scraper.spiders.fastcampus_base import FastCampusBaseSpider
+
+# 모든 spider가 공유해야 하는 메서드
+HOT_PATH = (
+    'login',
+    'next_course_request',
+    'course_request',
+    'parse',
+    'parse_course',
+    'extract_course_title',
+    'extract_curriculum_playwright',
+    'lecture_items',
+    'errback',
+)
+
+SAMPLE_URL = 'https://fastcampus.co.kr/classroom/214390'
+SAMPLE_TITLE = '패스트캠퍼스 온라인 강의 - Sample Course For Fast Path Check'
+SAMPLE_SUMMARY = '수강률 50.0% 수강시간 12:34:56 강의시간 420:00:00'
+
+
+def sample_sections(lecture_count, lessons_per_chapter=10, chapters_per_section=3):
+    """SECTION_JS evaluate 결과와 같은 형태의 가상 섹션 목록"""
+    sections = []
+    lessons_per_section = lessons_per_chapter * chapters_per_section
+    for section_idx in range(1, lecture_count // lessons_per_section + 2):
+        chapters = []
+        for chapter_idx in range(1, chapters_per_section + 1):
+            lessons = [
+                {'title': f'Lecture {idx}', 'duration': '12:34', 'is_completed': idx % 2 == 0}
+                for idx in range(1, lessons_per_chapter + 1)
+            ]
+            chapters.append({'chapter_number': chapter_idx, 'chapter_title': f'Chapter {chapter_idx}', 'lessons': lessons})
+        sections.append({
+            'title': f'Section {section_idx}',
+            'complete_count': lessons_per_section // 2,
+            'total_count': lessons_per_section,
+            'chapters': chapters,
+            'lessons': [],
+        })
+    return sections
+
+
+class StubElement:
+    def __init__(self, result):
+        self.result = result
+
+    async def evaluate(self, script):
+        return self.result
+
+
+class StubPage:
+    """강의실 탭 대신 정해진 evaluate 결과를 돌려주는 가짜 Playwright 탭 (아코디언은 모두 열린 상태)"""
+
+    def __init__(self, sections):
+        self.sections = [StubElement(section) for section in sections]
+
+    async def title(self):
+        return SAMPLE_TITLE
+
+    async def evaluate(self, script):
+        return SAMPLE_SUMMARY
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return None
+
+    async def wait_for_timeout(self, timeout):
+        return None
+
+    async def query_selector(self, selector):
+        return None
+
+    async def query_selector_all(self, selector):
+        if selector == SECTION_SELECTOR:
+            return self.sections
+        if selector == HEADER_SELECTOR:
+            return [StubElement(True)] * len(self.sections)
+        return []
+
+
+class StubCursor:
+    """쿼리를 보내지 않는 커서 (SELECT는 항상 빈 결과라 모든 강의를 새로 INSERT하는 경로를 탐)"""
+
+    def __init__(self):
+        self.lastrowid = 0
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.lastrowid += 1
+        return 0
+
+    def executemany(self, sql, seq):
+        for params in seq:
+            self.execute(sql, params)
+        return 0
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+
+class StubConnection:
+    def cursor(self, *args):
+        return StubCursor()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class StubPool:
+    def acquire(self):
+        return StubConnection()
+
+    def release(self, connection, discard=False):
+        pass
+
+    def close(self):
+        pass
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    # credentials.py 등이 없어 import에 실패하는 spider는 경고만 출력
+    default_settings = {"LOG_LEVEL": "WARNING", "SPIDER_LOADER_WARN_ONLY": True}
+
+    def short_desc(self):
+        return "Check that every FastCampus spider runs the shared crawl path and time it"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--lectures", type=int, default=2000, help="lectures in the sample curriculum (default: 2000)")
+
+    def run(self, args, opts):
+        spider_loader = get_spider_loader(self.settings)
+        spiders = [
+            spider_loader.load(name) for name in sorted(spider_loader.list())
+            if issubclass(spider_loader.load(name), FastCampusBaseSpider)
+        ]
+        if not spiders:
+            print("✗ No FastCampus spiders found")
+            self.exitcode = 1
+            return
+
+        sections = sample_sections(opts.lectures)
+        for spidercls in spiders:
+            overridden = [
+                method for method in HOT_PATH
+                if getattr(spidercls, method) is not getattr(FastCampusBaseSpider, method)
+            ]
+
+            items, parse_ms, save_ms = asyncio.run(self.time_course(spidercls, sections))
+            total_ms = parse_ms + save_ms
+            status = "✗" if overridden else "✓"
+            print(f"{status} {spidercls.name}: {items} items in {total_ms:.1f}ms"
+                  f" (parse {parse_ms:.1f}ms + save {save_ms:.1f}ms, {items / max(total_ms, 0.001) * 1000:.0f} items/s)")
+            if overridden:
+                print(f"    overrides: {', '.join(overridden)}")
+                self.exitcode = 1
+
+    async def time_course(self, spidercls, sections):
+        """가짜 탭의 강의 하나를 parse_course → save_item으로 처리하고 (아이템 수, 파싱 ms, 저장 ms) 반환"""
+        spider = spidercls()
+        spider.settings = self.settings
+        spider.crawler = SimpleNamespace(stats=MemoryStatsCollector(SimpleNamespace(settings=self.settings)))
+        spider.log_sampler = LogSampler.from_settings(self.settings)
+
+        async def skip_inspect(page, course_id):
+            pass
+
+        spider.inspect_page = skip_inspect
+
+        pipeline = MySQLPipeline.from_settings(self.settings, StubPool())
+        pipeline.connect()
+
+        items = 0
+        save_seconds = 0.0
+        started = time.perf_counter()
+        async for item in spider.parse_course(StubPage(sections), SAMPLE_URL):
+            save_started = time.perf_counter()
+            pipeline.save_item(item)
+            save_seconds += time.perf_counter() - save_started
+            items += 1
+        pipeline.close_spider(spider)
+
+        elapsed = time.perf_counter() - started
+        return items, (elapsed - save_seconds) * 1000, save_seconds * 1000
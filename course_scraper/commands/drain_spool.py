@@ -0,0 +1,103 @@
+"""
+스풀 파일(.spool/*.jsonl)의 아이템을 MySQL에 일괄 저장
+
+사용 방법:
+    scrapy drain_spool              # 모든 스풀 파일 저장 후 삭제
+    scrapy drain_spool --dry-run    # 저장하지 않고 아이템 수만 확인
+    scrapy drain_spool --keep       # 저장 후에도 파일 유지 (.done 기록도 남으므로 다시 실행해도 중복 저장하지 않음)
+
+스풀 파일은 만든 시각 순(오래된 크롤링 먼저)으로 저장합니다.
+"""
+
+import logging
+import os
+import time
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from course_scraper.db import ConnectionPool
+from course_scraper.pipelines import MySQLPipeline
+from course_scraper.spool import read_progress, read_spool, remove_spool, spool_files, write_progress
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_LEVEL": "WARNING"}
+
+    def syntax(self):
+        return "[options] [spool_file ...]"
+
+    def short_desc(self):
+        return "Load spooled items into MySQL"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 아이템 수만 출력")
+        parser.add_argument("--keep", action="store_true", help="저장 후 스풀 파일을 삭제하지 않음")
+
+    def run(self, args, opts):
+        spool_dir = self.settings.get('MYSQL_SPOOL_DIR')
+        paths = args or spool_files(spool_dir)
+        missing = [path for path in paths if not os.path.exists(path)]
+        if missing:
+            raise UsageError(f"Spool file not found: {', '.join(missing)}")
+        if not paths:
+            print(f"스풀 파일이 없습니다: {spool_dir}")
+            return
+
+        if opts.dry_run:
+            for path in paths:
+                count = sum(1 for _ in read_spool(path))
+                print(f"{path}: {count} items ({read_progress(path)} already saved)")
+            return
+
+        batch_size = self.settings.getint('MYSQL_SPOOL_BATCH_SIZE', 500)
+        pool = ConnectionPool.from_settings(self.settings)
+        pipeline = MySQLPipeline.from_settings(self.settings, pool)
+        pipeline.connect()
+
+        try:
+            for path in paths:
+                if not self.drain_file(pipeline, path, batch_size):
+                    self.exitcode = 1
+                    break
+                if not opts.keep:
+                    remove_spool(path)
+        finally:
+            pool.release(pipeline.connection)
+            pool.close()
+
+    def drain_file(self, pipeline, path, batch_size):
+        """스풀 파일 하나를 batch_size개씩 커밋하며 저장. 실패하면 False
+
+        커밋할 때마다 커밋한 아이템 수를 <파일>.done에 기록하고, 다시 실행하면 그만큼 건너뜁니다.
+        (crawl_logs / lecture_events는 INSERT라 같은 아이템을 다시 저장하면 행이 중복됨)
+        """
+        started = time.monotonic()
+        skip = read_progress(path)
+        committed = skip
+        count = 0
+        try:
+            for index, (item, crawled_at) in enumerate(read_spool(path)):
+                if index < skip:
+                    continue
+                pipeline.save_item(item, crawled_at, commit=False)
+                count += 1
+                if count % batch_size == 0:
+                    pipeline.commit()
+                    committed = skip + count
+                    write_progress(path, committed)
+            pipeline.commit()
+            write_progress(path, skip + count)
+        except Exception as e:
+            pipeline.rollback()
+            logging.error(f"Failed to drain {path} at item {skip + count + 1}: {e}")
+            print(f"✗ {path}: {committed}개까지 저장 후 실패 - {e}")
+            print(f"  다시 실행하면 저장한 {committed}개는 건너뛰고 이어서 저장합니다")
+            return False
+
+        elapsed = time.monotonic() - started
+        print(f"✓ {path}: {count} items ({elapsed:.1f}s, {count / elapsed if elapsed else 0:.0f} items/s)")
+        return True
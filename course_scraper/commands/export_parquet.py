@@ -0,0 +1,92 @@
+"""
+DB 테이블을 Parquet 파일로 내보내기 (pyarrow 필요)
+
+사용 방법:
+    scrapy export_parquet                          # course_progress_snapshots → exports/snapshots/year=YYYY/
+    scrapy export_parquet --table courses          # courses → exports/courses/
+    scrapy export_parquet --output /data/fastcampus
+
+DB에서 batch 단위로 읽어서 바로 기록하므로 스냅샷이 많아도 메모리에 전체를 올리지 않습니다.
+"""
+
+import os
+import shutil
+
+import pymysql
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from course_scraper.db import ConnectionPool
+from course_scraper.exporters import (
+    COURSE_COLUMNS, SNAPSHOT_COLUMNS, arrow_schema, convert_value, import_pyarrow, parquet_writer,
+)
+
+# --table 이름 → (DB 테이블, 컬럼, 연도별 파티션 기준 컬럼)
+TABLES = {
+    'snapshots': ('course_progress_snapshots', SNAPSHOT_COLUMNS, 'snapshot_date'),
+    'courses': ('courses', COURSE_COLUMNS, None),
+}
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_LEVEL": "WARNING"}
+
+    def short_desc(self):
+        return "Export DB tables to Parquet files"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--table", default="snapshots", choices=sorted(TABLES), help="내보낼 테이블 (기본: snapshots)")
+        parser.add_argument("--output", default=None, help="저장 디렉토리 (기본: settings의 EXPORT_DIR)")
+        parser.add_argument("--batch-size", type=int, default=10000, help="한 번에 읽고 기록할 행 수")
+
+    def run(self, args, opts):
+        try:
+            pa = import_pyarrow()
+        except ImportError as e:
+            raise UsageError(str(e))
+
+        table, columns, partition_column = TABLES[opts.table]
+        output_dir = os.path.join(opts.output or self.settings.get('EXPORT_DIR'), opts.table)
+        if os.path.exists(output_dir):
+            shutil.rmtree(output_dir)  # 매번 전체를 다시 내보냄
+        os.makedirs(output_dir)
+
+        schema = arrow_schema(columns)
+        order_by = f" ORDER BY {partition_column}" if partition_column else ""
+        query = f"SELECT {', '.join(columns)} FROM {table}{order_by}"
+
+        pool = ConnectionPool.from_settings(self.settings)
+        connection = pool.connect()
+        writers = {}
+        total = 0
+        try:
+            with connection.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(query)
+                while True:
+                    rows = cursor.fetchmany(opts.batch_size)
+                    if not rows:
+                        break
+
+                    # 파티션(연도)별로 나눠서 기록
+                    partitions = {}
+                    for row in rows:
+                        record = {name: convert_value(kind, value) for (name, kind), value in zip(columns.items(), row)}
+                        key = f"year={record[partition_column].year}" if partition_column and record[partition_column] else ''
+                        partitions.setdefault(key, []).append(record)
+
+                    for key, records in partitions.items():
+                        if key not in writers:
+                            partition_dir = os.path.join(output_dir, key)
+                            os.makedirs(partition_dir, exist_ok=True)
+                            writers[key] = parquet_writer(os.path.join(partition_dir, 'part-0.parquet'), schema)
+                        writers[key].write_table(pa.Table.from_pylist(records, schema=schema))
+                    total += len(rows)
+        finally:
+            for writer in writers.values():
+                writer.close()
+            connection.close()
+
+        print(f"✓ Exported {total} rows from {table} to {output_dir} ({len(writers)} partitions)")
@@ -0,0 +1,117 @@
+"""
+주간 스냅샷 학습 분석 리포트 (pandas 필요)
+
+사용 방법:
+    scrapy study_report                         # DB에서 스냅샷을 읽어 전체 리포트 출력
+    scrapy study_report --report eta            # 완강 예상만 출력
+    scrapy study_report --parquet exports       # scrapy export_parquet 결과 파일로 분석 (DB 접속 안 함)
+    scrapy study_report --synthetic 3           # 가상 데이터 3년치로 계산 시간 측정
+    scrapy study_report --sql                   # 같은 DB에서 analysis_queries.sql도 실행하여 시간/결과 비교
+"""
+
+import time
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+
+from course_scraper.analytics import (
+    WEEKLY_GOAL_MINUTES, build_reports, compare_reports, import_pandas, load_from_db, load_from_parquet,
+    run_sql_reports, synthetic_data,
+)
+from course_scraper.db import ConnectionPool
+
+REPORT_TITLES = {
+    'current': '1. 이번 주 학습 현황',
+    'this_week': '2. 이번 주 학습량 (지난주 대비)',
+    'trend': '3. 최근 4주간 전체 학습 추이',
+    'weekly_changes': '4. 최근 4주간 주간 학습량 변화',
+    'course_patterns': '5. 강의별 학습 패턴 (전체 기간)',
+    'goal': '6. 학습 목표 대비 달성률',
+    'eta': '7. 강의별 완강 예상 (최근 4주 평균 기준)',
+    'idle': '9. 학습 안 한 강의 (최근 2주)',
+}
+
+
+class Command(ScrapyCommand):
+    requires_project = True
+    requires_crawler_process = False
+    default_settings = {"LOG_LEVEL": "WARNING"}
+
+    def short_desc(self):
+        return "Print weekly study reports from progress snapshots"
+
+    def add_options(self, parser):
+        super().add_options(parser)
+        parser.add_argument("--report", action="append", choices=sorted(REPORT_TITLES),
+                            help="출력할 리포트 (여러 번 지정 가능, 기본: 전체)")
+        parser.add_argument("--parquet", metavar="DIR", help="DB 대신 export_parquet 결과 디렉토리에서 읽기")
+        parser.add_argument("--goal", type=float, default=WEEKLY_GOAL_MINUTES, help="주간 학습 목표(분) (기본: 180)")
+        parser.add_argument("--synthetic", type=int, metavar="YEARS", help="가상 데이터 N년치로 계산 시간 측정")
+        parser.add_argument("--sql", action="store_true",
+                            help="analysis_queries.sql도 실행하여 pandas와 시간/결과 비교 (다르면 종료 코드 1)")
+
+    def run(self, args, opts):
+        try:
+            pd, _ = import_pandas()
+        except ImportError as e:
+            raise UsageError(str(e))
+        if opts.sql and (opts.synthetic or opts.parquet):
+            raise UsageError("--sql compares against the DB and cannot be combined with --synthetic / --parquet")
+
+        started = time.monotonic()
+        if opts.synthetic:
+            snapshots, courses = synthetic_data(years=opts.synthetic)
+        elif opts.parquet:
+            snapshots, courses = load_from_parquet(opts.parquet)
+        else:
+            connection = ConnectionPool.from_settings(self.settings).connect()
+            try:
+                snapshots, courses = load_from_db(connection)
+                if opts.sql:
+                    loaded = time.monotonic()
+                    # SQL은 주간 목표 180분이 고정이므로 같은 목표로 비교
+                    reports = build_reports(snapshots, courses)
+                    computed = time.monotonic()
+                    sql_results, sql_timings = run_sql_reports(connection, opts.report)
+                    self.print_comparison(snapshots, reports, sql_results, sql_timings,
+                                          loaded - started, computed - loaded)
+                    return
+            finally:
+                connection.close()
+        loaded = time.monotonic()
+
+        reports = build_reports(snapshots, courses, weekly_goal=opts.goal)
+        computed = time.monotonic()
+
+        if opts.synthetic:
+            print(f"{len(snapshots)} snapshots, {len(courses)} courses: "
+                  f"load {loaded - started:.3f}s, reports {computed - loaded:.3f}s")
+            return
+
+        with pd.option_context('display.max_rows', None, 'display.width', 200):
+            for name in opts.report or REPORT_TITLES:
+                print("=" * 60)
+                print(REPORT_TITLES[name])
+                print("=" * 60)
+                report = reports[name]
+                print(report.to_string(index=False) if len(report) else "(없음)")
+                print()
+
+    def print_comparison(self, snapshots, reports, sql_results, sql_timings, load_s, pandas_s):
+        """SQL / pandas 실행 시간과 결과 차이 출력"""
+        print(f"{len(snapshots)} snapshots")
+        print(f"pandas: load {load_s:.3f}s + reports {pandas_s:.3f}s = {load_s + pandas_s:.3f}s")
+        for name, elapsed in sql_timings.items():
+            print(f"  SQL {REPORT_TITLES[name]}: {elapsed:.3f}s")
+        print(f"SQL: {sum(sql_timings.values()):.3f}s")
+
+        if (snapshots['snapshot_date'].dt.weekday != 0).any():
+            print("⚠️  일별 스냅샷이 있습니다: SQL은 일별 행을 한 주로 계산하고 pandas는 주별로 합쳐서 계산하므로 결과가 다를 수 있습니다")
+
+        mismatches = compare_reports(reports, sql_results)
+        for mismatch in mismatches:
+            print(f"✗ {mismatch}")
+        if mismatches:
+            self.exitcode = 1
+        else:
+            print(f"✓ {len(sql_results)}개 리포트 결과가 SQL과 같습니다")
@@ -0,0 +1,48 @@
+"""
+로그인 / DB 접속 정보 지연 로딩
+
+settings.py와 spider 모듈은 import할 때 credentials.py를 읽지 않습니다.
+`scrapy list`나 inflearn / udemy 실행처럼 로그인 정보가 필요 없는 작업은 파일을 열지 않고,
+값이 처음 필요할 때(로그인 시작, DB 연결) 아래 순서로 찾습니다.
+
+1. crawler settings (scrapy crawl ... -s KAKAO_EMAIL=...)
+2. 환경변수 (KAKAO_EMAIL=... scrapy crawl ...)
+3. 프로젝트 루트의 credentials.py (프로세스당 한 번만 읽고 캐시)
+"""
+
+import functools
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+CREDENTIALS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'credentials.py')
+
+
+@functools.lru_cache(maxsize=None)
+def load_credentials_file(path=CREDENTIALS_PATH):
+    """credentials.py의 대문자 변수들 (파일이 없으면 빈 dict)"""
+    if not os.path.exists(path):
+        logger.warning(f"credentials.py not found at {path}. "
+                       f"Please create it from credentials_example.py or set environment variables")
+        return {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        exec_globals = {}
+        exec(f.read(), exec_globals)
+    return {name: value for name, value in exec_globals.items() if name.isupper()}
+
+
+def get_credential(settings, name, default=None):
+    """settings → 환경변수 → credentials.py 순서로 값 찾기"""
+    value = settings.get(name) if settings is not None else None
+    if value in (None, ''):
+        value = os.environ.get(name)
+    if value in (None, ''):
+        value = load_credentials_file().get(name)
+    return default if value in (None, '') else value
+
+
+def kakao_credentials(settings):
+    """카카오 로그인 (이메일, 비밀번호)"""
+    return get_credential(settings, 'KAKAO_EMAIL'), get_credential(settings, 'KAKAO_PASSWORD')
@@ -0,0 +1,68 @@
+"""
+브라우저 없이 크롤링하는 플랫폼(인프런, Udemy)의 커리큘럼 → CourseItem / LectureItem 변환
+
+각 spider는 커리큘럼을 아래 형태로 만든 뒤 curriculum_items()로 FastCampus와 같은 아이템을 만듭니다.
+    [{'section': '섹션 제목', 'lessons': [{'title': '강의 제목', 'minutes': 5.5, 'is_completed': False}, ...]}, ...]
+
+플랫폼마다 강의 ID가 따로 매겨지므로 courses.course_id가 겹치지 않도록 플랫폼별 구간으로 옮겨 저장합니다.
+    FastCampus: 그대로 / 인프런: 1,000,000,000 + ID / Udemy: 1,500,000,000 + ID
+"""
+
+from course_scraper.items import CourseItem, LectureItem
+
+# 플랫폼 → course_id 구간 시작값 (courses.course_id는 signed INT)
+PLATFORM_ID_OFFSETS = {
+    'fastcampus': 0,
+    'inflearn': 1_000_000_000,
+    'udemy': 1_500_000_000,
+}
+PLATFORM_ID_RANGE = 500_000_000  # 플랫폼 하나가 쓸 수 있는 ID 개수
+
+
+def platform_course_id(platform, course_id):
+    """플랫폼의 강의 ID → courses.course_id (구간을 벗어나면 ValueError)"""
+    course_id = int(course_id)
+    if not 0 < course_id < PLATFORM_ID_RANGE:
+        raise ValueError(f"{platform} course id out of range: {course_id}")
+    return PLATFORM_ID_OFFSETS[platform] + course_id
+
+
+def curriculum_items(platform, course_id, course_title, url, curriculum):
+    """CourseItem 하나와 LectureItem들을 순서대로 반환 (CourseItem이 먼저 저장되어야 함)
+
+    course_id는 플랫폼의 강의 ID이며 아이템에는 platform_course_id()로 바꾼 값이 들어갑니다.
+    수강률/수강시간은 완료한 강의의 시간 합계로 계산합니다 (진도를 모르면 0).
+    """
+    course_id = platform_course_id(platform, course_id)
+    lessons = [lesson for section in curriculum for lesson in section['lessons']]
+    total_lecture_time = round(sum(lesson['minutes'] for lesson in lessons), 2)
+    study_time = round(sum(lesson['minutes'] for lesson in lessons if lesson['is_completed']), 2)
+    progress_rate = round(study_time / total_lecture_time * 100, 2) if total_lecture_time else 0
+
+    yield CourseItem(
+        course_id=course_id,
+        course_title=course_title,
+        progress_rate=progress_rate,
+        study_time=study_time,
+        total_lecture_time=total_lecture_time,
+        url=url,
+        platform=platform
+    )
+
+    sort_order = 0
+    for section_number, section in enumerate(curriculum, 1):
+        for lecture_number, lesson in enumerate(section['lessons'], 1):
+            sort_order += 1
+            yield LectureItem(
+                course_id=course_id,
+                course_title=course_title,
+                section_number=section_number,
+                section_title=section['section'],
+                chapter_number=None,
+                chapter_title=None,
+                lecture_number=lecture_number,
+                lecture_title=lesson['title'],
+                lecture_time=lesson['minutes'],
+                is_completed=lesson['is_completed'],
+                sort_order=sort_order
+            )
@@ -0,0 +1,213 @@
+"""
+MySQL 커넥션 풀
+
+crawler 하나당 풀 하나를 만들어 pipeline과 spider(start_requests 등)가 같은 연결을 빌려 씁니다.
+오래 쉬던 연결은 빌려줄 때 ping으로 확인하고, 끊어졌으면 새로 연결합니다.
+
+사용 예:
+    pool = get_pool(self.crawler)
+    with pool.connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT ...")
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+import pymysql
+from scrapy import signals
+
+from course_scraper.credentials import get_credential
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊어졌음을 뜻하는 MySQL 오류 코드
+# 2003: 서버 접속 불가, 2006: server has gone away, 2013: 쿼리 중 연결 끊김, 2055: 읽기/쓰기 중 연결 끊김
+CONNECTION_LOST_CODES = {2003, 2006, 2013, 2055}
+
+_pools = weakref.WeakKeyDictionary()
+
+
+class PoolExhaustedError(ConnectionError):
+    """풀의 연결이 모두 사용 중 (ConnectionError라 pipeline은 연결 오류처럼 backoff 후 재시도 / 스풀)"""
+
+
+def is_connection_error(exc):
+    """연결이 끊어져서 난 오류인지 확인 (deadlock 등 쿼리 오류는 False)"""
+    if isinstance(exc, pymysql.err.InterfaceError):
+        return True
+    if isinstance(exc, pymysql.err.OperationalError):
+        return bool(exc.args) and exc.args[0] in CONNECTION_LOST_CODES
+    return isinstance(exc, (ConnectionError, BrokenPipeError))
+
+
+def get_pool(crawler):
+    """crawler에 연결된 커넥션 풀 반환 (없으면 settings로 생성)"""
+    pool = _pools.get(crawler)
+    if pool is None:
+        pool = ConnectionPool.from_crawler(crawler)
+        _pools[crawler] = pool
+        crawler.signals.connect(pool.close, signal=signals.engine_stopped)
+    return pool
+
+
+class ConnectionPool:
+    """pymysql 연결을 재사용하는 스레드 안전 풀
+
+    - size: 동시에 열어둘 수 있는 최대 연결 수
+    - timeout: 모두 사용 중일 때 대기할 시간(초). 0이면 바로 PoolExhaustedError
+      pipeline과 spider는 모두 reactor 스레드에서 빌리고 반납하므로, 기다리는 동안에는 반납될 수 없어
+      크롤링 전체가 멈춥니다. 0보다 크게 하는 것은 다른 스레드에서만 풀을 쓰는 경우에 한합니다.
+    - ping_interval: 이 시간(초) 이상 쉬던 연결은 빌려주기 전에 ping으로 확인
+    - stats: db_pool/hits, misses, wait_time, reconnects, discarded, exhausted 기록
+    """
+
+    def __init__(self, host='localhost', port=3306, user='root', password='', database='crawler',
+                 size=2, timeout=0, ping_interval=60, stats=None):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self.stats = stats
+
+        self._idle = deque()  # (connection, 반납 시각)
+        self._opened = 0
+        self._lock = threading.Condition()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls.from_settings(crawler.settings, crawler.stats)
+
+    @classmethod
+    def from_settings(cls, settings, stats=None):
+        return cls(
+            host=get_credential(settings, 'MYSQL_HOST', 'localhost'),
+            port=int(get_credential(settings, 'MYSQL_PORT', 3306)),
+            user=get_credential(settings, 'MYSQL_USER', 'root'),
+            password=get_credential(settings, 'MYSQL_PASSWORD', ''),
+            database=get_credential(settings, 'MYSQL_DATABASE', 'crawler'),
+            size=settings.getint('MYSQL_POOL_SIZE', 2),
+            timeout=settings.getfloat('MYSQL_POOL_TIMEOUT', 0),
+            ping_interval=settings.getfloat('MYSQL_POOL_PING_INTERVAL', 60),
+            stats=stats,
+        )
+
+    def __str__(self):
+        return f"{self.host}:{self.port}/{self.database}"
+
+    def _inc(self, key, count=1):
+        if self.stats is not None:
+            self.stats.inc_value(f'db_pool/{key}', count)
+
+    def connect(self):
+        """새 연결 생성 (풀 크기와 무관하게 호출한 쪽이 직접 관리)"""
+        return pymysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset='utf8mb4'
+        )
+
+    def acquire(self):
+        """연결 빌리기 - 쉬던 연결이 있으면 재사용(hit), 없으면 새로 연결(miss)"""
+        started = time.monotonic()
+        with self._lock:
+            while not self._idle and self._opened >= self.size:
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._inc('exhausted')
+                    raise PoolExhaustedError(f"No free MySQL connection in pool ({self._opened}/{self.size} in use)")
+                self._lock.wait(remaining)
+
+            if self._idle:
+                connection, released_at = self._idle.popleft()
+            else:
+                connection, released_at = None, None
+                self._opened += 1
+
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            self._inc('wait_time', round(waited, 3))
+
+        if connection is not None:
+            self._inc('hits')
+            if time.monotonic() - released_at >= self.ping_interval and not self._is_alive(connection):
+                self._inc('reconnects')
+                logger.warning(f"MySQL connection lost while idle, reconnecting: {self}")
+                self._close_quietly(connection)
+                connection = None
+        else:
+            self._inc('misses')
+
+        if connection is None:
+            try:
+                connection = self.connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                    self._lock.notify()
+                raise
+        return connection
+
+    def release(self, connection, discard=False):
+        """연결 반납 - discard=True이거나 트랜잭션 정리에 실패하면 닫고 버림"""
+        if not discard:
+            try:
+                connection.rollback()  # 커밋되지 않은 작업 정리
+            except Exception:
+                discard = True
+
+        with self._lock:
+            if discard:
+                self._opened -= 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._lock.notify()
+
+        if discard:
+            self._inc('discarded')
+            self._close_quietly(connection)
+
+    @contextmanager
+    def connection(self):
+        """with 블록 동안 연결을 빌림. 연결 오류가 나면 해당 연결은 풀에 돌려놓지 않음"""
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException as e:
+            self.release(connection, discard=is_connection_error(e))
+            raise
+        else:
+            self.release(connection)
+
+    def close(self):
+        """쉬고 있는 연결 모두 닫기"""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+            self._opened -= len(idle)
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def _is_alive(self, connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,56 @@
+"""
+강의 시간 문자열 → 분 단위 변환
+
+pipeline과 모든 FastCampus spider가 같은 함수를 사용합니다.
+클립 시간("12:34" 등)은 같은 값이 반복되는 경우가 많아 결과를 LRU 캐시에 보관합니다.
+"""
+
+import re
+from functools import lru_cache
+
+
+# "1시간 30분", "1시간", "30분"
+HOURS_PATTERN = re.compile(r'(\d+)\s*시간')
+MINUTES_PATTERN = re.compile(r'(\d+)\s*분')
+
+
+def parse_duration(duration_str):
+    """시간 문자열을 분 단위로 변환 (변환할 수 없으면 0)
+
+    예: "25:50" -> 25.83분 (25분 50초)
+        "1:30:45" -> 90.75분 (1시간 30분 45초)
+        "1시간 30분" -> 90분, "45" -> 45분
+    """
+    if not duration_str:
+        return 0
+    return _parse_duration(duration_str.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_duration(duration_str):
+    # "HH:MM:SS" 또는 "MM:SS" 형식 (콜론이 1개만 있으면 분:초로 간주)
+    # isdigit()은 '²' 같은 윗첨자도 True라서 int()로 변환 가능한 isdecimal()로 확인
+    if ':' in duration_str:
+        parts = duration_str.split(':')
+        if not all(part.isdecimal() for part in parts):
+            return 0
+        if len(parts) == 3:
+            hours, minutes, seconds = (int(p) for p in parts)
+            return round(hours * 60 + minutes + round(seconds / 60, 2), 2)
+        if len(parts) == 2:
+            minutes, seconds = (int(p) for p in parts)
+            return round(minutes + round(seconds / 60, 2), 2)
+        return 0
+
+    # 숫자만 있는 경우 (분으로 가정)
+    if duration_str.isdecimal():
+        return int(duration_str)
+
+    total_minutes = 0
+    hours_match = HOURS_PATTERN.search(duration_str)
+    if hours_match:
+        total_minutes += int(hours_match.group(1)) * 60
+    minutes_match = MINUTES_PATTERN.search(duration_str)
+    if minutes_match:
+        total_minutes += int(minutes_match.group(1))
+    return total_minutes
@@ -0,0 +1,168 @@
+"""
+Parquet 내보내기 (선택 기능, pyarrow 필요: pip install pyarrow)
+
+크롤링한 CourseItem / LectureItem을 Parquet 파일로 저장하는 feed exporter와
+DB 테이블(course_progress_snapshots, courses)을 Parquet으로 내보낼 때 쓰는 스키마/변환 함수 모음.
+강의/섹션/챕터 제목처럼 반복되는 문자열은 dictionary encoding으로 저장합니다.
+
+settings.py의 FEEDS 예시 참고. 분석은 DB 대신 exports/ 아래 파일을 pandas/duckdb 등으로 읽어서 진행합니다.
+"""
+
+from datetime import date
+
+from itemadapter import ItemAdapter
+from scrapy.exporters import BaseItemExporter
+
+
+def import_pyarrow():
+    """pyarrow를 불러옴 (설치되어 있지 않으면 설치 방법을 알려주는 ImportError)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+# 컬럼 이름 → 타입 ('int', 'float', 'bool', 'str', 'date')
+COURSE_COLUMNS = {
+    'course_id': 'int',
+    'course_title': 'str',
+    'progress_rate': 'float',
+    'study_time': 'float',
+    'total_lecture_time': 'float',
+    'url': 'str',
+    'display_order': 'int',
+}
+
+LECTURE_COLUMNS = {
+    'course_id': 'int',
+    'course_title': 'str',
+    'section_number': 'int',
+    'section_title': 'str',
+    'chapter_number': 'int',
+    'chapter_title': 'str',
+    'lecture_number': 'int',
+    'lecture_title': 'str',
+    'lecture_time': 'float',
+    'is_completed': 'bool',
+    'sort_order': 'int',
+}
+
+SNAPSHOT_COLUMNS = {
+    'course_id': 'int',
+    'snapshot_date': 'date',
+    'progress_rate': 'float',
+    'study_time': 'float',
+    'total_lecture_time': 'float',
+}
+
+ITEM_COLUMNS = {
+    'CourseItem': COURSE_COLUMNS,
+    'LectureItem': LECTURE_COLUMNS,
+}
+
+# dictionary encoding 대상 (값이 많이 반복되는 문자열 컬럼)
+DICTIONARY_COLUMNS = ['course_title', 'section_title', 'chapter_title', 'lecture_title']
+
+_CONVERTERS = {
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'str': str,
+    'date': lambda value: value if isinstance(value, date) else date.fromisoformat(str(value)),
+}
+
+
+def arrow_schema(columns):
+    pa = import_pyarrow()
+    types = {
+        'int': pa.int64(),
+        'float': pa.float64(),
+        'bool': pa.bool_(),
+        'str': pa.string(),
+        'date': pa.date32(),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+
+def convert_value(kind, value):
+    """Parquet 컬럼 타입에 맞게 변환 (빈 값 / 변환 실패는 null)"""
+    if value is None or value == '':
+        return None
+    try:
+        return _CONVERTERS[kind](value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parquet_writer(where, schema, **kwargs):
+    pa = import_pyarrow()
+    return pa.parquet.ParquetWriter(
+        where,
+        schema,
+        compression='zstd',
+        use_dictionary=[name for name in DICTIONARY_COLUMNS if name in schema.names],
+        **kwargs
+    )
+
+
+def feed_uri_params(params, spider):
+    """FEED_URI_PARAMS - feed 경로에 %(crawl_date)s 사용 가능 (날짜별 파티션)"""
+    return {**params, 'crawl_date': date.today().isoformat()}
+
+
+class ParquetItemExporter(BaseItemExporter):
+    """CourseItem 또는 LectureItem 한 종류를 Parquet으로 저장하는 feed exporter
+
+    row_group_size개씩 모아서 row group 단위로 기록하므로 크롤링이 길어져도 메모리 사용량이 일정합니다.
+    feed 하나에는 한 종류의 아이템만 들어가야 하므로 FEEDS의 item_classes 옵션으로 나눠서 지정합니다.
+    """
+
+    def __init__(self, file, row_group_size=10000, **kwargs):
+        super().__init__(dont_fail=True, **kwargs)
+        import_pyarrow()
+        self.file = file
+        self.row_group_size = row_group_size
+        self.columns = None
+        self.writer = None
+        self.buffer = []
+
+    @classmethod
+    def from_crawler(cls, crawler, file, **kwargs):
+        kwargs.setdefault('row_group_size', crawler.settings.getint('PARQUET_ROW_GROUP_SIZE', 10000))
+        return cls(file, **kwargs)
+
+    def export_item(self, item):
+        item_type = type(item).__name__
+        if self.columns is None:
+            if item_type not in ITEM_COLUMNS:
+                raise ValueError(f"Parquet export does not support {item_type}")
+            self.columns = ITEM_COLUMNS[item_type]
+            self.item_type = item_type
+            self.writer = parquet_writer(self.file, arrow_schema(self.columns))
+        elif item_type != self.item_type:
+            raise ValueError(f"Parquet feed already contains {self.item_type}, got {item_type} "
+                             f"(split feeds with the item_classes option)")
+
+        adapter = ItemAdapter(item)
+        self.buffer.append({
+            name: convert_value(kind, adapter.get(name))
+            for name, kind in self.columns.items()
+        })
+        if len(self.buffer) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        pa = import_pyarrow()
+        table = pa.Table.from_pylist(self.buffer, schema=self.writer.schema)
+        self.writer.write_table(table)
+        self.buffer = []
+
+    def finish_exporting(self):
+        if self.writer is None:
+            return
+        self._flush()
+        self.writer.close()
@@ -0,0 +1,95 @@
+"""
+요청별 다운로드 핸들러 선택 (DOWNLOAD_HANDLERS의 http / https)
+
+meta['playwright']가 True인 요청만 Playwright(브라우저)로 보내고, robots.txt 같은 나머지 요청은
+Scrapy 기본 HTTP/1.1 핸들러(ROUTING_HTTP2 = True면 https는 HTTP/2)로 다운로드합니다.
+핸들러별 요청 수와 응답 시간은 download_handler/<이름>/* 통계에 기록됩니다.
+"""
+
+import logging
+import time
+import weakref
+
+from scrapy.core.downloader.handlers.base import BaseDownloadHandler
+from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.misc import build_from_crawler, load_object
+
+logger = logging.getLogger(__name__)
+
+# crawler 하나당 라우터 하나 (http/https 스킴이 같은 핸들러를 공유해야 브라우저가 하나만 뜸)
+_routers = weakref.WeakKeyDictionary()
+
+
+def browser_handler(crawler):
+    """crawler의 Playwright 다운로드 핸들러 (브라우저를 쓰지 않으면 None)"""
+    router = _routers.get(crawler)
+    return router.browser_handler if router else None
+
+
+class RoutingDownloadHandler(BaseDownloadHandler):
+    """meta['playwright']에 따라 Playwright / HTTP 핸들러로 나눠서 다운로드"""
+
+    # Playwright 핸들러가 engine_started 시그널에서 브라우저를 띄우므로 시작 시 바로 생성
+    lazy = False
+
+    def __init__(self, crawler):
+        super().__init__(crawler)
+        self.stats = crawler.stats
+        self.closed = False
+
+        browser_handler = crawler.settings.get('ROUTING_BROWSER_HANDLER')
+        self.browser_handler = build_from_crawler(load_object(browser_handler), crawler) if browser_handler else None
+        self.http_handler = HTTP11DownloadHandler(crawler)
+        self.http2_handler = None
+        if crawler.settings.getbool('ROUTING_HTTP2'):
+            try:
+                from scrapy.core.downloader.handlers.http2 import H2DownloadHandler
+                self.http2_handler = H2DownloadHandler(crawler)
+            except (ImportError, NotConfigured) as e:
+                logger.warning(f"HTTP/2 handler unavailable ({e}), using HTTP/1.1 (pip install h2)")
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if crawler not in _routers:
+            _routers[crawler] = cls(crawler)
+        return _routers[crawler]
+
+    def route(self, request):
+        """요청을 처리할 (이름, 핸들러)"""
+        if request.meta.get('playwright'):
+            if self.browser_handler is None:
+                raise NotConfigured("playwright request but ROUTING_BROWSER_HANDLER is not set")
+            return 'playwright', self.browser_handler
+        if self.http2_handler and request.url.startswith('https://'):
+            return 'http2', self.http2_handler
+        return 'http11', self.http_handler
+
+    async def download_request(self, request):
+        name, handler = self.route(request)
+        started = time.monotonic()
+        try:
+            return await handler.download_request(request)
+        finally:
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+            self.stats.inc_value(f'download_handler/{name}/request_count')
+            self.stats.inc_value(f'download_handler/{name}/latency_ms', elapsed_ms)
+            self.stats.max_value(f'download_handler/{name}/latency_max_ms', elapsed_ms)
+
+    async def close(self):
+        # http / https 두 스킴에서 각각 호출되므로 한 번만 닫음
+        if self.closed:
+            return
+        self.closed = True
+
+        for name in ('playwright', 'http11', 'http2'):
+            count = self.stats.get_value(f'download_handler/{name}/request_count')
+            if count:
+                total_ms = self.stats.get_value(f'download_handler/{name}/latency_ms', 0)
+                max_ms = self.stats.get_value(f'download_handler/{name}/latency_max_ms', 0)
+                logger.info(f"Download handler {name}: {count} requests, "
+                            f"avg {total_ms / count:.0f}ms, max {max_ms}ms")
+
+        for handler in (self.browser_handler, self.http_handler, self.http2_handler):
+            if handler is not None:
+                await handler.close()
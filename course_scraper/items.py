@@ -15,6 +15,7 @@ class CourseItem(scrapy.Item):
     total_lecture_time = scrapy.Field() # 총 강의시간 (분)
     url = scrapy.Field()                # 강의 URL
     display_order = scrapy.Field()      # 강의 표시 순서 (작을수록 위에 표시)
+    platform = scrapy.Field()           # 플랫폼 (fastcampus / inflearn / udemy, 없으면 fastcampus)
 
 
 class LectureItem(scrapy.Item):
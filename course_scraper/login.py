@@ -0,0 +1,343 @@
+"""
+FastCampus 카카오 로그인 공통 로직
+
+모든 FastCampus spider와 browser_daemon.py가 같은 로그인 흐름을 사용합니다.
+저장된 세션(storage state)이 있으면 내 강의장으로 바로 이동하여 로그인을 생략합니다.
+"""
+
+import asyncio
+import os
+import time
+
+import scrapy
+from scrapy_playwright.page import PageMethod
+
+from course_scraper.browser import apply_stored_session, save_storage_state
+from course_scraper.selector_cache import SelectorCache, visible
+
+
+SIGN_IN_URL = 'https://fastcampus.co.kr/account/sign-in'
+MY_COURSES_URL = 'https://fastcampus.co.kr/me/course'
+
+KAKAO_BUTTON_SELECTORS = [
+    'button:has-text("카카오로 1초 만에 시작하기")',
+    'button:has-text("카카오")',
+    'a:has-text("카카오로 1초 만에 시작하기")',
+    'a:has-text("카카오")',
+    '[class*="kakao"]',
+    '[class*="Kakao"]',
+    'button[class*="Social"]',
+]
+EMAIL_SELECTORS = [
+    'input[name="loginId"]',
+    'input[type="email"]',
+    'input[placeholder*="이메일"]',
+    'input[placeholder*="아이디"]',
+    '#loginId',
+]
+PASSWORD_SELECTORS = ['input[name="password"]', 'input[type="password"]', '#password']
+LOGIN_BUTTON_SELECTORS = [
+    'button[type="submit"]',
+    'button:has-text("로그인")',
+    '.btn_confirm',
+    'button.submit',
+    'input[type="submit"]',
+]
+CONTINUE_SELECTORS = [
+    'button.btn_confirm',  # Kakao의 노란색 확인 버튼
+    'button:has-text("Continue")',
+    'button:has-text("계속")',
+    'button:has-text("확인")',
+    'button[type="submit"]:has-text("계속")',
+    'a.btn_confirm',
+]
+TWO_FACTOR_TIMEOUT_MS = 90000  # 카카오톡 2단계 인증 승인 대기 최대 시간
+
+
+class StoredSessionMixin:
+    """로그인하는 spider 공통: 시작할 때 저장된 세션으로 headless 여부와 storage_state를 정함
+
+    세션 파일 확인은 브라우저로 로그인하는 spider를 실행할 때만 합니다 (scrapy list 등은 파일을 읽지 않음).
+    scrapy.Spider보다 앞에 상속해야 합니다.
+    """
+
+    @classmethod
+    def update_settings(cls, settings):
+        super().update_settings(settings)
+        apply_stored_session(settings)
+
+
+def has_stored_session(settings):
+    """재사용 가능한 세션(storage state)이 컨텍스트에 설정되어 있는지 확인"""
+    contexts = settings.getdict('PLAYWRIGHT_CONTEXTS')
+    storage_state = contexts.get('default', {}).get('storage_state')
+    return bool(storage_state) and os.path.exists(storage_state)
+
+
+def is_logged_in_url(url):
+    """로그인/카카오 인증 페이지가 아닌 FastCampus 페이지인지 확인"""
+    return 'fastcampus.co.kr' in url and 'sign-in' not in url and 'kakao' not in url
+
+
+def login_request(spider, callback, errback):
+    """로그인 시작 요청 생성
+
+    저장된 세션이 있으면 로그인 페이지 대신 내 강의장으로 이동합니다.
+    세션이 만료되었다면 FastCampus가 로그인 페이지로 리디렉트하므로
+    callback에서 ensure_logged_in()이 카카오 로그인을 이어서 진행합니다.
+    """
+    if has_stored_session(spider.settings):
+        url, wait_ms = MY_COURSES_URL, 2000
+    else:
+        url, wait_ms = SIGN_IN_URL, 8000  # 페이지 로딩 충분히 기다림
+
+    return scrapy.Request(
+        url,
+        callback=callback,
+        meta={
+            'playwright': True,
+            'playwright_include_page': True,
+            'playwright_page_methods': [
+                PageMethod('wait_for_timeout', wait_ms),
+            ],
+        },
+        errback=errback,
+        dont_filter=True
+    )
+
+
+async def ensure_logged_in(page, email, password, logger, screenshots=False, settings=None, stats=None):
+    """세션이 살아있으면 그대로 사용하고, 아니면 카카오 로그인 진행
+
+    settings가 주어지면 로그인 성공 후 세션을 BROWSER_STORAGE_STATE에 저장하여
+    다음 실행이 headless로 시작할 수 있게 합니다. 헤드리스 브라우저에서 2단계 인증이
+    필요해지면 화면이 있는 브라우저를 따로 띄워 인증을 진행합니다.
+    stats가 주어지면 2단계 인증 대기 시간을 login/2fa_wait_ms에 기록합니다.
+    """
+    if is_logged_in_url(page.url):
+        logger.info("✓ Reusing stored session - login skipped")
+        return True
+
+    storage_state_path = settings.get('BROWSER_STORAGE_STATE') if settings else None
+    selector_cache = SelectorCache.from_settings(settings)
+    headless = bool(
+        settings
+        and settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS').get('headless', True)
+        and not settings.get('PLAYWRIGHT_CDP_URL')
+    )
+
+    if headless and page.context.browser:
+        context_kwargs = dict(settings.getdict('PLAYWRIGHT_CONTEXTS').get('default', {}))
+        context_kwargs.pop('storage_state', None)
+        return await interactive_login(page, email, password, logger, storage_state_path, context_kwargs,
+                                       selector_cache=selector_cache, stats=stats)
+
+    if 'sign-in' not in page.url:
+        await page.goto(SIGN_IN_URL, wait_until='domcontentloaded')
+    await page.wait_for_timeout(3000)
+
+    logged_in = await kakao_login(page, email, password, logger, screenshots=screenshots,
+                                  selector_cache=selector_cache, stats=stats)
+    if logged_in and storage_state_path:
+        await save_storage_state(page.context, storage_state_path)
+        logger.info(f"✓ Session saved: {storage_state_path}")
+    return logged_in
+
+
+async def interactive_login(page, email, password, logger, storage_state_path=None, context_kwargs=None,
+                            selector_cache=None, stats=None):
+    """헤드리스 실행 중 세션이 만료된 경우 2단계 인증용 브라우저 창을 띄워 로그인
+
+    로그인된 쿠키를 원래(헤드리스) 컨텍스트에 복사하므로 spider는 그대로 진행합니다.
+    """
+    logger.warning("Stored session is not valid - opening a visible browser for Kakao 2FA...")
+
+    browser = await page.context.browser.browser_type.launch(headless=False)
+    try:
+        context = await browser.new_context(**(context_kwargs or {}))
+        login_page = await context.new_page()
+        await login_page.goto(SIGN_IN_URL, wait_until='domcontentloaded')
+        await login_page.wait_for_timeout(3000)
+
+        if not await kakao_login(login_page, email, password, logger, selector_cache=selector_cache, stats=stats):
+            return False
+
+        if storage_state_path:
+            state = await save_storage_state(context, storage_state_path)
+            logger.info(f"✓ Session saved: {storage_state_path}")
+        else:
+            state = await context.storage_state()
+        await page.context.add_cookies(state['cookies'])
+    finally:
+        await browser.close()
+
+    await page.goto(MY_COURSES_URL, wait_until='domcontentloaded')
+    return is_logged_in_url(page.url)
+
+
+async def _screenshot(page, logger, enabled, path):
+    if enabled:
+        await page.screenshot(path=path)
+        logger.info(f"✓ Saved screenshot: {path}")
+
+
+async def _fill_first(page, selector_cache, step, selectors, value, timeout=3000):
+    selector = await selector_cache.resolve(page, step, selectors, timeout)
+    if selector:
+        try:
+            await page.locator(visible(selector)).first.fill(value, timeout=timeout)
+            return selector
+        except Exception:
+            pass
+    return None
+
+
+async def _click_first(page, selector_cache, step, selectors, timeout):
+    selector = await selector_cache.resolve(page, step, selectors, timeout)
+    if selector:
+        try:
+            await page.locator(visible(selector)).first.click(timeout=timeout)
+            return selector
+        except Exception:
+            pass
+    return None
+
+
+async def kakao_login(page, email, password, logger, screenshots=False, selector_cache=None, stats=None):
+    """카카오 로그인 자동화 (2단계 인증 대기 포함)
+
+    단계마다 선택자 후보를 한 번에 확인하고, 마지막으로 성공한 선택자를 selector_cache에 기억합니다.
+
+    Returns:
+        bool: 로그인 성공 여부
+    """
+    logger.info("Starting Kakao login process...")
+    selector_cache = selector_cache or SelectorCache()
+    await _screenshot(page, logger, screenshots, 'screenshot_1_initial.png')
+
+    # 1. 카카오 로그인 버튼 클릭
+    selector = await _click_first(page, selector_cache, 'kakao_button', KAKAO_BUTTON_SELECTORS, timeout=5000)
+    if not selector:
+        logger.error("✗ Could not find Kakao login button")
+        await _screenshot(page, logger, screenshots, 'screenshot_error_no_button.png')
+        return False
+    logger.info(f"✓ Clicked Kakao button with selector: {selector}")
+
+    # 2. 카카오 로그인 페이지 로드 대기
+    await page.wait_for_timeout(3000)
+    await _screenshot(page, logger, screenshots, 'screenshot_2_kakao_page.png')
+
+    # 3. 이메일 / 비밀번호 입력
+    if await _fill_first(page, selector_cache, 'email', EMAIL_SELECTORS, email):
+        logger.info("✓ Entered email")
+    else:
+        logger.warning("✗ Could not enter email")
+
+    if await _fill_first(page, selector_cache, 'password', PASSWORD_SELECTORS, password):
+        logger.info("✓ Entered password")
+    else:
+        logger.warning("✗ Could not enter password")
+
+    await _screenshot(page, logger, screenshots, 'screenshot_3_credentials_entered.png')
+
+    # 4. 로그인 버튼 클릭
+    if await _click_first(page, selector_cache, 'login_button', LOGIN_BUTTON_SELECTORS, timeout=3000):
+        logger.info("✓ Clicked login button")
+    else:
+        logger.warning("✗ Could not click login button")
+
+    # 5. 2FA 대기
+    logger.info("=" * 70)
+    logger.info("⚠️  KakaoTalk 앱에서 2단계 인증을 승인해주세요! ⚠️")
+    logger.info(f"{TWO_FACTOR_TIMEOUT_MS // 1000}초 대기 중...")
+    logger.info("=" * 70)
+
+    wait_ms = await wait_for_2fa(page, logger)
+    if wait_ms is None:
+        logger.warning(f"✗ Not redirected to FastCampus within {TWO_FACTOR_TIMEOUT_MS // 1000}s")
+        if stats is not None:
+            stats.inc_value('login/2fa_timeout')
+    else:
+        logger.info(f"✓ Successfully redirected to FastCampus! (after {wait_ms / 1000:.1f}s)")
+        if stats is not None:
+            stats.set_value('login/2fa_wait_ms', wait_ms)
+
+    await _screenshot(page, logger, screenshots, 'screenshot_5_after_2fa.png')
+
+    current_url = page.url
+    page_title = await page.title()
+
+    logger.info("Login selector timings:")
+    selector_cache.log_summary(logger)
+
+    # 로그인 성공 확인
+    if 'sign-in' not in current_url and '인증' not in page_title:
+        logger.info("✓ Login successful!")
+        return True
+
+    logger.error("✗ Login failed!")
+    return False
+
+
+async def _redirect_or(page, waiting, timeout_ms):
+    """FastCampus 리디렉트와 다른 대기(waiting) 중 먼저 끝난 쪽 ('redirect' / 'other', 둘 다 실패하면 None)"""
+    redirect = asyncio.ensure_future(
+        page.wait_for_url(is_logged_in_url, wait_until='commit', timeout=timeout_ms)
+    )
+    other = asyncio.ensure_future(waiting)
+    done, pending = await asyncio.wait({redirect, other}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    if redirect in done and not redirect.exception():
+        return 'redirect'
+    if other in done and not other.exception():
+        return 'other'
+    return None
+
+
+async def wait_for_2fa(page, logger, timeout_ms=TWO_FACTOR_TIMEOUT_MS):
+    """2단계 인증 승인 대기 - FastCampus로 리디렉트되는 즉시 반환
+
+    주기적으로 확인하지 않고 리디렉트(wait_for_url)와 확인(Continue) 버튼 등장을 동시에 기다려
+    먼저 일어난 쪽을 처리합니다. 버튼을 누른 뒤에는 다시 리디렉트를 기다립니다.
+    확인 버튼 선택자(.btn_confirm, "확인")는 카카오 로그인 버튼과도 일치하므로 비밀번호 입력란이
+    사라진 뒤(2단계 인증 화면으로 이동한 뒤)부터 찾습니다. 그 전에 누르면 로그인이 두 번 제출됩니다.
+
+    Returns:
+        int | None: 리디렉트까지 걸린 시간(ms), 시간 안에 리디렉트되지 않으면 None
+    """
+    started = time.monotonic()
+    credentials_form = page.locator(', '.join(visible(selector) for selector in PASSWORD_SELECTORS)).first
+    continue_button = page.locator(', '.join(visible(selector) for selector in CONTINUE_SELECTORS)).first
+
+    def remaining_ms():
+        return timeout_ms - (time.monotonic() - started) * 1000
+
+    # 로그인 화면을 벗어날 때까지 대기 (세션이 남아 있으면 바로 리디렉트됨)
+    event = await _redirect_or(page, credentials_form.wait_for(state='hidden', timeout=remaining_ms()), remaining_ms())
+    if event == 'redirect':
+        return int((time.monotonic() - started) * 1000)
+    if event is None:
+        return None
+
+    while True:
+        left_ms = remaining_ms()  # Playwright는 timeout=0을 무제한 대기로 처리하므로 0 이하면 종료
+        if left_ms <= 0:
+            return None
+
+        event = await _redirect_or(page, continue_button.wait_for(state='visible', timeout=left_ms), left_ms)
+        if event == 'redirect':
+            return int((time.monotonic() - started) * 1000)
+        if event is None:
+            return None
+
+        try:
+            await continue_button.click(timeout=5000)
+            logger.info("✓ Clicked Continue button!")
+            # 같은 버튼을 반복해서 누르지 않도록 사라질 때까지 대기 (리디렉트되면 바로 사라짐)
+            await continue_button.wait_for(state='hidden', timeout=5000)
+        except Exception as e:
+            logger.warning(f"Could not click Continue button: {str(e)[:100]}")
+            await page.wait_for_timeout(1000)
@@ -0,0 +1,73 @@
+"""
+크롤링 로그 형식 / 샘플링
+
+강의가 수천 개인 크롤링에서 강의·섹션마다 INFO 로그를 남기면 문자열 포맷팅과 출력이 눈에 띄는 비용이 됩니다.
+- 반복문 안의 로그는 DEBUG + % 포맷(지연 포맷팅)으로 남기고, LogSampler로 N개마다 하나만 출력합니다.
+- 강의 하나가 끝나면 요약 한 줄을 INFO로 남기고, 요약 필드는 extra={'summary': {...}}로 붙입니다.
+- LOG_JSON = True면 StructuredLogging 확장이 로그를 한 줄에 JSON 하나로 출력합니다 (요약 필드 포함).
+
+spider마다 custom_settings 또는 -s 옵션으로 LOG_JSON / LOG_ITEM_SAMPLE_EVERY / LOG_LEVEL을 바꿀 수 있습니다.
+"""
+
+import json
+import logging
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+
+class LogSampler:
+    """N번 호출에 한 번만 True (첫 호출은 항상 True, every가 0이면 항상 False)"""
+
+    def __init__(self, every=100):
+        self.every = every
+        self.count = 0
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(settings.getint('LOG_ITEM_SAMPLE_EVERY', 100))
+
+    def __call__(self):
+        self.count += 1
+        return bool(self.every) and (self.count - 1) % self.every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 (extra의 summary 필드를 최상위로 펼침)"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        summary = getattr(record, 'summary', None)
+        if summary:
+            entry.update(summary)
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class StructuredLogging:
+    """LOG_JSON = True면 Scrapy 로그 핸들러의 출력 형식을 JSON으로 변경
+
+    Scrapy가 크롤링 시작 과정에서 루트 핸들러를 다시 만들 수 있으므로 engine_started에서 한 번 더 적용합니다.
+    """
+
+    def __init__(self, formatter):
+        self.formatter = formatter
+        self.apply()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('LOG_JSON'):
+            raise NotConfigured
+        ext = cls(JsonFormatter(datefmt=crawler.settings.get('LOG_DATEFORMAT')))
+        crawler.signals.connect(ext.apply, signal=signals.engine_started)
+        return ext
+
+    def apply(self):
+        for handler in logging.getLogger().handlers:
+            handler.setFormatter(self.formatter)
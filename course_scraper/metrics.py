@@ -0,0 +1,232 @@
+"""
+크롤링 상태 지표 (Prometheus 텍스트 형식)
+
+METRICS_ENABLED = True면 크롤링 중 METRICS_INTERVAL초마다 지표를 갱신하여
+- METRICS_PORT의 HTTP 엔드포인트(/metrics)로 제공하고
+- METRICS_TEXTFILE이 있으면 node_exporter textfile collector용 파일(.prom)로 저장합니다.
+
+카운터/게이지는 crawler stats에서 읽고, 시간 분포(히스토그램)는 각 모듈이 observe()로 기록합니다.
+prometheus_client 없이 텍스트 형식을 직접 만들므로 추가 설치가 필요 없습니다.
+
+사용 예:
+    from course_scraper.metrics import observe
+    observe(self.stats, 'db_write_seconds', elapsed)  # 확장이 꺼져 있으면 아무것도 하지 않음
+"""
+
+import logging
+import os
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.asyncio import create_looping_call
+
+from course_scraper.items import CourseItem, LectureItem
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'course_scraper'
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# 이름 → 설명 (observe()로 기록하는 히스토그램)
+HISTOGRAMS = {
+    'navigation_seconds': 'Classroom page navigation time (page load or SPA route change)',
+    'extraction_seconds': 'Time to parse one course (progress + curriculum + items)',
+    'db_write_seconds': 'Time to save one item in MySQL (one transaction)',
+}
+
+# crawler stats 키 → (지표 이름, 종류, 설명)
+STAT_METRICS = {
+    'courses/failed': ('courses_failed_total', 'counter', 'Course pages that failed to load or parse'),
+    'downloader/request_count': ('requests_total', 'counter', 'Requests sent by the downloader'),
+    'downloader/response_count': ('responses_total', 'counter', 'Responses received by the downloader'),
+    'log_count/ERROR': ('errors_total', 'counter', 'ERROR log records'),
+    'navigation/spa': ('spa_navigations_total', 'counter', 'Courses opened by SPA route change'),
+    'mysql/retries': ('db_retries_total', 'counter', 'MySQL saves retried after a connection error'),
+    'mysql/spooled': ('db_spooled_total', 'counter', 'Items written to the spool instead of MySQL'),
+    'watchdog/pages_force_closed': ('pages_force_closed_total', 'counter', 'Leaked pages closed by the browser watchdog'),
+    'watchdog/context_recycles': ('context_recycles_total', 'counter', 'Browser contexts recycled for memory'),
+}
+
+# stats 레지스트리 (pipeline, 탭 풀 등 crawler 대신 stats만 가진 객체도 기록할 수 있도록 stats로 찾음)
+_registries = weakref.WeakKeyDictionary()
+
+
+def observe(stats, name, value):
+    """히스토그램에 값 기록 (지표 확장이 꺼져 있으면 무시)"""
+    metrics = _registries.get(stats) if stats is not None else None
+    if metrics is not None and value is not None:
+        metrics.observe(name, value)
+
+
+class Histogram:
+    def __init__(self, buckets=SECONDS_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+                break
+
+    def render(self, name, labels):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum:.6f}')
+        lines.append(f'{name}_count{{{labels}}} {self.count}')
+        return lines
+
+
+class CrawlMetrics:
+    """crawl 하나의 지표 수집 / HTTP 제공 / textfile 저장 확장"""
+
+    def __init__(self, crawler):
+        settings = crawler.settings
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.interval = settings.getfloat('METRICS_INTERVAL', 15)
+        self.port = settings.getint('METRICS_PORT', 0)
+        self.textfile = settings.get('METRICS_TEXTFILE')
+        self.histograms = {name: Histogram() for name in HISTOGRAMS}
+        self.counters = {'courses_crawled_total': 0, 'lectures_parsed_total': 0}
+        self.labels = ''
+        self.started = time.time()
+        self.text = ''
+        self.rss_mb = None  # 백그라운드 스레드가 METRICS_INTERVAL마다 측정한 프로세스 트리 RSS
+        self.stopping = threading.Event()
+        self.lock = threading.Lock()
+        self.server = None
+        self.task = None
+        _registries[self.stats] = self
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('METRICS_ENABLED'):
+            raise NotConfigured
+        ext = cls(crawler)
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        return ext
+
+    def spider_opened(self, spider):
+        self.labels = f'spider="{spider.name}"'
+        # ps 실행은 수십~수백 ms 걸리므로 reactor가 아닌 별도 스레드에서 측정하고 render()는 마지막 값만 읽음
+        threading.Thread(target=self.sample_rss, name='metrics-rss', daemon=True).start()
+        self.update()
+        if self.port:
+            try:
+                self.server = ThreadingHTTPServer(('0.0.0.0', self.port), self.handler_class())
+            except OSError as e:
+                logger.warning(f"Metrics endpoint not started on port {self.port}: {e}")
+            else:
+                threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True).start()
+                logger.info(f"Metrics endpoint: http://0.0.0.0:{self.port}/metrics")
+        self.task = create_looping_call(self.update)
+        self.task.start(self.interval, now=False)
+
+    def spider_closed(self, spider, reason):
+        if self.task and self.task.running:
+            self.task.stop()
+        self.stopping.set()
+        self.update()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def item_scraped(self, item, spider):
+        if isinstance(item, CourseItem):
+            self.counters['courses_crawled_total'] += 1
+        elif isinstance(item, LectureItem):
+            self.counters['lectures_parsed_total'] += 1
+
+    def sample_rss(self):
+        """크롤링이 끝날 때까지 METRICS_INTERVAL마다 RSS 측정 (백그라운드 스레드)"""
+        from course_scraper.browser import process_tree_rss_mb  # browser가 observe를 가져다 쓰므로 순환 import 방지
+
+        while True:
+            self.rss_mb = process_tree_rss_mb()
+            if self.stopping.wait(self.interval):
+                return
+
+    def observe(self, name, value):
+        if name in self.histograms:
+            self.histograms[name].observe(value)
+
+    def handler_class(self):
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                with metrics.lock:
+                    body = metrics.text.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return MetricsHandler
+
+    def render(self):
+        lines = []
+
+        def metric(name, kind, help_text, value):
+            lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_{name} {kind}')
+            lines.append(f'{PREFIX}_{name}{{{self.labels}}} {value}')
+
+        metric('courses_crawled_total', 'counter', 'CourseItems scraped', self.counters['courses_crawled_total'])
+        metric('lectures_parsed_total', 'counter', 'LectureItems scraped', self.counters['lectures_parsed_total'])
+        for key, (name, kind, help_text) in STAT_METRICS.items():
+            metric(name, kind, help_text, self.stats.get_value(key, 0))
+
+        pages_open = self.stats.get_value('playwright/page_count', 0) - self.stats.get_value('playwright/page_count/closed', 0)
+        metric('pages_open', 'gauge', 'Browser pages currently open', pages_open)
+        rss_mb = self.rss_mb
+        if rss_mb is not None:
+            metric('memory_rss_megabytes', 'gauge', 'RSS of the crawler process tree (incl. Chromium)', round(rss_mb, 1))
+        metric('start_time_seconds', 'gauge', 'Crawl start time (unix)', round(self.started, 3))
+        metric('last_update_seconds', 'gauge', 'Last metrics update time (unix)', round(time.time(), 3))
+
+        for name, help_text in HISTOGRAMS.items():
+            lines.append(f'# HELP {PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {PREFIX}_{name} histogram')
+            lines.extend(self.histograms[name].render(f'{PREFIX}_{name}', self.labels))
+
+        return '\n'.join(lines) + '\n'
+
+    def update(self):
+        """지표 다시 계산 후 HTTP 응답 / textfile 갱신"""
+        text = self.render()
+        with self.lock:
+            self.text = text
+
+        if self.textfile:
+            # node_exporter가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = f'{self.textfile}.{os.getpid()}.tmp'
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.textfile)), exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, self.textfile)
+            except OSError as e:
+                logger.warning(f"Could not write metrics textfile {self.textfile}: {e}")
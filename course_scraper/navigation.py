@@ -0,0 +1,69 @@
+"""
+FastCampus 강의실(SPA) 클라이언트 사이드 네비게이션
+
+강의실 앱이 이미 로드된 탭에서 전체 페이지 로드 없이 SPA 라우터로 다른 강의실로 이동합니다.
+이동 완료는 사이드바가 새 강의 기준으로 다시 렌더링되었는지로 판단하며,
+완료되지 않으면 False를 반환하여 호출자가 일반 페이지 로드로 대체하도록 합니다.
+"""
+
+from urllib.parse import urlparse
+
+
+SIDEBAR_CHAPTER_SELECTOR = '.classroom-sidebar-clip__chapter'
+
+# 현재 사이드바 요소에 표시를 남겨두면 재렌더링 후 새 요소와 구분할 수 있음
+MARK_SIDEBAR_JS = '''
+(selector) => {
+    document.querySelectorAll(selector).forEach(el => el.setAttribute('data-scraper-stale', '1'));
+    return document.title;
+}
+'''
+
+# 1) 페이지 안의 강의실 링크 클릭  2) Next.js 라우터  3) history API + popstate 순으로 시도
+PUSH_ROUTE_JS = '''
+(path) => {
+    const link = document.querySelector(`a[href$="${path}"]`);
+    if (link) {
+        link.click();
+        return 'link';
+    }
+    if (window.next && window.next.router && window.next.router.push) {
+        window.next.router.push(path);
+        return 'next-router';
+    }
+    window.history.pushState({}, '', path);
+    window.dispatchEvent(new PopStateEvent('popstate', { state: {} }));
+    return 'history';
+}
+'''
+
+ROUTE_READY_JS = '''
+([path, selector, previousTitle]) => {
+    if (!window.location.pathname.replace(/\\/$/, '').endsWith(path)) return false;
+    if (document.title === previousTitle) return false;
+    const chapters = document.querySelectorAll(selector);
+    if (chapters.length === 0) return false;
+    return !Array.from(chapters).some(el => el.hasAttribute('data-scraper-stale'));
+}
+'''
+
+
+async def spa_navigate(page, url, timeout=15000):
+    """SPA 라우터로 강의실 이동
+
+    Returns:
+        bool: 새 강의의 사이드바가 렌더링되었으면 True
+    """
+    path = urlparse(url).path.rstrip('/')
+
+    try:
+        previous_title = await page.evaluate(MARK_SIDEBAR_JS, SIDEBAR_CHAPTER_SELECTOR)
+        await page.evaluate(PUSH_ROUTE_JS, path)
+        await page.wait_for_function(
+            ROUTE_READY_JS,
+            arg=[path, SIDEBAR_CHAPTER_SELECTOR, previous_title],
+            timeout=timeout
+        )
+        return True
+    except Exception:
+        return False
@@ -8,94 +8,284 @@
 from itemadapter import ItemAdapter
 import pymysql
 import logging
+import asyncio
+import time
 from datetime import datetime, date, timedelta
 
+from course_scraper.db import get_pool, is_connection_error
+from course_scraper.duration import parse_duration
+from course_scraper.logs import LogSampler
+from course_scraper.metrics import observe
+from course_scraper.spool import Spool
+
 
 class MySQLPipeline:
     """MySQL 데이터베이스에 크롤링 데이터를 저장하는 파이프라인"""
 
-    def __init__(self, mysql_host, mysql_port, mysql_user, mysql_password, mysql_db):
-        self.mysql_host = mysql_host
-        self.mysql_port = mysql_port
-        self.mysql_user = mysql_user
-        self.mysql_password = mysql_password
-        self.mysql_db = mysql_db
+    def __init__(self, pool, stats=None, retry_times=5, retry_backoff=1.0, retry_backoff_max=60.0,
+                 spool_dir=None, spool_mode='auto',
+                 snapshot_granularity='weekly', snapshot_retention_days=0, log_sample_every=100,
+                 prune_stale_lectures=False):
+        self.pool = pool
+        self.stats = stats
+        self.retry_times = retry_times
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.spool_dir = spool_dir
+        self.spool_mode = spool_mode
+        self.spool = None
+        self.spider_name = None
+        self.pending_events = []  # 커밋하지 않은 완료 상태 변경 이벤트, 커밋 직전에 한 번에 기록 (commit())
+        self.item_time = None  # 현재 저장 중인 아이템의 크롤링 시각 (완료 시각/이벤트 시각/스냅샷 기준일)
+        self.item_lecture_id = None  # 현재 저장 중인 LectureItem의 lecture_id
+        self.latest_item_time = None  # 지금까지 저장한 아이템의 가장 늦은 크롤링 시각 (스냅샷 정리 기준)
+        self.pending_snapshots = {}  # (course_id, snapshot_date) → 값, 커밋 직전에 한 번에 기록 (commit())
+        self.snapshot_granularity = snapshot_granularity
+        self.snapshot_retention_days = snapshot_retention_days
+        self.log_sampler = LogSampler(log_sample_every)  # 강의 단위 DEBUG 로그 샘플링
+        self.prune_stale_lectures = prune_stale_lectures
+        self.crawled_course_id = None  # 현재 수집 중인 강의 (prune_stale_lectures일 때만 사용)
+        self.crawled_lecture_ids = set()  # 현재 강의에서 이번에 저장한 lecture_id
         self.connection = None
         self.cursor = None
 
     @classmethod
     def from_crawler(cls, crawler):
-        """Scrapy settings에서 DB 설정 가져오기"""
+        """crawler의 커넥션 풀 사용 (DB 설정은 Scrapy settings의 MYSQL_*)"""
+        return cls.from_settings(crawler.settings, get_pool(crawler), stats=crawler.stats)
+
+    @classmethod
+    def from_settings(cls, settings, pool, stats=None):
+        """Scrapy settings로 생성 (crawler가 없는 명령(drain_spool)도 크롤링과 같은 설정으로 저장)"""
         return cls(
-            mysql_host=crawler.settings.get('MYSQL_HOST', 'localhost'),
-            mysql_port=crawler.settings.get('MYSQL_PORT', 3306),
-            mysql_user=crawler.settings.get('MYSQL_USER', 'root'),
-            mysql_password=crawler.settings.get('MYSQL_PASSWORD', ''),
-            mysql_db=crawler.settings.get('MYSQL_DATABASE', 'crawler')
+            pool,
+            stats=stats,
+            retry_times=settings.getint('MYSQL_RETRY_TIMES', 5),
+            retry_backoff=settings.getfloat('MYSQL_RETRY_BACKOFF', 1.0),
+            retry_backoff_max=settings.getfloat('MYSQL_RETRY_BACKOFF_MAX', 60.0),
+            spool_dir=settings.get('MYSQL_SPOOL_DIR'),
+            spool_mode=settings.get('MYSQL_SPOOL_MODE', 'auto').lower(),
+            snapshot_granularity=settings.get('SNAPSHOT_GRANULARITY', 'weekly').lower(),
+            snapshot_retention_days=settings.getint('SNAPSHOT_RETENTION_DAYS', 0),
+            log_sample_every=settings.getint('LOG_ITEM_SAMPLE_EVERY', 100),
+            prune_stale_lectures=settings.getbool('PRUNE_STALE_LECTURES'),
         )
 
     def open_spider(self, spider):
-        """스파이더 시작 시 DB 연결"""
+        """스파이더 시작 시 풀에서 DB 연결을 빌림
+
+        DB에 접속할 수 없으면 (MYSQL_SPOOL_MODE=auto) 크롤링을 중단하지 않고 스풀 파일에 저장합니다.
+        """
+        self.spider_name = spider.name
+
+        if self.spool_mode == 'always':
+            self.start_spooling("MYSQL_SPOOL_MODE=always")
+            return
+
         try:
-            self.connection = pymysql.connect(
-                host=self.mysql_host,
-                port=self.mysql_port,
-                user=self.mysql_user,
-                password=self.mysql_password,
-                database=self.mysql_db,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            self.cursor = self.connection.cursor()
-            logging.info(f"MySQL connected: {self.mysql_host}:{self.mysql_port}/{self.mysql_db}")
+            self.connect()
+            logging.info(f"MySQL connected: {self.pool}")
         except Exception as e:
             logging.error(f"MySQL connection failed: {e}")
-            raise
+            if self.spool_mode == 'off' or not self.spool_dir:
+                raise
+            self.start_spooling(e)
 
     def close_spider(self, spider):
-        """스파이더 종료 시 DB 연결 종료"""
+        """스파이더 종료 시 남은 정리 작업 후 DB 연결을 풀에 반납"""
+        if self.connection and self.crawled_course_id is not None:
+            try:
+                self.prune_lectures(self.crawled_course_id, self.crawled_lecture_ids)
+                self.commit()
+            except Exception as e:
+                self.rollback()
+                logging.warning(f"Failed to prune stale lectures of course {self.crawled_course_id}: {e}")
+
+        if self.connection and self.snapshot_retention_days > 0:
+            try:
+                self.downsample_snapshots()
+                self.commit()
+            except Exception as e:
+                self.rollback()
+                logging.warning(f"Failed to downsample snapshots: {e}")
+
+        if self.connection:
+            self.pool.release(self.connection)
+            self.connection = None
+            logging.info("MySQL connection released")
+
+        if self.spool:
+            self.spool.close()
+            logging.warning(f"{self.spool.count} items spooled to {self.spool.path} "
+                            f"- run 'scrapy drain_spool' when MySQL is available")
+
+    def start_spooling(self, reason):
+        """이후 아이템을 DB 대신 스풀 파일에 저장"""
+        if self.spool is None:
+            self.spool = Spool.create(self.spool_dir, self.spider_name or 'crawl')
+            logging.warning(f"Spooling items to {self.spool.path} ({reason})")
+
+    def connect(self):
+        """풀에서 연결을 빌리고 DictCursor 생성"""
+        self.connection = self.pool.acquire()
+        self.cursor = self.connection.cursor(pymysql.cursors.DictCursor)
+
+    def drop_connection(self):
+        """끊어진 연결을 풀에서 제거 (커밋하지 못한 이벤트/스냅샷도 버림)"""
         if self.connection:
-            self.connection.close()
-            logging.info("MySQL connection closed")
+            self.pool.release(self.connection, discard=True)
+        self.connection = None
+        self.cursor = None
+        self.pending_events = []
+        self.pending_snapshots = {}
+
+    def commit(self):
+        """모아둔 이벤트와 스냅샷을 multi-row INSERT/UPSERT한 뒤 커밋
+
+        이벤트와 스냅샷은 그것을 만든 lectures/courses 변경과 항상 같은 트랜잭션에 들어갑니다.
+        크롤링 중에는 아이템마다 커밋하므로 쓰기도 아이템마다 한 번이고 (강의 하나를 한 트랜잭션으로
+        묶으면 중간에 죽었을 때 이미 받은 커리큘럼까지 잃으므로 아이템 단위를 유지),
+        drain_spool처럼 여러 아이템을 모아서 커밋하면 그 묶음 전체가 한 번에 기록됩니다.
+        """
+        if self.pending_events:
+            self.write_lecture_events(self.pending_events)
+            self.pending_events = []
+        if self.pending_snapshots:
+            self.write_progress_snapshots(list(self.pending_snapshots.values()))
+            self.pending_snapshots = {}
+        self.connection.commit()
+
+    def rollback(self):
+        """커밋하지 않은 작업과 모아둔 이벤트/스냅샷 버림"""
+        self.pending_events = []
+        self.pending_snapshots = {}
+        self.connection.rollback()
+
+    async def process_item(self, item, spider):
+        """아이템 처리 및 DB 저장
+
+        DB 연결이 끊어지면 backoff 후 다시 연결하여 같은 아이템 저장을 처음부터 재실행합니다.
+        아이템 하나의 저장은 한 트랜잭션이라 실패 시 롤백되므로 재실행해도 중복 저장되지 않습니다.
+        """
+        if self.spool:
+            self.spool.append(item)
+            self._inc('mysql/spooled')
+            self.crawled_course_id = None  # 저장하지 못한 강의가 있으므로 정리하지 않음
+            return item
+
+        outage_started = None
+        attempt = 0
+
+        while True:
+            try:
+                if self.connection is None:
+                    self.connect()
+                started = time.monotonic()
+                self.save_item(item)
+                observe(self.stats, 'db_write_seconds', time.monotonic() - started)
+                break
+
+            except Exception as e:
+                if not is_connection_error(e):
+                    if self.connection:
+                        self.rollback()
+                    logging.error(f"Error saving item: {e}")
+                    import traceback
+                    logging.error(traceback.format_exc())
+                    self.crawled_course_id = None  # 저장하지 못한 강의가 있으므로 정리하지 않음
+                    break
+
+                self.drop_connection()
+                if outage_started is None:
+                    outage_started = time.monotonic()
+
+                if attempt >= self.retry_times:
+                    logging.error(f"MySQL unavailable, giving up on item after {attempt} retries: {e}")
+                    self._inc('mysql/retry_gave_up')
+                    self.crawled_course_id = None  # 저장하지 못한 강의가 있으므로 정리하지 않음
+                    if self.spool_mode != 'off' and self.spool_dir:
+                        self.start_spooling(e)
+                        self.spool.append(item)
+                        self._inc('mysql/spooled')
+                    break
+
+                attempt += 1
+                delay = min(self.retry_backoff * 2 ** (attempt - 1), self.retry_backoff_max)
+                self._inc('mysql/retries')
+                logging.warning(f"MySQL connection lost ({e}), retry {attempt}/{self.retry_times} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        if outage_started is not None:
+            outage = round(time.monotonic() - outage_started, 3)
+            if self.stats is not None:
+                self.stats.inc_value('mysql/outage_seconds', outage)
+                self.stats.max_value('mysql/outage_max_seconds', outage)
+            if self.connection is not None:
+                logging.info(f"MySQL reconnected after {outage:.1f}s ({attempt} retries)")
 
-    def process_item(self, item, spider):
-        """아이템 처리 및 DB 저장"""
+        return item
+
+    def save_item(self, item, crawled_at=None, commit=True):
+        """아이템 하나를 한 트랜잭션으로 저장
+
+        crawled_at: 스풀에서 불러온 아이템의 크롤링 시각 (없으면 현재 시각)
+            completed_at, 완료 집계 날짜, 이벤트 시각, 스냅샷 기준일이 모두 이 시각 기준입니다.
+        commit: False이면 호출한 쪽이 여러 아이템을 모아서 커밋 (drain_spool)
+        """
         from course_scraper.items import CourseItem, LectureItem
 
-        try:
-            if isinstance(item, CourseItem):
-                # CourseItem 처리
-                url = item.get('url', '')
+        self.item_time = crawled_at or datetime.now()
+        self.latest_item_time = max(self.latest_item_time or self.item_time, self.item_time)
+        self.item_lecture_id = None
+
+        if isinstance(item, CourseItem):
+            # CourseItem 처리
+            url = item.get('url', '')
+            if item.get('platform', 'fastcampus') == 'fastcampus':
                 course_id = self.extract_course_id(url)
+            else:
+                # 인프런/Udemy는 플랫폼 구간으로 옮긴 아이템의 course_id 사용 (curriculum.platform_course_id)
+                course_id = item.get('course_id')
 
-                if not course_id:
-                    logging.warning(f"Cannot extract course_id from URL: {url}")
-                    return item
+            if not course_id:
+                logging.warning(f"Cannot extract course_id from URL: {url}")
+                return
 
-                # 강의 정보 저장
-                self.save_course(course_id, item)
+            # 이전 강의의 수집이 끝났으므로 이번에 나오지 않은 강의 행 정리
+            if self.prune_stale_lectures and self.crawled_course_id is not None:
+                self.prune_lectures(self.crawled_course_id, self.crawled_lecture_ids)
 
-                # 주간 진도 스냅샷 저장 (NEW)
-                self.save_progress_snapshot(course_id, item)
+            # 강의 정보 저장
+            self.save_course(course_id, item)
 
-                # 크롤링 로그 저장
-                self.save_crawl_log(course_id, 'success', None)
+            # 진도 스냅샷 (강의 정보와 같은 트랜잭션)
+            self.save_progress_snapshot(course_id, item)
 
-                self.connection.commit()
-                logging.info(f"Saved CourseItem: course_id {course_id}")
+            # 크롤링 로그 저장
+            self.save_crawl_log(course_id, 'success', None)
 
-            elif isinstance(item, LectureItem):
-                # LectureItem 처리
-                self.save_lecture_item(item)
-                self.connection.commit()
+        elif isinstance(item, LectureItem):
+            # LectureItem 처리
+            self.save_lecture_item(item)
 
-        except Exception as e:
-            self.connection.rollback()
-            logging.error(f"Error saving item: {e}")
-            import traceback
-            logging.error(traceback.format_exc())
+        else:
+            return
 
-        return item
+        if commit:
+            self.commit()
+
+        if self.prune_stale_lectures:
+            if isinstance(item, CourseItem):
+                self.crawled_course_id, self.crawled_lecture_ids = course_id, set()
+            elif isinstance(item, LectureItem) and self.item_lecture_id is not None:
+                self.crawled_lecture_ids.add(self.item_lecture_id)
+
+        if isinstance(item, CourseItem):
+            logging.debug("Saved CourseItem: course_id %s", course_id)
+
+    def _inc(self, key, count=1):
+        if self.stats is not None:
+            self.stats.inc_value(key, count)
 
     def extract_course_id(self, url):
         """URL에서 course_id 추출"""
@@ -114,9 +304,9 @@ class MySQLPipeline:
         sql = """
             INSERT INTO courses (
                 course_id, course_title, progress_rate, study_time,
-                total_lecture_time, url, display_order
+                total_lecture_time, url, display_order, platform
             ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s
+                %s, %s, %s, %s, %s, %s, %s, %s
             )
             ON DUPLICATE KEY UPDATE
                 course_title = VALUES(course_title),
@@ -135,7 +325,8 @@ class MySQLPipeline:
             item.get('study_time'),
             item.get('total_lecture_time'),
             item.get('url', ''),
-            item.get('display_order')
+            item.get('display_order'),
+            item.get('platform', 'fastcampus')
         )
 
         self.cursor.execute(sql, values)
@@ -154,7 +345,7 @@ class MySQLPipeline:
 
         # 먼저 기존 레코드가 있는지 확인 (course_id, section_number, chapter_number, lecture_number로 식별)
         check_sql = """
-            SELECT lecture_id, is_completed FROM lectures
+            SELECT lecture_id, is_completed, lecture_time, completed_at FROM lectures
             WHERE course_id = %s
               AND section_number = %s
               AND (chapter_number = %s OR (chapter_number IS NULL AND %s IS NULL))
@@ -174,57 +365,48 @@ class MySQLPipeline:
 
         if existing:
             # UPDATE
+            self.item_lecture_id = existing['lecture_id']
             old_is_completed = existing['is_completed']
 
-            # completed_at 로직
-            # False → True: 방금 완료함 → completed_at = NOW()
+            # completed_at 로직 (크롤링 시각 = self.item_time)
+            # False → True: 방금 완료함 → completed_at = 크롤링 시각
             # True → False: 다시 미완료로 → completed_at = NULL
             # True → True: 이미 완료 → completed_at 유지 (업데이트 안함)
             # False → False: 계속 미완료 → completed_at 유지 (NULL)
+            set_completed_at = False
+            completed_at = None
 
             if old_is_completed == False and new_is_completed == True:
                 # 방금 완료한 경우
-                update_sql = """
-                    UPDATE lectures SET
-                        section_title = %s,
-                        chapter_number = %s,
-                        chapter_title = %s,
-                        lecture_title = %s,
-                        lecture_time = %s,
-                        is_completed = %s,
-                        sort_order = %s,
-                        completed_at = NOW()
-                    WHERE lecture_id = %s
-                """
-                logging.info(f"✓ Lecture completed: {item.get('lecture_title')}")
+                set_completed_at, completed_at = True, self.item_time
+                if self.log_sampler():
+                    logging.debug("Lecture completed: %s", item.get('lecture_title'))
+                self.update_completion_rollups(course_id, completed_at, 1, item.get('lecture_time'))
+                self.add_lecture_event(course_id, existing['lecture_id'], 'completed', item.get('lecture_time'))
             elif old_is_completed == True and new_is_completed == False:
                 # 다시 미완료로 변경
-                update_sql = """
-                    UPDATE lectures SET
-                        section_title = %s,
-                        chapter_number = %s,
-                        chapter_title = %s,
-                        lecture_title = %s,
-                        lecture_time = %s,
-                        is_completed = %s,
-                        sort_order = %s,
-                        completed_at = NULL
-                    WHERE lecture_id = %s
-                """
-            else:
-                # 상태 변화 없음 (completed_at 건드리지 않음)
-                update_sql = """
-                    UPDATE lectures SET
-                        section_title = %s,
-                        chapter_number = %s,
-                        chapter_title = %s,
-                        lecture_title = %s,
-                        lecture_time = %s,
-                        is_completed = %s,
-                        sort_order = %s
-                    WHERE lecture_id = %s
-                """
-
+                set_completed_at = True
+                # 이전 완료 날짜의 집계에서 제외
+                if existing['completed_at']:
+                    self.update_completion_rollups(course_id, existing['completed_at'], -1,
+                                                   -float(existing['lecture_time'] or 0))
+                self.add_lecture_event(course_id, existing['lecture_id'], 'uncompleted', item.get('lecture_time'))
+            elif new_is_completed and existing['completed_at']:
+                # 이미 완료한 강의의 시간이 바뀌면 완료 날짜의 집계 시간도 같이 보정
+                delta = float(item.get('lecture_time') or 0) - float(existing['lecture_time'] or 0)
+                if delta:
+                    self.update_completion_rollups(course_id, existing['completed_at'], 0, delta)
+
+            update_sql = """
+                UPDATE lectures SET
+                    section_title = %s,
+                    chapter_number = %s,
+                    chapter_title = %s,
+                    lecture_title = %s,
+                    lecture_time = %s,
+                    is_completed = %s,
+                    sort_order = %s
+            """
             values = (
                 item.get('section_title'),
                 item.get('chapter_number'),
@@ -233,9 +415,11 @@ class MySQLPipeline:
                 item.get('lecture_time'),
                 new_is_completed,
                 item.get('sort_order'),
-                existing['lecture_id']
             )
-            self.cursor.execute(update_sql, values)
+            if set_completed_at:
+                update_sql += ", completed_at = %s"
+                values += (completed_at,)
+            self.cursor.execute(update_sql + " WHERE lecture_id = %s", values + (existing['lecture_id'],))
         else:
             # INSERT
             # 신규 삽입 시 is_completed가 True이면 completed_at도 설정
@@ -260,9 +444,76 @@ class MySQLPipeline:
                 item.get('lecture_time'),
                 new_is_completed,
                 item.get('sort_order'),
-                datetime.now() if new_is_completed else None
+                self.item_time if new_is_completed else None
             )
             self.cursor.execute(insert_sql, values)
+            self.item_lecture_id = self.cursor.lastrowid
+            if new_is_completed:
+                self.update_completion_rollups(course_id, values[-1], 1, item.get('lecture_time'))
+                self.add_lecture_event(course_id, self.cursor.lastrowid, 'completed', item.get('lecture_time'))
+
+    def add_lecture_event(self, course_id, lecture_id, event_type, lecture_time):
+        """완료 상태 변경 이벤트 추가 (commit()이 lectures 갱신과 같은 트랜잭션에서 lecture_events에 기록)"""
+        self.pending_events.append((course_id, lecture_id, event_type, lecture_time, self.item_time))
+
+    def write_lecture_events(self, events):
+        """lecture_events INSERT (executemany가 multi-row INSERT로 보냄)"""
+        sql = """
+            INSERT INTO lecture_events (
+                course_id, lecture_id, event_type, lecture_time, occurred_at
+            ) VALUES (
+                %s, %s, %s, %s, %s
+            )
+        """
+        self.cursor.executemany(sql, events)
+        self._inc('mysql/lecture_events', len(events))
+
+    def update_completion_rollups(self, course_id, completed_at, count, minutes):
+        """일별/주별 완료 집계 테이블 갱신
+
+        count: 완료 +1, 완료 취소/삭제 -1, 시간만 보정 0
+        minutes: 더할 강의 시간(분, 빼려면 음수)
+        집계 시간은 항상 lectures 행의 현재 lecture_time 합계와 같게 유지합니다 (backfill_rollups와 같은 기준).
+        """
+        completion_date = completed_at.date() if isinstance(completed_at, datetime) else completed_at
+        week_start = completion_date - timedelta(days=completion_date.weekday())
+        minutes = minutes or 0
+
+        for table, key_column, key in (
+            ('lecture_completion_daily', 'completion_date', completion_date),
+            ('lecture_completion_weekly', 'week_start', week_start),
+        ):
+            self.cursor.execute(f"""
+                INSERT INTO {table} ({key_column}, course_id, completed_count, completed_minutes)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    completed_count = completed_count + VALUES(completed_count),
+                    completed_minutes = completed_minutes + VALUES(completed_minutes)
+            """, (key, course_id, count, minutes))
+
+    def prune_lectures(self, course_id, lecture_ids):
+        """강의를 다시 수집한 뒤 이번 수집에 나오지 않은 lectures 행 삭제 (완료한 행은 집계에서도 제외)
+
+        강의 목록을 하나도 저장하지 못했으면 (추출 실패 등) 아무것도 지우지 않습니다.
+        """
+        if not lecture_ids:
+            return
+        self.cursor.execute(
+            "SELECT lecture_id, lecture_time, completed_at FROM lectures WHERE course_id = %s", (course_id,)
+        )
+        stale = [row for row in self.cursor.fetchall() if row['lecture_id'] not in lecture_ids]
+        if not stale:
+            return
+
+        for row in stale:
+            if row['completed_at']:
+                self.update_completion_rollups(course_id, row['completed_at'], -1, -float(row['lecture_time'] or 0))
+        stale_ids = [row['lecture_id'] for row in stale]
+        self.cursor.execute(
+            f"DELETE FROM lectures WHERE lecture_id IN ({', '.join(['%s'] * len(stale_ids))})", stale_ids
+        )
+        self._inc('mysql/lectures_pruned', len(stale_ids))
+        logging.info(f"Pruned {len(stale_ids)} stale lectures of course {course_id}")
 
     def save_lectures(self, course_id, curriculum):
         """강의 목차 저장"""
@@ -287,9 +538,9 @@ class MySQLPipeline:
             lessons = section.get('lessons', [])
 
             for lecture_idx, lesson in enumerate(lessons, 1):
-                # 시간 문자열을 분 단위로 변환 (예: "15분", "1시간 30분" -> 분)
+                # 시간 문자열을 분 단위로 변환 (예: "15분", "1시간 30분" -> 분, 알 수 없으면 NULL)
                 lecture_time_str = lesson.get('duration', '')
-                lecture_time = self.parse_duration(lecture_time_str)
+                lecture_time = parse_duration(lecture_time_str) or None
 
                 values = (
                     course_id,
@@ -305,48 +556,6 @@ class MySQLPipeline:
                 self.cursor.execute(insert_sql, values)
                 sort_order += 1
 
-    def parse_duration(self, duration_str):
-        """시간 문자열을 분 단위로 변환"""
-        if not duration_str:
-            return None
-
-        try:
-            duration_str = duration_str.strip()
-            total_minutes = 0
-
-            # "HH:MM:SS" 또는 "MM:SS" 형식 (예: "2:46:10" 또는 "46:10")
-            if ':' in duration_str:
-                parts = duration_str.split(':')
-                if len(parts) == 3:  # HH:MM:SS 형식
-                    hours = int(parts[0])
-                    minutes = int(parts[1])
-                    seconds = int(parts[2])
-                    total_minutes = hours * 60 + minutes + round(seconds / 60, 2)
-                elif len(parts) == 2:  # MM:SS 형식
-                    minutes = int(parts[0])
-                    seconds = int(parts[1])
-                    total_minutes = minutes + round(seconds / 60, 2)
-            # "1시간 30분" 형식
-            elif '시간' in duration_str:
-                parts = duration_str.split('시간')
-                hours = int(parts[0].strip())
-                total_minutes += hours * 60
-
-                if len(parts) > 1 and '분' in parts[1]:
-                    minutes = int(parts[1].replace('분', '').strip())
-                    total_minutes += minutes
-            # "30분" 형식
-            elif '분' in duration_str:
-                minutes = int(duration_str.replace('분', '').strip())
-                total_minutes = minutes
-            # 숫자만 있는 경우 (분으로 가정)
-            elif duration_str.isdigit():
-                total_minutes = int(duration_str)
-
-            return total_minutes if total_minutes > 0 else None
-
-        except:
-            return None
 
     def save_crawl_log(self, course_id, status, error_message):
         """크롤링 로그 저장"""
@@ -361,37 +570,83 @@ class MySQLPipeline:
         self.cursor.execute(sql, (course_id, status, error_message))
 
     def save_progress_snapshot(self, course_id, item):
-        """주간 진도 스냅샷 저장 (NEW)"""
-        try:
+        """진도 스냅샷을 현재 트랜잭션에 추가 (commit()에서 기록하므로 중간에 죽거나 스풀로 넘어가도 잃지 않음)
+
+        SNAPSHOT_GRANULARITY가 weekly면 그 주의 월요일, daily면 크롤링한 날짜를 기준일로 하며
+        같은 기준일에 여러 번 크롤링하면 마지막 값만 남습니다.
+        """
+        today = self.item_time.date()
+        if self.snapshot_granularity == 'daily':
+            snapshot_date = today
+        else:
             # 현재 주의 월요일 날짜 계산 (스냅샷 기준일)
-            today = date.today()
             days_since_monday = today.weekday()  # 월요일=0, 일요일=6
             snapshot_date = today - timedelta(days=days_since_monday)
 
-            sql = """
-                INSERT INTO course_progress_snapshots (
-                    course_id, snapshot_date, progress_rate,
-                    study_time, total_lecture_time
-                ) VALUES (
-                    %s, %s, %s, %s, %s
-                )
-                ON DUPLICATE KEY UPDATE
-                    progress_rate = VALUES(progress_rate),
-                    study_time = VALUES(study_time),
-                    total_lecture_time = VALUES(total_lecture_time)
-            """
+        self.pending_snapshots[(course_id, snapshot_date)] = (
+            course_id,
+            snapshot_date,
+            item.get('progress_rate'),
+            item.get('study_time'),
+            item.get('total_lecture_time')
+        )
 
-            values = (
-                course_id,
-                snapshot_date,
-                item.get('progress_rate'),
-                item.get('study_time'),
-                item.get('total_lecture_time')
+    def write_progress_snapshots(self, snapshots):
+        """진도 스냅샷 multi-row UPSERT (같은 기준일이면 마지막 값으로 덮어씀)"""
+        sql = """
+            INSERT INTO course_progress_snapshots (
+                course_id, snapshot_date, progress_rate,
+                study_time, total_lecture_time
+            ) VALUES (
+                %s, %s, %s, %s, %s
             )
+            ON DUPLICATE KEY UPDATE
+                progress_rate = VALUES(progress_rate),
+                study_time = VALUES(study_time),
+                total_lecture_time = VALUES(total_lecture_time)
+        """
+        self.cursor.executemany(sql, snapshots)
+        self._inc('mysql/snapshots', len(snapshots))
 
-            self.cursor.execute(sql, values)
-            logging.info(f"Saved snapshot for course_id {course_id} on {snapshot_date}")
+    def downsample_snapshots(self):
+        """보관 기간(SNAPSHOT_RETENTION_DAYS)이 지난 일별 스냅샷을 주별 스냅샷으로 합침
 
-        except Exception as e:
-            logging.warning(f"Failed to save snapshot for course_id {course_id}: {e}")
-            # 스냅샷 저장 실패해도 전체 프로세스는 계속 진행
+        주마다 마지막 스냅샷 값을 그 주 월요일 행에 저장하고 나머지 요일 행은 삭제합니다.
+        (주별 크롤링과 같은 형태가 되므로 analysis_queries.sql을 그대로 사용)
+        보관 기간 기준일이 속한 주는 아직 다 차지 않았으므로 그 전 주까지만 합칩니다.
+        기준일은 스냅샷 날짜와 같은 시계(저장한 아이템의 크롤링 시각)로 정하므로, drain_spool이
+        예전 크롤링의 스냅샷을 저장하는 중이어도 그 시점 기준으로 아직 보관 기간인 행은 합치지 않습니다.
+        """
+        reference = (self.latest_item_time or datetime.now()).date()
+        cutoff = reference - timedelta(days=self.snapshot_retention_days)
+        cutoff -= timedelta(days=cutoff.weekday())
+
+        merge_sql = """
+            INSERT INTO course_progress_snapshots (
+                course_id, snapshot_date, progress_rate,
+                study_time, total_lecture_time
+            )
+            SELECT s.course_id, DATE_SUB(s.snapshot_date, INTERVAL WEEKDAY(s.snapshot_date) DAY),
+                   s.progress_rate, s.study_time, s.total_lecture_time
+            FROM course_progress_snapshots s
+            JOIN (
+                SELECT course_id, MAX(snapshot_date) AS last_date
+                FROM course_progress_snapshots
+                WHERE snapshot_date < %s
+                GROUP BY course_id, DATE_SUB(snapshot_date, INTERVAL WEEKDAY(snapshot_date) DAY)
+            ) last ON s.course_id = last.course_id AND s.snapshot_date = last.last_date
+            WHERE WEEKDAY(s.snapshot_date) <> 0
+            ON DUPLICATE KEY UPDATE
+                progress_rate = VALUES(progress_rate),
+                study_time = VALUES(study_time),
+                total_lecture_time = VALUES(total_lecture_time)
+        """
+        self.cursor.execute(merge_sql, (cutoff,))
+        self.cursor.execute("""
+            DELETE FROM course_progress_snapshots
+            WHERE snapshot_date < %s
+              AND WEEKDAY(snapshot_date) <> 0
+        """, (cutoff,))
+        if self.cursor.rowcount:
+            logging.info(f"Downsampled {self.cursor.rowcount} daily snapshots before {cutoff} into weekly rows")
+        self._inc('mysql/snapshots_downsampled', self.cursor.rowcount)
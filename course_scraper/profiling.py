@@ -0,0 +1,286 @@
+"""
+콜백별 CPU 프로파일 (PROFILE_ENABLED = True일 때만 동작)
+
+spider 콜백(PROFILE_CALLBACKS)과 파이프라인 메서드(PROFILE_PIPELINE_METHODS)를 cProfile로 감싸고,
+크롤링이 끝나면 실행 디렉터리(PROFILE_DIR/<spider>-<시각>/)에 이름별로 저장합니다.
+
+- <이름>.prof: pstats 파일 (python -m pstats, snakeviz 등으로 확인)
+- <이름>.collapsed: flame graph용 "a;b;c 마이크로초" 형식 (flamegraph.pl, speedscope 등에 입력)
+- slow_callbacks.log: PROFILE_SLOW_CALLBACK_MS보다 오래 이벤트 루프를 붙잡은 콜백과 그 시점의 스택
+
+async 콜백은 await 사이의 동기 구간에서만 프로파일러를 켜므로, 기다리는 동안 다른 요청이 쓴 CPU는 섞이지 않습니다.
+감싼 콜백 안에서 다른 감싼 콜백을 부르면 (parse → extract_curriculum_playwright) 그 시간은 안쪽 프로파일에만 기록됩니다.
+"""
+
+import asyncio
+import cProfile
+import functools
+import inspect
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from datetime import datetime
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+logger = logging.getLogger(__name__)
+
+
+class _Forward:
+    """감싼 코루틴이 넘긴 값(Future 등)을 그대로 이벤트 루프에 전달"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __await__(self):
+        return (yield self.value)
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats, root):
+    """pstats의 호출 관계로 flame graph용 스택별 시간(마이크로초) 추정
+
+    cProfile은 호출 스택 전체가 아니라 호출자-피호출자 관계만 기록하므로,
+    함수의 시간을 호출자별 누적 시간 비율로 나눠 각 스택에 배분합니다.
+    모든 스택은 root(콜백 이름)에서 시작합니다.
+    """
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, caller_stats in callers.items():
+            callees[caller][func] = caller_stats[3]
+
+    stacks = defaultdict(float)
+
+    def walk(func, stack, ratio):
+        # 1마이크로초 미만으로 배분되는 경로는 생략 (호출 관계가 복잡해도 탐색이 끝나도록)
+        if stats[func][3] * ratio < 0.000001 or len(stack) > 100:
+            return
+        stack = stack + (func,)
+        own_time = stats[func][2] * ratio
+        if own_time > 0:
+            stacks[';'.join([root] + [_label(frame) for frame in stack])] += own_time
+        for callee, edge_time in callees[func].items():
+            callee_total = stats[callee][3]
+            if callee in stack or not callee_total or not edge_time:
+                continue
+            walk(callee, stack, ratio * min(edge_time / callee_total, 1.0))
+
+    for func, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            walk(func, (), 1.0)
+
+    return {stack: int(seconds * 1_000_000) for stack, seconds in stacks.items() if seconds >= 0.000001}
+
+
+class LoopStallMonitor(threading.Thread):
+    """이벤트 루프가 threshold 이상 멈추면 그 순간 루프 스레드의 스택을 기록"""
+
+    def __init__(self, loop, threshold, output):
+        super().__init__(name='loop-stall-monitor', daemon=True)
+        self.loop = loop
+        self.threshold = threshold
+        self.output = output
+        self.loop_thread_id = threading.get_ident()
+        self.last_tick = time.monotonic()
+        self.reported = False
+        self.stopped = threading.Event()
+
+    def tick(self):
+        """루프 스레드에서 주기적으로 실행 (마지막 실행 시각 갱신)"""
+        self.last_tick = time.monotonic()
+        self.reported = False
+        if not self.stopped.is_set():
+            self.loop.call_later(self.threshold / 4, self.tick)
+
+    def run(self):
+        while not self.stopped.wait(self.threshold / 2):
+            stalled = time.monotonic() - self.last_tick
+            if stalled < self.threshold or self.reported:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            self.reported = True
+            self.output.write(f"[{datetime.now():%H:%M:%S}] Event loop blocked for {stalled * 1000:.0f}ms+\n")
+            self.output.write(''.join(traceback.format_stack(frame)))
+            self.output.write('\n')
+            self.output.flush()
+
+
+class CallbackProfiler:
+    """spider 콜백 / 파이프라인 메서드별 cProfile 확장"""
+
+    def __init__(self, crawler):
+        settings = crawler.settings
+        self.crawler = crawler
+        self.profile_dir = settings.get('PROFILE_DIR')
+        self.callbacks = settings.getlist('PROFILE_CALLBACKS')
+        self.pipeline_methods = settings.getlist('PROFILE_PIPELINE_METHODS')
+        self.slow_callback = settings.getfloat('PROFILE_SLOW_CALLBACK_MS', 100) / 1000
+        self.profiles = defaultdict(cProfile.Profile)
+        self.calls = defaultdict(int)
+        self.active = []  # 현재 켜진 프로파일 이름 (중첩 호출 시 바깥 프로파일은 잠시 끔)
+        self.run_dir = None
+        self.slow_log = None
+        self.slow_handler = None
+        self.stall_monitor = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('PROFILE_ENABLED'):
+            raise NotConfigured
+        ext = cls(crawler)
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.run_dir = os.path.join(self.profile_dir, f"{spider.name}-{datetime.now():%Y%m%d-%H%M%S}")
+        os.makedirs(self.run_dir, exist_ok=True)
+
+        for name in self.callbacks:
+            if hasattr(spider, name):
+                setattr(spider, name, self.wrap(name, getattr(spider, name)))
+
+        for pipeline in self.crawler.engine.scraper.itemproc.middlewares:
+            for name in self.pipeline_methods:
+                if hasattr(pipeline, name):
+                    setattr(pipeline, name, self.wrap(f"{type(pipeline).__name__}.{name}", getattr(pipeline, name)))
+
+        self.start_slow_callback_capture()
+        logger.info(f"Profiling {', '.join(self.callbacks + self.pipeline_methods)} → {self.run_dir}")
+
+    def start_slow_callback_capture(self):
+        """asyncio 느린 콜백 경고(디버그 모드)와 루프 정지 시점의 스택을 slow_callbacks.log에 기록"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self.slow_log = open(os.path.join(self.run_dir, 'slow_callbacks.log'), 'w', encoding='utf-8')
+        loop.set_debug(True)
+        loop.slow_callback_duration = self.slow_callback
+
+        self.slow_handler = logging.StreamHandler(self.slow_log)
+        self.slow_handler.setLevel(logging.WARNING)
+        self.slow_handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%H:%M:%S'))
+        logging.getLogger('asyncio').addHandler(self.slow_handler)
+
+        self.stall_monitor = LoopStallMonitor(loop, self.slow_callback, self.slow_log)
+        self.stall_monitor.tick()
+        self.stall_monitor.start()
+
+    def _start(self, name):
+        if self.active:
+            self.profiles[self.active[-1]].disable()
+        self.active.append(name)
+        self.profiles[name].enable()
+
+    def _stop(self, name):
+        self.profiles[name].disable()
+        self.active.pop()
+        if self.active:
+            self.profiles[self.active[-1]].enable()
+
+    def _call(self, name, func, *args, **kwargs):
+        self._start(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._stop(name)
+
+    async def _drive(self, name, awaitable):
+        """코루틴을 한 단계씩 실행하며 동기 구간만 프로파일"""
+        value, error = None, None
+        while True:
+            self._start(name)
+            try:
+                if error is not None:
+                    yielded = awaitable.throw(error)
+                else:
+                    yielded = awaitable.send(value)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._stop(name)
+
+            try:
+                value, error = await _Forward(yielded), None
+            except BaseException as e:
+                value, error = None, e
+
+    def wrap(self, name, func):
+        """함수 종류(async generator / 코루틴 / generator / 일반)에 맞게 프로파일 래퍼 생성"""
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                self.calls[name] += 1
+                agen = func(*args, **kwargs)
+                try:
+                    while True:
+                        try:
+                            item = await self._drive(name, agen.__anext__())
+                        except StopAsyncIteration:
+                            return
+                        yield item
+                finally:
+                    await agen.aclose()
+
+        elif inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                self.calls[name] += 1
+                return await self._drive(name, func(*args, **kwargs))
+
+        elif inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self.calls[name] += 1
+                gen = func(*args, **kwargs)
+                while True:
+                    try:
+                        item = self._call(name, next, gen)
+                    except StopIteration:
+                        return
+                    yield item
+
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self.calls[name] += 1
+                return self._call(name, func, *args, **kwargs)
+
+        return wrapper
+
+    def spider_closed(self, spider):
+        if self.stall_monitor:
+            self.stall_monitor.stopped.set()
+        if self.slow_handler:
+            logging.getLogger('asyncio').removeHandler(self.slow_handler)
+        if self.slow_log:
+            self.slow_log.close()
+
+        for name, profile in self.profiles.items():
+            try:
+                stats = pstats.Stats(profile)
+            except TypeError:  # 기록된 호출이 없음
+                continue
+            stats.dump_stats(os.path.join(self.run_dir, f"{name}.prof"))
+            with open(os.path.join(self.run_dir, f"{name}.collapsed"), 'w', encoding='utf-8') as f:
+                for stack, micros in sorted(collapsed_stacks(stats.stats, name).items()):
+                    f.write(f"{stack} {micros}\n")
+            logger.info(f"Profile {name}: {self.calls[name]} calls, {stats.total_tt:.2f}s")
+
+        logger.info(f"Profiles saved to {self.run_dir}")
@@ -0,0 +1,85 @@
+"""
+강의실 상단 요약 영역(수강률 / 수강시간 / 강의시간) 추출
+
+페이지 전체 텍스트(inner_text('body'))를 가져오는 대신 evaluate 한 번으로
+요약 위젯의 텍스트만 가져오고, 미리 컴파일한 패턴 하나로 세 값을 한 번에 찾습니다.
+"""
+
+import re
+
+
+# "수강률 12.5%", "수강시간 1:02:03" 또는 "12:30", "강의시간 23:08:50"
+PROGRESS_PATTERN = re.compile(
+    r'수강률\s*(?P<rate>\d+(?:\.\d+)?)\s*%'
+    r'|수강시간\s*(?P<study_1>\d+):(?P<study_2>\d+)(?::(?P<study_3>\d+))?'
+    r'|강의시간\s*(?P<total_h>\d+):(?P<total_m>\d+):(?P<total_s>\d+)'
+)
+
+# '수강률' 텍스트 노드에서 부모로 올라가며 세 항목을 모두 포함하는 가장 작은 요소의 텍스트 반환
+# (찾지 못하면 body 전체 텍스트)
+SUMMARY_TEXT_JS = '''
+() => {
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        if (!node.nodeValue.includes('수강률')) continue;
+        let el = node.parentElement;
+        while (el && el !== document.body) {
+            const text = el.textContent || '';
+            if (text.includes('수강시간') && text.includes('강의시간')) return el.innerText;
+            el = el.parentElement;
+        }
+    }
+    return document.body.innerText;
+}
+'''
+
+
+def parse_progress_text(text):
+    """요약 텍스트에서 progress_rate, study_time(분), total_lecture_time(분) 추출
+
+    값이 없으면 각각 0.0 / 0 / 0 을 반환합니다.
+    수강시간은 "H:M:S" 또는 "M:S", 강의시간은 "H:M:S" 형식입니다.
+    """
+    result = {
+        'progress_rate': 0.0,
+        'study_time': 0,
+        'total_lecture_time': 0,
+    }
+    found = set()
+
+    for match in PROGRESS_PATTERN.finditer(text or ''):
+        if match.group('rate') is not None:
+            if 'rate' not in found:
+                found.add('rate')
+                result['progress_rate'] = float(match.group('rate'))
+
+        elif match.group('study_1') is not None:
+            if 'study' not in found:
+                found.add('study')
+                first = int(match.group('study_1'))
+                second = int(match.group('study_2'))
+                third = match.group('study_3')
+
+                if third is not None:  # H:M:S 형식
+                    result['study_time'] = first * 60 + second + round(int(third) / 60, 2)
+                else:  # M:S 형식 (콜론이 1개만 있으면 분:초로 간주)
+                    result['study_time'] = first + round(second / 60, 2)
+
+        elif 'total' not in found:
+            found.add('total')
+            hours = int(match.group('total_h'))
+            minutes = int(match.group('total_m'))
+            seconds = int(match.group('total_s'))
+            result['total_lecture_time'] = hours * 60 + minutes + (seconds / 60)
+
+        if len(found) == 3:
+            break
+
+    return result
+
+
+async def extract_progress(page):
+    """강의실 페이지에서 수강률/수강시간/강의시간을 한 번의 evaluate 호출로 추출"""
+    text = await page.evaluate(SUMMARY_TEXT_JS)
+    return parse_progress_text(text)
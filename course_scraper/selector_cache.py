@@ -0,0 +1,87 @@
+"""
+로그인 화면 요소 찾기 (선택자 후보 한 번에 확인 + 마지막으로 성공한 선택자 캐시)
+
+카카오/FastCampus 화면이 바뀔 때를 대비해 단계마다 선택자 후보 목록을 둡니다.
+후보를 하나씩 timeout까지 기다리면 앞쪽 후보가 빗나갈 때마다 몇 초씩 걸리므로,
+모든 후보를 합친 선택자("a:visible, b:visible, ...")로 한 번만 기다린 뒤 실제로 보이는 후보를 고릅니다.
+단계별로 마지막에 성공한 선택자는 LOGIN_SELECTOR_CACHE 파일에 저장하여 다음 실행에서 가장 먼저 확인합니다.
+"""
+
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def visible(selector):
+    """화면에 보이는 요소만 고르는 선택자"""
+    return f'{selector}:visible'
+
+
+class SelectorCache:
+    """단계별 마지막 성공 선택자와 이번 실행의 단계별 탐색 시간 (path가 없으면 메모리에만 보관)"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.winners = {}
+        self.timings = {}  # 단계 → (선택자 또는 None, 걸린 시간 ms)
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.winners = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read selector cache {path}: {e}")
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(settings.get('LOGIN_SELECTOR_CACHE') if settings else None)
+
+    def order(self, step, candidates):
+        """캐시된 선택자를 맨 앞으로 (후보 목록에 없는 선택자는 무시)"""
+        winner = self.winners.get(step)
+        if winner in candidates:
+            return [winner] + [candidate for candidate in candidates if candidate != winner]
+        return list(candidates)
+
+    async def resolve(self, page, step, candidates, timeout):
+        """후보 중 화면에 보이는 선택자 반환 (캐시된 선택자 → 목록 순서로 우선), 없으면 None"""
+        ordered = self.order(step, candidates)
+        started = time.monotonic()
+        selector = None
+
+        try:
+            # 후보 전체를 한 번에 기다림 (후보마다 timeout을 쓰지 않음)
+            await page.locator(', '.join(visible(candidate) for candidate in ordered)).first.wait_for(
+                state='visible', timeout=timeout
+            )
+            for candidate in ordered:
+                if await page.locator(visible(candidate)).count():
+                    selector = candidate
+                    break
+        except Exception:
+            pass
+
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        self.timings[step] = (selector, elapsed_ms)
+        if selector and self.winners.get(step) != selector:
+            self.winners[step] = selector
+            self.save()
+        return selector
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.winners, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not save selector cache {self.path}: {e}")
+
+    def log_summary(self, log):
+        """단계별 선택자 탐색 시간 출력"""
+        for step, (selector, elapsed_ms) in self.timings.items():
+            log.info(f"  Selector {step}: {selector or 'not found'} ({elapsed_ms}ms)")
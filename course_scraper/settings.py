@@ -59,6 +59,12 @@ ROBOTSTXT_OBEY = True
 #EXTENSIONS = {
 #    "scrapy.extensions.telnet.TelnetConsole": None,
 #}
+EXTENSIONS = {
+    "course_scraper.logs.StructuredLogging": 0,
+    "course_scraper.profiling.CallbackProfiler": 500,
+    "course_scraper.metrics.CrawlMetrics": 500,
+    "course_scraper.watchdog.BrowserWatchdog": 500,
+}
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
@@ -93,46 +99,112 @@ TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
 FEED_EXPORT_ENCODING = "utf-8"
 
 # MySQL Database Settings
-# credentials.py에서 로그인 정보 가져오기
-import sys
 import os
 
-# credentials.py 직접 로드
 _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-_credentials_path = os.path.join(_project_root, 'credentials.py')
-
-# 기본값
-MYSQL_HOST = 'localhost'
-MYSQL_PORT = 3306
-MYSQL_USER = 'root'
-MYSQL_PASSWORD = ''
-MYSQL_DATABASE = 'crawler'
-KAKAO_EMAIL = ''
-KAKAO_PASSWORD = ''
-
-if os.path.exists(_credentials_path):
-    with open(_credentials_path, 'r', encoding='utf-8') as f:
-        _exec_globals = {}
-        exec(f.read(), _exec_globals)
-        MYSQL_HOST = _exec_globals.get('MYSQL_HOST', MYSQL_HOST)
-        MYSQL_PORT = _exec_globals.get('MYSQL_PORT', MYSQL_PORT)
-        MYSQL_USER = _exec_globals.get('MYSQL_USER', MYSQL_USER)
-        MYSQL_PASSWORD = _exec_globals.get('MYSQL_PASSWORD', MYSQL_PASSWORD)
-        MYSQL_DATABASE = _exec_globals.get('MYSQL_DATABASE', MYSQL_DATABASE)
-        KAKAO_EMAIL = _exec_globals.get('KAKAO_EMAIL', KAKAO_EMAIL)
-        KAKAO_PASSWORD = _exec_globals.get('KAKAO_PASSWORD', KAKAO_PASSWORD)
-else:
-    print("WARNING: credentials.py not found. Please create it from credentials_example.py")
+
+# 로그인 / DB 접속 정보 (KAKAO_EMAIL, KAKAO_PASSWORD, MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE)
+# 여기서 credentials.py를 읽지 않고 값이 필요할 때 -s 옵션 → 환경변수 → credentials.py 순서로 찾습니다.
+# (course_scraper/credentials.py 참고, scrapy list 등 로그인이 필요 없는 명령은 파일을 열지 않음)
+
+# 로그 형식 / 샘플링 (spider의 custom_settings 또는 -s 옵션으로 변경 가능)
+# 강의·섹션 단위 로그는 DEBUG로만 남기고 강의마다 요약 한 줄을 INFO로 남깁니다.
+LOG_JSON = os.environ.get('LOG_JSON', 'false').lower() == 'true'  # True면 한 줄에 JSON 하나 (요약 필드 포함)
+LOG_ITEM_SAMPLE_EVERY = 100  # 강의 단위 DEBUG 로그는 N개마다 하나만 (1이면 모두, 0이면 출력 안 함)
+
+# 콜백별 CPU 프로파일 (PROFILE=true scrapy crawl ... 또는 -s PROFILE_ENABLED=True)
+# 실행마다 PROFILE_DIR/<spider>-<시각>/에 콜백별 .prof(pstats) / .collapsed(flame graph)와 slow_callbacks.log 저장
+PROFILE_ENABLED = os.environ.get('PROFILE', 'false').lower() == 'true'
+PROFILE_DIR = os.path.join(_project_root, 'profiles')
+PROFILE_CALLBACKS = ['login', 'parse', 'extract_curriculum_playwright']
+PROFILE_PIPELINE_METHODS = ['save_item']
+PROFILE_SLOW_CALLBACK_MS = 100  # 이벤트 루프를 이 시간 이상 붙잡은 콜백은 스택과 함께 기록
+
+# 크롤링 상태 지표 - Prometheus 텍스트 형식 (METRICS=true scrapy crawl ... 또는 -s METRICS_ENABLED=True)
+METRICS_ENABLED = os.environ.get('METRICS', 'false').lower() == 'true'
+METRICS_PORT = int(os.environ.get('METRICS_PORT', 9410))  # http://<host>:<port>/metrics (0이면 HTTP 제공 안 함)
+METRICS_TEXTFILE = os.environ.get('METRICS_TEXTFILE', '')  # node_exporter textfile collector 경로 (예: /var/lib/node_exporter/textfile/course_scraper.prom)
+METRICS_INTERVAL = 15  # 지표 갱신 주기(초)
+
+# MySQL 커넥션 풀 (pipeline과 spider가 crawler 하나당 풀 하나를 공유)
+MYSQL_POOL_SIZE = 2  # 최대 연결 수 (pipeline 1 + spider 조회용 1)
+MYSQL_POOL_TIMEOUT = 0  # 모든 연결이 사용 중일 때 대기할 시간(초, 0이면 바로 오류 - reactor 스레드에서 기다리면 크롤링이 멈춤)
+MYSQL_POOL_PING_INTERVAL = 60  # 이 시간(초) 이상 쉬던 연결은 빌려주기 전에 ping으로 확인
+
+# 저장 중 DB 연결이 끊어졌을 때 재연결 후 같은 아이템 저장을 재시도
+MYSQL_RETRY_TIMES = 5  # 최대 재시도 횟수 (넘으면 해당 아이템은 건너뜀)
+MYSQL_RETRY_BACKOFF = 1.0  # 첫 재시도 대기(초), 재시도마다 2배
+MYSQL_RETRY_BACKOFF_MAX = 60.0  # 재시도 대기 최대값(초)
+
+# 강의(course) 하나를 다시 수집한 뒤 이번 수집에 나오지 않은 lectures 행을 삭제 (fastcampus_recrawl에서 True)
+# 기존 행은 지우지 않고 제자리에서 갱신하므로 완료 시각/집계/이벤트가 다시 생기지 않습니다.
+PRUNE_STALE_LECTURES = False
+
+# 진도 스냅샷(course_progress_snapshots) 기준일 단위 (SNAPSHOT_GRANULARITY 환경변수: weekly / daily)
+# weekly: 주마다 월요일 행 하나 / daily: 크롤링한 날마다 행 하나
+SNAPSHOT_GRANULARITY = os.environ.get('SNAPSHOT_GRANULARITY', 'weekly')
+# 이 기간(일)이 지난 일별 스냅샷은 크롤링 종료 시 주별(월요일) 행으로 합침 (0이면 합치지 않음)
+SNAPSHOT_RETENTION_DAYS = 56
+
+# DB를 사용할 수 없을 때 아이템을 로컬 스풀(JSONL)에 저장, 나중에 scrapy drain_spool 로 DB에 반영
+# auto: 시작 시 접속 실패/재시도 초과 시에만 스풀 / always: 항상 스풀 / off: 스풀 안 함 (접속 실패 시 중단)
+MYSQL_SPOOL_MODE = os.environ.get('MYSQL_SPOOL_MODE', 'auto')
+MYSQL_SPOOL_DIR = os.path.join(_project_root, '.spool')
+MYSQL_SPOOL_BATCH_SIZE = 500  # drain_spool 커밋 단위 (아이템 수)
+
+# 커스텀 scrapy 명령 (scrapy drain_spool, scrapy export_parquet 등)
+COMMANDS_MODULE = "course_scraper.commands"
+
+# Parquet 내보내기 (선택 기능, pip install pyarrow 필요)
+# scrapy export_parquet 명령과 아래 feed 설정의 저장 위치
+EXPORT_DIR = os.path.join(_project_root, 'exports')
+FEED_EXPORTERS = {
+    "parquet": "course_scraper.exporters.ParquetItemExporter",
+}
+FEED_URI_PARAMS = "course_scraper.exporters.feed_uri_params"
+PARQUET_ROW_GROUP_SIZE = 10000  # 이 개수만큼 모아서 row group 하나로 기록
+
+# 크롤링 결과를 날짜별 Parquet 파일로도 저장하려면 주석 해제
+#FEEDS = {
+#    os.path.join(EXPORT_DIR, 'courses', 'crawl_date=%(crawl_date)s', '%(name)s-%(batch_time)s.parquet'): {
+#        "format": "parquet",
+#        "item_classes": ["course_scraper.items.CourseItem"],
+#    },
+#    os.path.join(EXPORT_DIR, 'lectures', 'crawl_date=%(crawl_date)s', '%(name)s-%(batch_time)s.parquet'): {
+#        "format": "parquet",
+#        "item_classes": ["course_scraper.items.LectureItem"],
+#    },
+#}
+
+# 브라우저 없이 크롤링하는 플랫폼 (-a course_id=... 를 지정하지 않으면 아래 목록 사용)
+INFLEARN_COURSE_IDS = []
+UDEMY_COURSE_IDS = []
+# Udemy 수강 진도 조회용 토큰 (없으면 커리큘럼만 저장)
+UDEMY_ACCESS_TOKEN = os.environ.get('UDEMY_ACCESS_TOKEN', '')
 
 # Playwright Settings
+# meta['playwright']가 True인 요청만 브라우저로, 나머지(robots.txt, API 등)는 HTTP 다운로더로 보냄
 DOWNLOAD_HANDLERS = {
-    "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-    "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+    "http": "course_scraper.handlers.RoutingDownloadHandler",
+    "https": "course_scraper.handlers.RoutingDownloadHandler",
 }
+ROUTING_BROWSER_HANDLER = "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler"  # None이면 브라우저 사용 안 함
+ROUTING_HTTP2 = False  # True면 브라우저를 쓰지 않는 https 요청은 HTTP/2로 (pip install h2 필요)
 
 PLAYWRIGHT_BROWSER_TYPE = "chromium"
+
+# 로그인 세션 저장 위치 (로그인 성공 시 자동 저장, 다음 실행에서 재사용)
+BROWSER_STORAGE_STATE = os.path.join(_project_root, '.browser', 'storage_state.json')
+# 로그인 단계별로 마지막에 성공한 선택자 (다음 로그인에서 먼저 확인)
+LOGIN_SELECTOR_CACHE = os.path.join(_project_root, '.browser', 'selector_cache.json')
+
+# 헤드리스 정책 (BROWSER_HEADLESS 환경변수: auto / true / false)
+# auto: 유효한 저장 세션이 있으면 화면 없이 실행하고, 없으면 2단계 인증을 위해 브라우저 표시
+# 헤드리스 실행 중 세션이 만료되면 2단계 인증용 브라우저 창을 그때만 따로 띄웁니다.
+# 세션 파일 확인과 headless / storage_state 설정은 FastCampus spider 시작 시 (browser.apply_stored_session)
+BROWSER_HEADLESS = os.environ.get('BROWSER_HEADLESS', 'auto').lower()
+
 PLAYWRIGHT_LAUNCH_OPTIONS = {
-    "headless": False,  # 2단계 인증을 위해 브라우저 표시
     "timeout": 120000,  # 브라우저 시작 타임아웃 2분
 }
 
@@ -144,9 +216,34 @@ PLAYWRIGHT_CONTEXTS = {
     }
 }
 
+# 상주 브라우저 데몬 (python browser_daemon.py)
+# BROWSER_DAEMON_CDP_URL 환경변수가 있으면 새 Chromium을 띄우지 않고 CDP로 접속하며,
+# 데몬이 저장한 로그인 세션(storage state)을 사용하여 로그인 과정을 생략합니다.
+# 예: BROWSER_DAEMON_CDP_URL=http://127.0.0.1:9222 scrapy crawl fastcampus_daily
+BROWSER_DAEMON_CDP_URL = os.environ.get('BROWSER_DAEMON_CDP_URL', '')
+if BROWSER_DAEMON_CDP_URL:
+    PLAYWRIGHT_CDP_URL = BROWSER_DAEMON_CDP_URL
+
 PLAYWRIGHT_MAX_CONTEXTS = 1  # 모든 요청이 동일한 컨텍스트 사용
 PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT = 60000  # 페이지 네비게이션 타임아웃 60초
 
+# 브라우저 메모리 / 탭 누수 감시 (기본 꺼짐, WATCHDOG=true 또는 -s WATCHDOG_ENABLED=True로 켬)
+# scrapy-playwright 내부 속성을 사용하므로 scrapy-playwright를 올릴 때 확인 필요 (watchdog.py)
+WATCHDOG_ENABLED = os.environ.get('WATCHDOG', 'false').lower() == 'true'
+WATCHDOG_INTERVAL = 30  # 확인 주기(초)
+WATCHDOG_PAGE_IDLE_TIMEOUT = 600  # 이 시간(초) 동안 네트워크 요청이 없는 탭은 누수로 보고 닫음 (2단계 인증 대기 시간보다 길게)
+WATCHDOG_MAX_RSS_MB = int(os.environ.get('WATCHDOG_MAX_RSS_MB', 2048))  # 브라우저(Python 제외) RSS가 넘으면 컨텍스트 교체 (0이면 교체 안 함)
+WATCHDOG_RECYCLE_DRAIN_TIMEOUT = 30  # 컨텍스트 교체 전 사용 중인 탭이 반납되기를 기다리는 최대 시간(초, 그동안 새 탭 생성이 멈춤)
+
+# 탭(page) 풀 - 강의마다 탭을 새로 만들지 않고 재사용 (fastcampus_daily)
+PAGE_POOL_SIZE = 0  # 동시에 사용하는 탭 수 (0이면 spider의 CONCURRENT_REQUESTS_PER_DOMAIN과 같게)
+PAGE_POOL_MAX_USES = 20  # 탭 하나로 이동할 최대 강의 수, 넘으면 새 탭으로 교체
+PAGE_POOL_MAX_HEAP_MB = 300  # 탭의 JS 힙이 이 크기를 넘으면 새 탭으로 교체
+
+# 강의실 간 이동 방식 (fastcampus_daily, -a navigation=spa 로 실행 시 지정 가능)
+# full: 강의마다 페이지 전체 로드 / spa: 로드된 강의실 앱 안에서 SPA 라우터로 이동
+CLASSROOM_NAVIGATION = 'full'
+
 # Playwright 동시 실행 제한
 CONCURRENT_REQUESTS = 8
 CONCURRENT_REQUESTS_PER_DOMAIN = 4
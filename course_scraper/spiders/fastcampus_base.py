@@ -0,0 +1,346 @@
+import scrapy
+import time
+from collections import deque
+from scrapy_playwright.page import PageMethod
+
+from course_scraper.browser import PagePool
+from course_scraper.classroom import expand_curriculum, extract_sections
+from course_scraper.credentials import kakao_credentials
+from course_scraper.duration import parse_duration
+from course_scraper.items import CourseItem, LectureItem
+from course_scraper.login import StoredSessionMixin, ensure_logged_in, login_request
+from course_scraper.logs import LogSampler
+from course_scraper.metrics import observe
+from course_scraper.navigation import spa_navigate
+from course_scraper.progress import extract_progress
+
+class FastCampusBaseSpider(StoredSessionMixin, scrapy.Spider):
+    """
+    FastCampus 강의실 크롤링 공통 엔진 (로그인, 탭 재사용, 강의실 이동, 커리큘럼 추출, 아이템 생성)
+
+    각 spider는 크롤링할 강의 목록만 정합니다.
+    - load_courses(): 로그인 전에 정할 수 있는 강의 목록 (예: DB 조회)
+    - after_login(page): 로그인한 탭으로 강의 목록을 정함 (기본값: load_courses() 결과)
+    - inspect_page(page, course_id): 커리큘럼 추출 후 추가 작업 (스크린샷 등)
+    강의 요청/파싱/에러 처리는 모든 spider가 이 클래스의 같은 경로를 사용합니다.
+    """
+    custom_settings = {
+        'DOWNLOAD_DELAY': 2,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+    }
+
+    # 로그인 화면에서 스크린샷 저장 여부
+    login_screenshots = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logged_in = False
+        self.course_urls = []
+        self.pending_courses = deque()
+        self.page_pool = None
+        self.session_expired = False
+        self.navigation_mode = kwargs.get('navigation', None)
+
+    def start_requests(self):
+        # 로그인 정보는 spider가 시작될 때 처음 읽음 (-s 옵션 / 환경변수 / credentials.py)
+        self.kakao_email, self.kakao_password = kakao_credentials(self.settings)
+        if not self.kakao_email or not self.kakao_password:
+            self.logger.error("KAKAO_EMAIL or KAKAO_PASSWORD not set (credentials.py or environment)")
+            return
+
+        self.page_pool = PagePool.from_settings(self.settings, self.crawler.stats)
+        self.log_sampler = LogSampler.from_settings(self.settings)
+        self.navigation_mode = (self.navigation_mode or self.settings.get('CLASSROOM_NAVIGATION', 'full')).lower()
+
+        courses = self.load_courses()
+        if courses is not None:
+            if not courses:
+                return
+            self.course_urls = courses
+
+        # 로그인 시작
+        yield login_request(self, self.login, self.errback)
+
+    def load_courses(self):
+        """로그인 전에 크롤링할 강의 목록 [{'course_id', 'url'}] (None이면 after_login에서 결정, 빈 목록이면 종료)"""
+        return None
+
+    async def after_login(self, page):
+        """로그인한 탭으로 크롤링할 강의 목록을 정함"""
+        return self.course_urls
+
+    async def inspect_page(self, page, course_id):
+        """강의 하나를 파싱한 뒤 같은 탭으로 추가 작업 (기본: 없음)"""
+
+    async def login(self, response):
+        """카카오 로그인 자동화"""
+        page = response.meta['playwright_page']
+
+        try:
+            # 로그인 (저장된 세션이 있으면 카카오 로그인 생략)
+            if not await ensure_logged_in(page, self.kakao_email, self.kakao_password, self.logger,
+                                          screenshots=self.login_screenshots, settings=self.settings,
+                                          stats=self.crawler.stats):
+                await page.close()
+                return
+
+            self.logged_in = True
+            self.course_urls = await self.after_login(page)
+            if not self.course_urls:
+                self.logger.warning("No course URLs found to crawl")
+                await page.close()
+                return
+
+            # 각 강의 URL을 크롤링 - 탭 풀 크기만큼 요청 체인 시작
+            # (첫 번째 체인은 로그인에 사용한 탭을 그대로 재사용)
+            self.logger.info(f"Starting to crawl {len(self.course_urls)} courses...")
+            self.pending_courses = deque(self.course_urls)
+
+            for chain_idx in range(self.page_pool.size):
+                request = self.next_course_request(page if chain_idx == 0 else None)
+                if request:
+                    yield request
+                elif chain_idx == 0:
+                    await page.close()
+
+        except Exception as e:
+            self.logger.error(f"Login failed: {e}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+            if page and not page.is_closed():
+                await page.close()
+
+    def next_course_request(self, page=None):
+        """대기 중인 다음 강의 요청 생성 (page가 주어지면 해당 탭 재사용)"""
+        if not self.pending_courses:
+            return None
+        return self.course_request(self.pending_courses.popleft(), page)
+
+    def course_request(self, course_data, page=None):
+        """강의실 페이지 요청 생성"""
+        meta = self.page_pool.meta(page)
+        meta['playwright_page_methods'] = [
+            PageMethod('wait_for_timeout', 3000),
+        ]
+        return scrapy.Request(
+            course_data['url'],
+            callback=self.parse,
+            meta=meta,
+            errback=self.errback,
+            dont_filter=True
+        )
+
+    async def parse(self, response):
+        """페이지 파싱 및 강의 정보 추출하여 DB 저장
+
+        파싱이 끝난 탭은 닫지 않고 다음 강의에 재사용합니다.
+        navigation=spa 모드에서는 같은 탭에서 SPA 라우터로 다음 강의실로 이동하여
+        JS 번들을 다시 로드하지 않고 계속 파싱합니다.
+        """
+        page = self.page_pool.acquire(response)
+        url = response.url
+
+        while True:
+            try:
+                async for item in self.parse_course(page, url, response):
+                    yield item
+            except Exception as e:
+                self.logger.error(f"Error parsing {url}: {e}")
+                import traceback
+                self.logger.error(traceback.format_exc())
+                self.crawler.stats.inc_value('courses/failed')
+                await self.page_pool.discard(page)
+                page = None
+
+            if self.session_expired:
+                await self.page_pool.discard(page)
+                return
+
+            # 탭을 닫지 않고 다음 강의로 이동 (사용 횟수/메모리 한도를 넘으면 새 탭)
+            page = await self.page_pool.release(page)
+            if not self.pending_courses:
+                if page:
+                    await page.close()
+                return
+            course_data = self.pending_courses.popleft()
+
+            if page and self.navigation_mode == 'spa':
+                started = time.monotonic()
+                if await spa_navigate(page, course_data['url']):
+                    self.page_pool.track(page, time.monotonic() - started)
+                    self.crawler.stats.inc_value('navigation/spa')
+                    url, response = course_data['url'], None
+                    continue
+
+                self.crawler.stats.inc_value('navigation/spa_fallback')
+                self.logger.warning(f"SPA navigation did not complete, falling back to page load: {course_data['url']}")
+
+            yield self.course_request(course_data, page)
+            return
+
+    async def parse_course(self, page, url, response=None):
+        """현재 탭에 열린 강의실에서 CourseItem / LectureItem 추출
+
+        진행 과정은 DEBUG로만 남기고 강의 하나가 끝나면 요약 한 줄을 INFO로 남깁니다.
+        """
+        started = time.monotonic()
+
+        # 페이지 제목 확인
+        page_title = await page.title() if page else response.css('title::text').get()
+        self.logger.debug("Parsing: %s (title: %s)", url, page_title)
+
+        # 로그인 확인
+        if '인증' in page_title or 'sign-in' in url:
+            self.logger.error("✗ Still on login page! Session expired.")
+            self.crawler.stats.inc_value('courses/failed')
+            self.session_expired = True
+            return
+
+        # Course ID 추출
+        course_id = url.split('/classroom/')[-1].split('?')[0]
+        course_title = await self.extract_course_title(page, page_title, course_id)
+        self.logger.debug("Course: %s", course_title)
+
+        # 진도율, 학습시간, 전체시간 추출
+        progress_rate = 0.0
+        study_time = 0
+        total_lecture_time = 0
+
+        if page:
+            try:
+                progress = await extract_progress(page)
+                progress_rate = progress['progress_rate']
+                study_time = progress['study_time']
+                total_lecture_time = progress['total_lecture_time']
+                self.logger.debug("  Progress: %s%%, Study time: %s min, Total time: %s min",
+                                  progress_rate, study_time, total_lecture_time)
+            except Exception as e:
+                self.logger.warning(f"Could not extract time info: {str(e)[:100]}")
+
+        # CourseItem 생성 (courses 테이블 업데이트용)
+        yield CourseItem(
+            course_id=course_id,
+            course_title=course_title,
+            progress_rate=progress_rate,
+            study_time=study_time,
+            total_lecture_time=total_lecture_time,
+            url=url
+        )
+
+        # 커리큘럼 추출 - 섹션 하나를 파싱할 때마다 바로 LectureItem을 내보냄
+        if not page:
+            self.logger.warning(f"✗ No curriculum found for {url}")
+            return
+
+        section_count = 0
+        sort_order = 0
+        completed_count = 0
+        async for section in self.extract_curriculum_playwright(page):
+            section_count += 1
+            for lecture_item in self.lecture_items(course_id, course_title, section, sort_order):
+                sort_order = lecture_item['sort_order']
+                completed_count += bool(lecture_item['is_completed'])
+                if self.log_sampler():
+                    self.logger.debug("  Lecture %d: %s (%s min, completed=%s)", sort_order,
+                                      lecture_item['lecture_title'], lecture_item['lecture_time'],
+                                      lecture_item['is_completed'])
+                yield lecture_item
+
+        elapsed = time.monotonic() - started
+        observe(self.crawler.stats, 'extraction_seconds', elapsed)
+        if section_count:
+            summary = {
+                'course_id': course_id,
+                'sections': section_count,
+                'lectures': sort_order,
+                'completed': completed_count,
+                'progress_rate': progress_rate,
+                'elapsed_s': round(elapsed, 1),
+            }
+            self.logger.info("✓ %s: %d sections, %d lectures (%d completed), %s%% in %.1fs",
+                             course_title, section_count, sort_order, completed_count, progress_rate,
+                             summary['elapsed_s'], extra={'summary': summary})
+        else:
+            self.logger.warning(f"✗ No curriculum found for {url}")
+
+        await self.inspect_page(page, course_id)
+
+    async def extract_course_title(self, page, page_title, course_id):
+        """페이지 타이틀("패스트캠퍼스 온라인 강의 - 강의명")에서 강의 제목 추출, 실패하면 상단 h1"""
+        course_title = None
+        if ' - ' in page_title:
+            course_title = page_title.split(' - ', 1)[1].strip()
+        elif '|' in page_title:
+            course_title = page_title.split('|')[0].strip()
+
+        if not course_title or len(course_title) < 10:
+            if page:
+                try:
+                    title_elem = await page.query_selector('header h1, h1')
+                    if title_elem:
+                        title_text = await title_elem.inner_text()
+                        if title_text and len(title_text) > 10:
+                            course_title = title_text.strip()
+                except:
+                    pass
+
+        if not course_title or len(course_title) < 5:
+            course_title = f'Course {course_id}'
+
+        return course_title.strip()
+
+    def lecture_items(self, course_id, course_title, section, sort_order=0):
+        """섹션 하나의 LectureItem 생성 (챕터가 없으면 섹션 바로 아래 강의, sort_order는 이어서 증가)"""
+        chapters = section.get('chapters') or [
+            {'chapter_number': None, 'chapter_title': None, 'lessons': section.get('lessons', [])}
+        ]
+
+        for chapter in chapters:
+            for lecture_idx, lesson in enumerate(chapter['lessons'], 1):
+                sort_order += 1
+                yield LectureItem(
+                    course_id=course_id,
+                    course_title=course_title,
+                    section_number=section['section_number'],
+                    section_title=section['section'],
+                    chapter_number=chapter['chapter_number'],
+                    chapter_title=chapter['chapter_title'],
+                    lecture_number=lecture_idx,
+                    lecture_title=lesson.get('title', f'Lecture {lecture_idx}'),
+                    lecture_time=parse_duration(lesson.get('duration')),
+                    is_completed=lesson.get('is_completed', False),
+                    sort_order=sort_order
+                )
+
+    async def extract_curriculum_playwright(self, page):
+        """모든 nested 아코디언 섹션을 펼친 뒤 섹션을 하나씩 추출 (async generator)"""
+        try:
+            await expand_curriculum(page, self.logger)
+            section_count = 0
+            async for section in extract_sections(page, self.logger):
+                section_count += 1
+                yield section
+            self.logger.debug("Extracted %d sections total", section_count)
+
+        except Exception as e:
+            self.logger.error(f"Error extracting curriculum: {e}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+
+    async def errback(self, failure):
+        """에러 처리"""
+        page = failure.request.meta.get('playwright_page')
+        if self.page_pool:
+            await self.page_pool.discard(page)
+        elif page:
+            await page.close()
+        self.logger.error(f"✗ Request failed: {failure.request.url}")
+        self.crawler.stats.inc_value('courses/failed')
+
+        # 요청 체인이 끊기지 않도록 다음 강의는 새 탭으로 요청
+        request = self.next_course_request()
+        return [request] if request else []
+
+    def closed(self, reason):
+        if self.page_pool:
+            self.page_pool.log_summary(self.logger)
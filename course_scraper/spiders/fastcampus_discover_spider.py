@@ -1,28 +1,11 @@
 import scrapy
-import os
 from scrapy_playwright.page import PageMethod
 
-# credentials.py에서 로그인 정보 가져오기
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-credentials_path = os.path.join(project_root, 'credentials.py')
+from course_scraper.login import StoredSessionMixin, ensure_logged_in, login_request
+from course_scraper.credentials import kakao_credentials
 
-KAKAO_EMAIL = None
-KAKAO_PASSWORD = None
 
-if os.path.exists(credentials_path):
-    with open(credentials_path, 'r', encoding='utf-8') as f:
-        exec_globals = {}
-        exec(f.read(), exec_globals)
-        KAKAO_EMAIL = exec_globals.get('KAKAO_EMAIL')
-        KAKAO_PASSWORD = exec_globals.get('KAKAO_PASSWORD')
-else:
-    raise FileNotFoundError(f"credentials.py not found at {credentials_path}")
-
-if not KAKAO_EMAIL or not KAKAO_PASSWORD:
-    raise ValueError("KAKAO_EMAIL or KAKAO_PASSWORD not set in credentials.py")
-
-
-class FastCampusDiscoverSpider(scrapy.Spider):
+class FastCampusDiscoverSpider(StoredSessionMixin, scrapy.Spider):
     """
     월 1회 실행: 새로운 강의를 찾아서 courses 테이블에 저장하는 spider
     """
@@ -37,121 +20,21 @@ class FastCampusDiscoverSpider(scrapy.Spider):
         self.logged_in = False
 
     def start_requests(self):
-        yield scrapy.Request(
-            'https://fastcampus.co.kr/account/sign-in',
-            callback=self.login,
-            meta={
-                'playwright': True,
-                'playwright_include_page': True,
-                'playwright_page_methods': [
-                    PageMethod('wait_for_timeout', 8000),
-                ],
-            },
-            errback=self.errback,
-            dont_filter=True
-        )
+        self.kakao_email, self.kakao_password = kakao_credentials(self.settings)
+        if not self.kakao_email or not self.kakao_password:
+            self.logger.error("KAKAO_EMAIL or KAKAO_PASSWORD not set (credentials.py or environment)")
+            return
+
+        yield login_request(self, self.login, self.errback)
 
     async def login(self, response):
         """카카오 로그인 자동화"""
         page = response.meta['playwright_page']
 
         try:
-            self.logger.info("Starting Kakao login process...")
-            await page.screenshot(path='screenshot_1_initial.png')
-
-            # 카카오 로그인 버튼 클릭
-            selectors = [
-                'button:has-text("카카오로 1초 만에 시작하기")',
-                'button:has-text("카카오")',
-                'a:has-text("카카오로 1초 만에 시작하기")',
-                '[class*="kakao"]',
-            ]
-
-            clicked = False
-            for selector in selectors:
-                try:
-                    await page.click(selector, timeout=5000)
-                    self.logger.info(f"✓ Clicked Kakao button")
-                    clicked = True
-                    break
-                except Exception:
-                    continue
-
-            if not clicked:
-                self.logger.error("✗ Could not find Kakao login button")
-                await page.close()
-                return
-
-            # 카카오 로그인 페이지 로드 대기
-            await page.wait_for_timeout(3000)
-
-            # 이메일 입력
-            email_selectors = ['input[name="loginId"]', 'input[type="email"]', '#loginId']
-            for selector in email_selectors:
-                try:
-                    await page.fill(selector, KAKAO_EMAIL, timeout=3000)
-                    self.logger.info(f"✓ Entered email")
-                    break
-                except Exception:
-                    continue
-
-            # 비밀번호 입력
-            password_selectors = ['input[name="password"]', 'input[type="password"]', '#password']
-            for selector in password_selectors:
-                try:
-                    await page.fill(selector, KAKAO_PASSWORD, timeout=3000)
-                    self.logger.info(f"✓ Entered password")
-                    break
-                except Exception:
-                    continue
-
-            # 로그인 버튼 클릭
-            login_selectors = ['button[type="submit"]', 'button:has-text("로그인")', '.btn_confirm']
-            for selector in login_selectors:
-                try:
-                    await page.click(selector, timeout=3000)
-                    self.logger.info(f"✓ Clicked login button")
-                    break
-                except Exception:
-                    continue
-
-            # 2FA 대기
-            self.logger.info("=" * 70)
-            self.logger.info("⚠️  KakaoTalk 앱에서 2단계 인증을 승인해주세요! ⚠️")
-            self.logger.info("90초 대기 중...")
-            self.logger.info("=" * 70)
-
-            max_wait_time = 90
-            check_interval = 2
-
-            for i in range(0, max_wait_time, check_interval):
-                await page.wait_for_timeout(check_interval * 1000)
-
-                # Continue 버튼 찾기
-                continue_selectors = ['button.btn_confirm', 'button:has-text("Continue")', 'button:has-text("확인")']
-                for selector in continue_selectors:
-                    try:
-                        btn = await page.query_selector(selector)
-                        if btn and await btn.is_visible():
-                            await btn.click()
-                            self.logger.info("✓ Clicked Continue button!")
-                            await page.wait_for_timeout(3000)
-                            break
-                    except Exception:
-                        continue
-
-                # FastCampus로 리디렉트되었는지 확인
-                current_url = page.url
-                if 'fastcampus.co.kr' in current_url and 'sign-in' not in current_url:
-                    self.logger.info(f"✓ Successfully redirected to FastCampus!")
-                    break
-
-            current_url = page.url
-            page_title = await page.title()
-
-            # 로그인 성공 확인
-            if 'sign-in' not in current_url and '인증' not in page_title:
-                self.logger.info("✓ Login successful!")
+            # 로그인 (저장된 세션이 있으면 카카오 로그인 생략)
+            if await ensure_logged_in(page, self.kakao_email, self.kakao_password, self.logger,
+                                      settings=self.settings, stats=self.crawler.stats):
                 self.logged_in = True
                 await page.wait_for_timeout(1000)
 
@@ -278,11 +161,13 @@ class FastCampusDiscoverSpider(scrapy.Spider):
                                         await classroom_btn.click()
 
                                     new_page = await page_info.value
-                                    await new_page.wait_for_load_state('load', timeout=10000)
-                                    course_url = new_page.url
-                                    self.logger.info(f"     ✓ Method 4: Got URL from new page: {course_url}")
-
-                                    await new_page.close()
+                                    try:
+                                        await new_page.wait_for_load_state('load', timeout=10000)
+                                        course_url = new_page.url
+                                        self.logger.info(f"     ✓ Method 4: Got URL from new page: {course_url}")
+                                    finally:
+                                        # 로딩 시간 초과 시에도 새 탭이 남지 않도록 닫음
+                                        await new_page.close()
                                     await page.wait_for_timeout(1000)
 
                                 except Exception as e:
@@ -321,7 +206,6 @@ class FastCampusDiscoverSpider(scrapy.Spider):
 
                 await page.close()
             else:
-                self.logger.error("✗ Login failed!")
                 await page.close()
 
         except Exception as e:
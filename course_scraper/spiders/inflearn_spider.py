@@ -1,33 +1,133 @@
 import scrapy
 import json
 
+from course_scraper.curriculum import curriculum_items
+from course_scraper.duration import parse_duration
+
 
 class InflearnSpider(scrapy.Spider):
+    """인프런 강의 커리큘럼 크롤링 (브라우저 없이 인프런 API 사용)
+
+    실행:
+        scrapy crawl inflearn -a course_id=324145,328183
+
+    커리큘럼 API 응답을 사용할 수 없으면 강의 소개 페이지 HTML에서 커리큘럼을 추출합니다.
+    로그인하지 않으므로 수강 진도는 가져오지 않습니다 (모든 강의 미완료로 저장).
+    """
     name = 'inflearn'
     custom_settings = {
         'DOWNLOAD_DELAY': 1,
         'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        # 브라우저를 띄우지 않고 HTTP 다운로더만 사용 (연결 재사용, gzip/br 압축 해제)
+        'ROUTING_BROWSER_HANDLER': None,
     }
 
+    API_URL = 'https://course-api.inflearn.com/client/api/v1/course'
+    COURSE_URL = 'https://www.inflearn.com/course'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.course_id = kwargs.get('course_id', None)
+
     def start_requests(self):
-        urls = [
-            # TODO: 인프런 URL 추가
-        ]
+        if self.course_id:
+            course_ids = [course_id.strip() for course_id in self.course_id.split(',') if course_id.strip()]
+        else:
+            course_ids = [str(course_id) for course_id in self.settings.getlist('INFLEARN_COURSE_IDS')]
+
+        if not course_ids:
+            self.logger.warning("No Inflearn courses to crawl (use -a course_id=... or INFLEARN_COURSE_IDS)")
+            return
+
+        for course_id in course_ids:
+            yield scrapy.Request(
+                f'{self.API_URL}/{course_id}/online/info',
+                headers={'Accept': 'application/json'},
+                callback=self.parse_course,
+                cb_kwargs={'course_id': int(course_id)}
+            )
+
+    def parse_course(self, response, course_id):
+        """강의 정보 → 커리큘럼 API 요청"""
+        course = json.loads(response.text).get('data') or {}
+        slug = course.get('slug') or course_id
+        course_info = {
+            'course_id': course_id,
+            'course_title': (course.get('title') or 'Unknown Title').strip(),
+            'url': f'{self.COURSE_URL}/{slug}',
+        }
+        yield scrapy.Request(
+            f'{self.API_URL}/{course_id}/curriculum?lang=ko',
+            headers={'Accept': 'application/json'},
+            callback=self.parse_curriculum,
+            errback=self.curriculum_failed,
+            cb_kwargs={'course_info': course_info}
+        )
+
+    def parse_curriculum(self, response, course_info):
+        """커리큘럼 API 응답 파싱 (섹션 → units, runtime은 초 단위)"""
+        try:
+            data = json.loads(response.text).get('data') or {}
+        except ValueError:
+            data = {}
+        sections = data.get('sections') or (data.get('curriculum') or {}).get('sections') or []
 
-        for url in urls:
-            yield scrapy.Request(url, callback=self.parse)
+        curriculum = []
+        for section in sections:
+            lessons = []
+            for unit in section.get('units') or section.get('lectures') or []:
+                if not unit.get('title'):
+                    continue
+                lessons.append({
+                    'title': unit['title'].strip(),
+                    'minutes': round((unit.get('runtime') or 0) / 60, 2),
+                    'is_completed': False,
+                })
+            curriculum.append({'section': (section.get('title') or '').strip(), 'lessons': lessons})
+
+        if not curriculum:
+            self.logger.warning(f"No curriculum in API response for {course_info['course_id']}, using course page")
+            yield self.page_request(course_info)
+            return
+
+        yield from self.build_items(course_info, curriculum)
 
-    def parse(self, response):
-        # 커리큘럼 파싱
-        curriculum = self.extract_curriculum(response)
+    def curriculum_failed(self, failure):
+        """커리큘럼 API 요청 실패 시 강의 소개 페이지로 대체"""
+        course_info = failure.request.cb_kwargs['course_info']
+        self.logger.warning(f"Curriculum API failed for {course_info['course_id']}: {failure.value}, using course page")
+        return self.page_request(course_info)
 
-        if curriculum:
-            yield {
-                'url': response.url,
-                'title': self.extract_title(response),
-                'curriculum': curriculum,
-                'total_sections': len(curriculum),
+    def page_request(self, course_info):
+        return scrapy.Request(course_info['url'], callback=self.parse, cb_kwargs={'course_info': course_info})
+
+    def parse(self, response, course_info):
+        """강의 소개 페이지 HTML에서 커리큘럼 추출"""
+        curriculum = [
+            {
+                'section': section['section'],
+                'lessons': [
+                    {'title': lesson['title'], 'minutes': parse_duration(lesson['duration']), 'is_completed': False}
+                    for lesson in section['lessons']
+                ],
             }
+            for section in self.extract_curriculum(response)
+        ]
+
+        if not curriculum:
+            self.logger.warning(f"No curriculum found: {response.url}")
+            return
+
+        if course_info['course_title'] == 'Unknown Title':
+            course_info['course_title'] = self.extract_title(response)
+        yield from self.build_items(course_info, curriculum)
+
+    def build_items(self, course_info, curriculum):
+        lecture_count = sum(len(section['lessons']) for section in curriculum)
+        self.logger.info(f"✓ {course_info['course_title']}: {len(curriculum)} sections, {lecture_count} lectures")
+        yield from curriculum_items(
+            'inflearn', course_info['course_id'], course_info['course_title'], course_info['url'], curriculum
+        )
 
     def extract_title(self, response):
         """강의 제목 추출"""
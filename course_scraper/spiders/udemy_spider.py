@@ -1,68 +1,116 @@
 import scrapy
 import json
 
+from course_scraper.curriculum import curriculum_items
+from course_scraper.duration import parse_duration
+
 
 class UdemySpider(scrapy.Spider):
+    """Udemy 강의 커리큘럼 크롤링 (브라우저 없이 Udemy API 사용)
+
+    실행:
+        scrapy crawl udemy -a course_id=567828,1565838
+
+    UDEMY_ACCESS_TOKEN이 있으면 수강 진도(완료한 강의)도 함께 가져옵니다.
+    """
     name = 'udemy'
     custom_settings = {
         'DOWNLOAD_DELAY': 1,
         'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        # 브라우저를 띄우지 않고 HTTP 다운로더만 사용 (연결 재사용, gzip/br 압축 해제)
+        'ROUTING_BROWSER_HANDLER': None,
     }
 
+    API_URL = 'https://www.udemy.com/api-2.0'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.course_id = kwargs.get('course_id', None)
+
     def start_requests(self):
-        urls = [
-            # TODO: Udemy URL 추가
-        ]
-
-        for url in urls:
-            yield scrapy.Request(url, callback=self.parse)
-
-    def parse(self, response):
-        # 커리큘럼 파싱
-        curriculum = self.extract_curriculum(response)
-
-        if curriculum:
-            yield {
-                'url': response.url,
-                'title': self.extract_title(response),
-                'curriculum': curriculum,
-                'total_sections': len(curriculum),
-            }
-
-    def extract_title(self, response):
-        """강의 제목 추출"""
-        title = response.css('h1[data-purpose="lead-title"]::text, h1::text').get()
-        if not title:
-            title = response.xpath('//h1/text()').get()
-        return title.strip() if title else 'Unknown Title'
-
-    def extract_curriculum(self, response):
-        """커리큘럼 추출 로직"""
-        curriculum = []
-
-        # Udemy 커리큘럼 구조 추출
-        sections = response.css('.curriculum-section, section[data-purpose="curriculum-section"]')
-
-        for section in sections:
-            section_title = section.css('.section-title::text, h2::text, .ud-heading-xl::text').get()
-            lessons = section.css('.curriculum-item, .lecture-item, li[data-purpose="curriculum-item"]')
-
-            lesson_list = []
-            for lesson in lessons:
-                lesson_title = lesson.css('.lecture-title::text, span::text, button::text').get()
-                lesson_duration = lesson.css('.duration::text, .content-summary::text').get()
-
-                if lesson_title:
-                    lesson_list.append({
-                        'title': lesson_title.strip(),
-                        'duration': lesson_duration.strip() if lesson_duration else None
-                    })
-
-            if section_title:
-                curriculum.append({
-                    'section': section_title.strip(),
-                    'lessons': lesson_list,
-                    'lesson_count': len(lesson_list)
+        if self.course_id:
+            course_ids = [course_id.strip() for course_id in self.course_id.split(',') if course_id.strip()]
+        else:
+            course_ids = [str(course_id) for course_id in self.settings.getlist('UDEMY_COURSE_IDS')]
+
+        if not course_ids:
+            self.logger.warning("No Udemy courses to crawl (use -a course_id=... or UDEMY_COURSE_IDS)")
+            return
+
+        for course_id in course_ids:
+            yield self.api_request(
+                f'/courses/{course_id}/?fields[course]=title,url',
+                callback=self.parse_course,
+                cb_kwargs={'course_id': int(course_id)}
+            )
+
+    def api_request(self, path, **kwargs):
+        """Udemy API 요청 (토큰이 있으면 Authorization 헤더 추가)"""
+        headers = {'Accept': 'application/json'}
+        token = self.settings.get('UDEMY_ACCESS_TOKEN')
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        url = path if path.startswith('http') else self.API_URL + path
+        return scrapy.Request(url, headers=headers, **kwargs)
+
+    def parse_course(self, response, course_id):
+        """강의 정보 → 커리큘럼 첫 페이지 요청"""
+        course = json.loads(response.text)
+        course_info = {
+            'course_id': course_id,
+            'course_title': course.get('title', 'Unknown Title'),
+            'url': response.urljoin(course.get('url', f'/course/{course_id}/')),
+        }
+        yield self.api_request(
+            f'/courses/{course_id}/public-curriculum-items/?page_size=200',
+            callback=self.parse_curriculum,
+            cb_kwargs={'course_info': course_info, 'curriculum': []}
+        )
+
+    def parse_curriculum(self, response, course_info, curriculum):
+        """커리큘럼 페이지 파싱 (chapter → 섹션, lecture → 강의, 퀴즈 등은 제외)"""
+        data = json.loads(response.text)
+
+        for entry in data.get('results', []):
+            if entry.get('_class') == 'chapter':
+                curriculum.append({'section': entry.get('title', '').strip(), 'lessons': []})
+            elif entry.get('_class') == 'lecture':
+                if not curriculum:
+                    curriculum.append({'section': 'Introduction', 'lessons': []})
+                curriculum[-1]['lessons'].append({
+                    'id': entry.get('id'),
+                    'title': entry.get('title', '').strip(),
+                    'minutes': parse_duration(entry.get('content_summary')),
+                    'is_completed': False,
                 })
 
-        return curriculum
+        if data.get('next'):
+            yield self.api_request(
+                data['next'],
+                callback=self.parse_curriculum,
+                cb_kwargs={'course_info': course_info, 'curriculum': curriculum}
+            )
+        elif self.settings.get('UDEMY_ACCESS_TOKEN'):
+            yield self.api_request(
+                f"/users/me/subscribed-courses/{course_info['course_id']}/progress/"
+                f"?fields[course]=completed_lecture_ids",
+                callback=self.parse_progress,
+                cb_kwargs={'course_info': course_info, 'curriculum': curriculum}
+            )
+        else:
+            yield from self.build_items(course_info, curriculum)
+
+    def parse_progress(self, response, course_info, curriculum):
+        """완료한 강의 ID로 is_completed 설정"""
+        completed_ids = set(json.loads(response.text).get('completed_lecture_ids', []))
+        for section in curriculum:
+            for lesson in section['lessons']:
+                lesson['is_completed'] = lesson['id'] in completed_ids
+        yield from self.build_items(course_info, curriculum)
+
+    def build_items(self, course_info, curriculum):
+        lecture_count = sum(len(section['lessons']) for section in curriculum)
+        self.logger.info(f"✓ {course_info['course_title']}: {len(curriculum)} sections, {lecture_count} lectures")
+        yield from curriculum_items(
+            'udemy', course_info['course_id'], course_info['course_title'], course_info['url'], curriculum
+        )
@@ -0,0 +1,129 @@
+"""
+DB를 사용할 수 없을 때 아이템을 쌓아두는 로컬 스풀(JSONL)
+
+크롤링 중 MySQL에 접속할 수 없으면 MySQLPipeline이 아이템을 스풀 파일에 한 줄씩 추가하고,
+나중에 `scrapy drain_spool` 명령으로 DB에 일괄 저장합니다.
+
+파일 형식 (한 줄 = 아이템 하나, crawled_at은 완료 시각/스냅샷 기준일로 사용):
+    {"type": "CourseItem", "crawled_at": "2025-01-06T09:30:12", "crawled_on": "2025-01-06", "data": {...}}
+crawled_at이 없는 이전 형식의 파일은 crawled_on 날짜의 0시로 간주합니다.
+
+드레인 중 커밋한 아이템 수는 <스풀 파일>.done에 기록하여, 실패 후 다시 실행하면 그 다음 아이템부터 이어서 저장합니다.
+"""
+
+import glob
+import json
+import os
+import re
+from datetime import date, datetime, time
+
+from course_scraper.items import CourseItem, LectureItem
+
+ITEM_TYPES = {
+    'CourseItem': CourseItem,
+    'LectureItem': LectureItem,
+}
+
+
+class Spool:
+    """append-only 스풀 파일 하나 (crawl 한 번당 파일 하나)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    @classmethod
+    def create(cls, spool_dir, spider_name):
+        """spool_dir/<spider>-<시각>.jsonl 파일을 새로 생성"""
+        os.makedirs(spool_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        return cls(os.path.join(spool_dir, f'{spider_name}-{timestamp}.jsonl'))
+
+    def append(self, item):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        now = datetime.now()
+        record = {
+            'type': type(item).__name__,
+            'crawled_at': now.isoformat(timespec='seconds'),
+            'crawled_on': now.date().isoformat(),
+            'data': dict(item),
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()  # 프로세스가 죽어도 이미 쓴 줄은 남도록
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+_FILE_TIMESTAMP = re.compile(r'-(\d{8}-\d{6})\.jsonl$')
+
+
+def _started_at(path):
+    """스풀 파일을 만든 시각 (파일 이름의 <시각>, 형식이 다르면 수정 시각)"""
+    match = _FILE_TIMESTAMP.search(path)
+    if match:
+        return datetime.strptime(match.group(1), '%Y%m%d-%H%M%S')
+    return datetime.fromtimestamp(os.path.getmtime(path))
+
+
+def spool_files(spool_dir):
+    """드레인할 스풀 파일 목록 (오래된 순)
+
+    파일 이름이 <spider>-<시각>.jsonl이므로 이름순으로 정렬하면 spider별로 묶여 오래된 크롤링이
+    나중에 저장될 수 있습니다. 파일을 만든 시각 순으로 정렬합니다.
+    """
+    return sorted(glob.glob(os.path.join(spool_dir, '*.jsonl')), key=lambda path: (_started_at(path), path))
+
+
+def progress_path(path):
+    return f'{path}.done'
+
+
+def read_progress(path):
+    """스풀 파일에서 이미 DB에 커밋한 아이템 수 (기록이 없으면 0)"""
+    try:
+        with open(progress_path(path), 'r', encoding='utf-8') as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def write_progress(path, count):
+    """커밋한 아이템 수 기록 (쓰다 만 파일이 남지 않도록 임시 파일에 쓴 뒤 교체)"""
+    tmp_path = f'{progress_path(path)}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(str(count))
+    os.replace(tmp_path, progress_path(path))
+
+
+def remove_spool(path):
+    """드레인한 스풀 파일과 진행 기록 삭제"""
+    os.remove(path)
+    if os.path.exists(progress_path(path)):
+        os.remove(progress_path(path))
+
+
+def read_spool(path):
+    """스풀 파일의 (아이템, 크롤링 시각)을 순서대로 반환 (마지막 줄이 잘렸으면 건너뜀)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            item_cls = ITEM_TYPES.get(record.get('type'))
+            if item_cls:
+                if record.get('crawled_at'):
+                    crawled_at = datetime.fromisoformat(record['crawled_at'])
+                else:
+                    crawled_at = datetime.combine(date.fromisoformat(record['crawled_on']), time.min)
+                yield item_cls(**record['data']), crawled_at
@@ -0,0 +1,193 @@
+"""
+브라우저 메모리 / 탭 누수 감시 (WATCHDOG_ENABLED = True일 때만 동작, 기본값 꺼짐)
+
+WATCHDOG_INTERVAL초마다 열린 컨텍스트와 탭, 브라우저 RSS(Python 프로세스를 뺀 자식 프로세스 -
+Playwright 드라이버와 Chromium)를 확인합니다. ps는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+- 누수된 탭: WATCHDOG_PAGE_IDLE_TIMEOUT초 동안 네트워크 요청이 없는 탭은 강제로 닫습니다.
+  (예외로 close()를 건너뛴 탭 등 - 정상적인 탭은 강의마다 페이지를 이동하므로 해당되지 않음)
+- 메모리: RSS가 WATCHDOG_MAX_RSS_MB를 넘으면 컨텍스트를 새로 만듭니다.
+  1) 새 탭 생성을 막고(최대 WATCHDOG_RECYCLE_DRAIN_TIMEOUT초 동안 크롤링이 멈춤), 탭 풀은 사용 중인 탭을 반납할 때 닫음 (PagePool.draining)
+  2) 탭이 모두 닫히면(최대 WATCHDOG_RECYCLE_DRAIN_TIMEOUT초) 로그인 세션을 BROWSER_STORAGE_STATE에 저장하고 컨텍스트를 닫음
+  3) PLAYWRIGHT_CONTEXTS 설정 + 저장한 세션으로 같은 이름의 컨텍스트를 다시 만듦
+강제로 닫은 탭과 컨텍스트 교체는 watchdog/* 통계와 로그(요약 필드 포함)로 남습니다.
+
+브라우저 데몬(PLAYWRIGHT_CDP_URL)을 쓰면 Chromium이 다른 프로세스 트리에 있으므로 RSS에 포함되지 않습니다.
+
+scrapy-playwright의 공개되지 않은 내부 속성(context_wrappers, context_launch_lock, _create_browser_context)을
+사용하므로 scrapy-playwright 0.0.48 기준이며, 속성이 없는 버전에서는 경고 후 감시를 멈춥니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.asyncio import create_looping_call
+
+from course_scraper.browser import process_tree_rss_mb, save_storage_state
+from course_scraper.handlers import browser_handler
+
+logger = logging.getLogger(__name__)
+
+# 사용하는 scrapy-playwright 핸들러 내부 속성
+HANDLER_INTERNALS = ('context_wrappers', 'context_launch_lock', '_create_browser_context')
+
+
+class BrowserWatchdog:
+    """열린 탭 / 컨텍스트 / 브라우저 메모리 감시 확장"""
+
+    def __init__(self, crawler):
+        settings = crawler.settings
+        self.crawler = crawler
+        self.stats = crawler.stats
+        self.interval = settings.getfloat('WATCHDOG_INTERVAL', 30)
+        self.page_idle_timeout = settings.getfloat('WATCHDOG_PAGE_IDLE_TIMEOUT', 600)
+        self.max_rss_mb = settings.getfloat('WATCHDOG_MAX_RSS_MB', 0)
+        self.drain_timeout = settings.getfloat('WATCHDOG_RECYCLE_DRAIN_TIMEOUT', 120)
+        self.storage_state_path = settings.get('BROWSER_STORAGE_STATE')
+        self.context_kwargs = settings.getdict('PLAYWRIGHT_CONTEXTS')
+        self.last_active = {}  # page → 마지막 네트워크 요청 시각 (탭이 닫히면 삭제)
+        self.spider = None
+        self.task = None
+        self.check_task = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('WATCHDOG_ENABLED'):
+            raise NotConfigured
+        ext = cls(crawler)
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.spider = spider
+        self.task = create_looping_call(self.tick)
+        self.task.start(self.interval, now=False)
+
+    def spider_closed(self, spider):
+        if self.task and self.task.running:
+            self.task.stop()
+        if self.check_task and not self.check_task.done():
+            self.check_task.cancel()
+
+    def tick(self):
+        # 이전 확인(컨텍스트 교체 대기 등)이 끝나지 않았으면 건너뜀
+        if self.check_task is None or self.check_task.done():
+            self.check_task = asyncio.ensure_future(self.check())
+
+    def watch(self, page, now):
+        """처음 보는 탭의 네트워크 요청 시각 기록 시작"""
+        self.last_active[page] = now
+        page.on('request', lambda request: self.last_active.__setitem__(page, time.monotonic()))
+        page.once('close', lambda closed_page: self.last_active.pop(page, None))
+
+    async def check(self):
+        handler = browser_handler(self.crawler)
+        if handler is None:
+            return
+        missing = [name for name in HANDLER_INTERNALS if not hasattr(handler, name)]
+        if missing:
+            logger.warning(f"Browser watchdog disabled: scrapy-playwright handler has no {', '.join(missing)}")
+            if self.task and self.task.running:
+                self.task.stop()
+            return
+
+        try:
+            now = time.monotonic()
+            page_count = 0
+            for name, wrapper in list(handler.context_wrappers.items()):
+                for page in list(wrapper.context.pages):
+                    if page not in self.last_active:
+                        self.watch(page, now)
+                    elif now - self.last_active[page] > self.page_idle_timeout:
+                        await self.close_leaked_page(name, page, now - self.last_active[page])
+                        continue
+                    page_count += 1
+
+            self.stats.max_value('watchdog/pages_open_max', page_count)
+            self.stats.max_value('watchdog/contexts_open_max', len(handler.context_wrappers))
+
+            rss_mb = await asyncio.to_thread(process_tree_rss_mb, None, False)
+            if rss_mb is None:
+                return
+            self.stats.max_value('watchdog/rss_max_mb', rss_mb)
+            logger.debug("Browser watchdog: %d contexts, %d pages, RSS %.0fMB",
+                         len(handler.context_wrappers), page_count, rss_mb)
+
+            if self.max_rss_mb and rss_mb > self.max_rss_mb:
+                for name, wrapper in list(handler.context_wrappers.items()):
+                    await self.recycle_context(handler, name, wrapper, rss_mb)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Browser watchdog check failed: {e}")
+
+    async def close_leaked_page(self, context_name, page, idle_s):
+        url = page.url
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug("Could not close leaked page %s: %s", url, e)
+            return
+        self.stats.inc_value('watchdog/pages_force_closed')
+        summary = {'event': 'page_force_closed', 'context': context_name, 'url': url, 'idle_s': round(idle_s)}
+        logger.warning(f"Closed leaked page after {idle_s:.0f}s idle: {url}", extra={'summary': summary})
+
+    async def recycle_context(self, handler, name, wrapper, rss_mb):
+        """탭을 모두 반납받은 뒤 로그인 세션을 유지한 채 컨텍스트 교체"""
+        if wrapper.persistent:
+            logger.warning(f"RSS {rss_mb:.0f}MB > {self.max_rss_mb:.0f}MB, "
+                           f"but context '{name}' is persistent and cannot be recycled")
+            return
+
+        logger.info(f"RSS {rss_mb:.0f}MB > {self.max_rss_mb:.0f}MB, recycling browser context '{name}'...")
+        started = time.monotonic()
+        page_pool = getattr(self.spider, 'page_pool', None)
+        context = wrapper.context
+
+        # 교체가 끝날 때까지 scrapy-playwright가 새 탭/컨텍스트를 만들지 못하도록 lock을 잡음
+        async with handler.context_launch_lock:
+            if page_pool:
+                page_pool.draining = True
+            try:
+                while context.pages and time.monotonic() - started < self.drain_timeout:
+                    await asyncio.sleep(1)
+                forced_pages = len(context.pages)
+
+                if self.storage_state_path:
+                    await save_storage_state(context, self.storage_state_path)
+                await context.close()
+
+                # close 이벤트 콜백이 이전 컨텍스트를 목록에서 지운 뒤에 새로 등록해야 함
+                for _ in range(50):
+                    if handler.context_wrappers.get(name) is not wrapper:
+                        break
+                    await asyncio.sleep(0.1)
+
+                context_kwargs = dict(self.context_kwargs.get(name) or {})
+                if self.storage_state_path and os.path.exists(self.storage_state_path):
+                    context_kwargs['storage_state'] = self.storage_state_path
+                await handler._create_browser_context(name, context_kwargs, self.spider)
+            finally:
+                if page_pool:
+                    page_pool.draining = False
+
+        rss_after = await asyncio.to_thread(process_tree_rss_mb, None, False)
+        self.stats.inc_value('watchdog/context_recycles')
+        if forced_pages:
+            self.stats.inc_value('watchdog/pages_force_closed', forced_pages)
+        summary = {
+            'event': 'context_recycled',
+            'context': name,
+            'rss_mb_before': rss_mb,
+            'rss_mb_after': rss_after,
+            'drain_s': round(time.monotonic() - started, 1),
+            'forced_pages': forced_pages,
+        }
+        logger.info(f"✓ Recycled browser context '{name}' in {summary['drain_s']}s: "
+                    f"RSS {rss_mb:.0f}MB → {rss_after or 0:.0f}MB ({forced_pages} pages force-closed)",
+                    extra={'summary': summary})
@@ -1,4 +1,7 @@
 -- 매일 새로 완료한 강의 조회 쿼리 모음
+-- 통계 쿼리는 완료 집계 테이블(lecture_completion_daily / lecture_completion_weekly)을 읽습니다.
+-- (add_completion_rollup_tables.sql 적용 후 scrapy backfill_rollups 실행 필요)
+-- 강의 목록 쿼리는 completed_at 범위 조건으로 idx_completed_at 인덱스를 사용합니다.
 
 -- 1. 오늘 완료한 강의 목록
 SELECT
@@ -9,30 +12,31 @@ SELECT
     l.completed_at AS '완료시각'
 FROM lectures l
 JOIN courses c ON l.course_id = c.course_id
-WHERE DATE(l.completed_at) = CURDATE()
+WHERE l.completed_at >= CURDATE()
+  AND l.completed_at < CURDATE() + INTERVAL 1 DAY
 ORDER BY l.completed_at DESC;
 
 
 -- 2. 오늘 완료한 강의 통계
 SELECT
-    COUNT(*) AS '완료한_강의수',
-    SUM(l.lecture_time) AS '총_학습시간(분)',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '총_학습시간(시간)'
-FROM lectures l
-WHERE DATE(l.completed_at) = CURDATE();
+    COALESCE(SUM(d.completed_count), 0) AS '완료한_강의수',
+    SUM(d.completed_minutes) AS '총_학습시간(분)',
+    ROUND(SUM(d.completed_minutes) / 60, 2) AS '총_학습시간(시간)'
+FROM lecture_completion_daily d
+WHERE d.completion_date = CURDATE();
 
 
 -- 3. 오늘 강의별 완료 현황
 SELECT
     c.course_title AS '강의명',
-    COUNT(*) AS '오늘_완료한_강의수',
-    SUM(l.lecture_time) AS '학습시간(분)',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '학습시간(시간)'
-FROM lectures l
-JOIN courses c ON l.course_id = c.course_id
-WHERE DATE(l.completed_at) = CURDATE()
-GROUP BY c.course_id, c.course_title
-ORDER BY COUNT(*) DESC;
+    d.completed_count AS '오늘_완료한_강의수',
+    d.completed_minutes AS '학습시간(분)',
+    ROUND(d.completed_minutes / 60, 2) AS '학습시간(시간)'
+FROM lecture_completion_daily d
+JOIN courses c ON d.course_id = c.course_id
+WHERE d.completion_date = CURDATE()
+  AND d.completed_count > 0
+ORDER BY d.completed_count DESC;
 
 
 -- 4. 최근 7일간 완료한 강의 목록
@@ -50,15 +54,16 @@ ORDER BY l.completed_at DESC;
 
 -- 5. 최근 7일간 일별 학습 통계
 SELECT
-    DATE(l.completed_at) AS '날짜',
-    DAYNAME(l.completed_at) AS '요일',
-    COUNT(*) AS '완료_강의수',
-    SUM(l.lecture_time) AS '학습시간(분)',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '학습시간(시간)'
-FROM lectures l
-WHERE l.completed_at >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
-GROUP BY DATE(l.completed_at), DAYNAME(l.completed_at)
-ORDER BY DATE(l.completed_at) DESC;
+    d.completion_date AS '날짜',
+    DAYNAME(d.completion_date) AS '요일',
+    SUM(d.completed_count) AS '완료_강의수',
+    SUM(d.completed_minutes) AS '학습시간(분)',
+    ROUND(SUM(d.completed_minutes) / 60, 2) AS '학습시간(시간)'
+FROM lecture_completion_daily d
+WHERE d.completion_date >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
+GROUP BY d.completion_date
+HAVING SUM(d.completed_count) > 0
+ORDER BY d.completion_date DESC;
 
 
 -- 6. 특정 날짜에 완료한 강의 목록 (날짜 직접 입력)
@@ -70,19 +75,20 @@ SELECT
     TIME(l.completed_at) AS '완료시각'
 FROM lectures l
 JOIN courses c ON l.course_id = c.course_id
-WHERE DATE(l.completed_at) = '2025-10-16'  -- 원하는 날짜로 변경
+WHERE l.completed_at >= '2025-10-16'  -- 원하는 날짜로 변경
+  AND l.completed_at < '2025-10-16' + INTERVAL 1 DAY
 ORDER BY l.completed_at;
 
 
 -- 7. 이번 달 완료한 강의 통계
 SELECT
-    COUNT(*) AS '완료_강의수',
-    SUM(l.lecture_time) AS '총_학습시간(분)',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '총_학습시간(시간)',
-    ROUND(COUNT(*) / DAY(LAST_DAY(CURDATE())), 1) AS '하루평균_강의수'
-FROM lectures l
-WHERE YEAR(l.completed_at) = YEAR(CURDATE())
-  AND MONTH(l.completed_at) = MONTH(CURDATE());
+    COALESCE(SUM(d.completed_count), 0) AS '완료_강의수',
+    SUM(d.completed_minutes) AS '총_학습시간(분)',
+    ROUND(SUM(d.completed_minutes) / 60, 2) AS '총_학습시간(시간)',
+    ROUND(COALESCE(SUM(d.completed_count), 0) / DAY(LAST_DAY(CURDATE())), 1) AS '하루평균_강의수'
+FROM lecture_completion_daily d
+WHERE d.completion_date >= DATE_FORMAT(CURDATE(), '%Y-%m-01')
+  AND d.completion_date <= LAST_DAY(CURDATE());
 
 
 -- 8. 강의별 최근 완료한 강의 (강의당 최대 5개)
@@ -103,27 +109,39 @@ LIMIT 50;
 -- 9. 오늘과 어제 비교
 SELECT
     '오늘' AS '구분',
-    COUNT(*) AS '완료_강의수',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '학습시간(시간)'
-FROM lectures l
-WHERE DATE(l.completed_at) = CURDATE()
+    COALESCE(SUM(d.completed_count), 0) AS '완료_강의수',
+    ROUND(SUM(d.completed_minutes) / 60, 2) AS '학습시간(시간)'
+FROM lecture_completion_daily d
+WHERE d.completion_date = CURDATE()
 
 UNION ALL
 
 SELECT
     '어제' AS '구분',
-    COUNT(*) AS '완료_강의수',
-    ROUND(SUM(l.lecture_time) / 60, 2) AS '학습시간(시간)'
-FROM lectures l
-WHERE DATE(l.completed_at) = DATE_SUB(CURDATE(), INTERVAL 1 DAY);
+    COALESCE(SUM(d.completed_count), 0) AS '완료_강의수',
+    ROUND(SUM(d.completed_minutes) / 60, 2) AS '학습시간(시간)'
+FROM lecture_completion_daily d
+WHERE d.completion_date = DATE_SUB(CURDATE(), INTERVAL 1 DAY);
 
 
 -- 10. 주간 학습 패턴 분석 (요일별)
 SELECT
-    DAYNAME(l.completed_at) AS '요일',
-    COUNT(*) AS '평균_완료_강의수',
-    ROUND(AVG(l.lecture_time), 2) AS '평균_강의시간(분)'
-FROM lectures l
-WHERE l.completed_at >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
-GROUP BY DAYOFWEEK(l.completed_at), DAYNAME(l.completed_at)
-ORDER BY DAYOFWEEK(l.completed_at);
+    DAYNAME(d.completion_date) AS '요일',
+    SUM(d.completed_count) AS '평균_완료_강의수',
+    ROUND(SUM(d.completed_minutes) / SUM(d.completed_count), 2) AS '평균_강의시간(분)'
+FROM lecture_completion_daily d
+WHERE d.completion_date >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
+GROUP BY DAYOFWEEK(d.completion_date), DAYNAME(d.completion_date)
+HAVING SUM(d.completed_count) > 0
+ORDER BY DAYOFWEEK(d.completion_date);
+
+
+-- 11. 최근 8주간 주별 학습 통계
+SELECT
+    w.week_start AS '주차(월요일)',
+    SUM(w.completed_count) AS '완료_강의수',
+    ROUND(SUM(w.completed_minutes) / 60, 2) AS '학습시간(시간)'
+FROM lecture_completion_weekly w
+WHERE w.week_start >= DATE_SUB(CURDATE(), INTERVAL 8 WEEK)
+GROUP BY w.week_start
+ORDER BY w.week_start DESC;
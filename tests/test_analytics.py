@@ -0,0 +1,143 @@
+"""analytics.build_reports를 analysis_queries.sql 기준으로 손으로 계산한 값과 비교"""
+
+from datetime import date
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from course_scraper.analytics import (  # noqa: E402
+    SQL_REPORTS, build_reports, compare_reports, normalize, sql_queries, to_weekly,
+)
+
+TODAY = date(2025, 3, 3)  # 월요일
+
+COURSES = [
+    # course_id, title, progress_rate, study_time, total_lecture_time
+    (1, 'A', 60.0, 60, 100),
+    (2, 'B', 25.0, 50, 200),
+    (3, 'C', 100.0, 50, 50),
+    (4, 'D', 12.5, 10, 80),
+    (5, 'E', 0.0, 0, 30),  # 스냅샷 없음
+]
+SNAPSHOTS = [
+    # course_id, snapshot_date, progress_rate, study_time, total_lecture_time
+    (1, '2025-02-17', 20.0, 20, 100),
+    (1, '2025-02-24', 40.0, 40, 100),
+    (1, '2025-03-03', 60.0, 60, 100),
+    (2, '2025-02-24', 25.0, 50, 200),
+    (2, '2025-03-03', 25.0, 50, 200),
+    (3, '2025-03-03', 100.0, 50, 50),
+    (4, '2025-01-06', 12.5, 10, 80),
+]
+
+
+def frames(snapshot_rows=SNAPSHOTS):
+    snapshots = pd.DataFrame(snapshot_rows, columns=['course_id', 'snapshot_date', 'progress_rate',
+                                                     'study_time', 'total_lecture_time'])
+    courses = pd.DataFrame(COURSES, columns=['course_id', 'course_title', 'progress_rate',
+                                             'study_time', 'total_lecture_time'])
+    return normalize(snapshots, courses)
+
+
+def rows(frame, columns):
+    return [tuple(row) for row in frame[columns].itertuples(index=False, name=None)]
+
+
+@pytest.fixture
+def reports():
+    return build_reports(*frames(), today=TODAY)
+
+
+def test_current(reports):
+    assert rows(reports['current'], ['course_title', 'study_time']) == [('A', 60), ('B', 50), ('C', 50)]
+
+
+def test_this_week(reports):
+    # A: 60 - 40, C: 7일 전 스냅샷 없음 → IFNULL(prev, 0), B: 증가 없음 → 제외
+    assert rows(reports['this_week'], ['course_title', 'weekly_study', 'weekly_progress', 'remaining_time']) == [
+        ('C', 50, 100.0, 0), ('A', 20, 20.0, 40),
+    ]
+
+
+def test_trend(reports):
+    # 4주 전(2/3) 이후만, D(1/6)는 제외
+    assert rows(reports['trend'], ['course_count', 'total_study_time', 'avg_progress_rate']) == [
+        (3, 160, 61.67), (2, 90, 32.5), (1, 20, 20.0),
+    ]
+
+
+def test_weekly_changes(reports):
+    assert rows(reports['weekly_changes'], ['studied_courses', 'weekly_study', 'avg_weekly_study']) == [
+        (2, 70, 35.0), (2, 70, 35.0), (1, 20, 20.0),
+    ]
+
+
+def test_course_patterns(reports):
+    # 2주 이상 기록한 강의만, 평균은 학습한 주(> 0)만
+    assert rows(reports['course_patterns'], ['course_title', 'weeks', 'avg_weekly_study', 'max_weekly_study',
+                                             'remaining_time']) == [
+        ('B', 2, 50.0, 50, 150), ('A', 3, 20.0, 20, 40),
+    ]
+
+
+def test_goal(reports):
+    goal = reports['goal'].iloc[0]
+    assert goal['total_study_time'] == 70
+    assert goal['goal_rate'] == 38.89
+    assert goal['status'] == '❌ 미달성'
+
+
+def test_eta(reports):
+    assert rows(reports['eta'], ['course_title', 'avg_weekly_study', 'weeks_to_complete', 'expected_completion']) == [
+        ('A', 20.0, 2, date(2025, 3, 17)), ('B', 50.0, 3, date(2025, 3, 24)),
+    ]
+
+
+def test_idle(reports):
+    idle = reports['idle']
+    assert list(idle['course_title']) == ['D', 'E']
+    assert idle['last_snapshot_date'].iloc[0] == pd.Timestamp('2025-01-06')
+    assert pd.isna(idle['last_snapshot_date'].iloc[1])
+
+
+def test_daily_snapshots_are_counted_per_week():
+    # SNAPSHOT_GRANULARITY=daily: A가 2/24 주에 세 번 크롤링됨 → 그 주의 마지막 값(2/27, 50분) 하나로 합침
+    daily = [row for row in SNAPSHOTS if row[:2] != (1, '2025-02-24')] + [
+        (1, '2025-02-24', 40.0, 40, 100),
+        (1, '2025-02-25', 45.0, 45, 100),
+        (1, '2025-02-27', 50.0, 50, 100),
+    ]
+    snapshots, courses = frames(daily)
+    weekly = to_weekly(snapshots)
+    assert (weekly['snapshot_date'].dt.weekday == 0).all()
+    assert weekly[weekly['course_id'] == 1]['study_time'].tolist() == [20, 60, 50]
+
+    reports = build_reports(snapshots, courses, today=TODAY)
+    patterns = reports['course_patterns'].set_index('course_title')
+    assert patterns.loc['A', 'weeks'] == 3
+    assert rows(reports['weekly_changes'], ['weekly_study']) == [(60,), (80,), (20,)]
+
+
+def test_weekly_snapshots_unchanged():
+    snapshots, _ = frames()
+    assert to_weekly(snapshots) is snapshots
+
+
+def test_sql_file_has_every_report():
+    queries = sql_queries()
+    for name, (number, columns) in SQL_REPORTS.items():
+        for column in columns:
+            assert f"'{column}'" in queries[number], (name, column)
+
+
+def test_compare_reports_matches_sql_shaped_results(reports):
+    sql_results = {}
+    for name, (_, columns) in SQL_REPORTS.items():
+        frame = reports[name][list(columns.values())]
+        sql_results[name] = (list(columns), [tuple(row) for row in frame.itertuples(index=False, name=None)][::-1])
+    assert compare_reports(reports, sql_results) == []
+
+    columns, sql_rows = sql_results['eta']
+    sql_results['eta'] = (columns, [('A',) + sql_rows[-1][1:3] + (25.0,) + sql_rows[-1][4:]] + sql_rows[:-1])
+    assert [mismatch.split(':')[0] for mismatch in compare_reports(reports, sql_results)] == ['eta']
@@ -0,0 +1,36 @@
+import pytest
+
+from course_scraper.curriculum import curriculum_items, platform_course_id
+from course_scraper.items import CourseItem
+
+
+CURRICULUM = [
+    {'section': '소개', 'lessons': [
+        {'title': 'OT', 'minutes': 5, 'is_completed': True},
+        {'title': '설치', 'minutes': 15, 'is_completed': False},
+    ]},
+]
+
+
+@pytest.mark.parametrize('platform, course_id, expected', [
+    ('fastcampus', 214390, 214390),
+    ('inflearn', 214390, 1_000_214_390),
+    ('udemy', 214390, 1_500_214_390),
+])
+def test_platform_ids_do_not_collide(platform, course_id, expected):
+    assert platform_course_id(platform, course_id) == expected
+
+
+@pytest.mark.parametrize('course_id', [0, -1, 500_000_000])
+def test_out_of_range_id(course_id):
+    with pytest.raises(ValueError):
+        platform_course_id('udemy', course_id)
+
+
+def test_items_use_platform_course_id():
+    course, *lectures = curriculum_items('inflearn', '324145', '강의', 'https://www.inflearn.com/course/324145', CURRICULUM)
+    assert isinstance(course, CourseItem)
+    assert course['platform'] == 'inflearn'
+    assert course['course_id'] == 1_000_324_145
+    assert course['progress_rate'] == 25.0
+    assert [lecture['course_id'] for lecture in lectures] == [1_000_324_145] * 2
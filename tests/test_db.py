@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from course_scraper.db import ConnectionPool, PoolExhaustedError, is_connection_error
+
+
+class FakeConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = ConnectionPool(size=1)
+    monkeypatch.setattr(pool, 'connect', FakeConnection)
+    return pool
+
+
+def test_exhausted_pool_fails_fast(pool):
+    connection = pool.acquire()
+    started = time.monotonic()
+    with pytest.raises(PoolExhaustedError) as excinfo:
+        pool.acquire()
+    assert time.monotonic() - started < 0.1  # reactor 스레드를 붙잡지 않음
+    # pipeline은 연결 오류로 보고 backoff 후 재시도 / 스풀
+    assert is_connection_error(excinfo.value)
+
+    pool.release(connection)
+    assert pool.acquire() is connection
+
+
+def test_discarded_connection_frees_slot(pool):
+    pool.release(pool.acquire(), discard=True)
+    assert isinstance(pool.acquire(), FakeConnection)
+
+
+def test_connection_context_returns_connection(pool):
+    with pool.connection() as connection:
+        pass
+    assert pool.acquire() is connection
@@ -0,0 +1,88 @@
+import random
+import string
+
+import pytest
+
+from course_scraper import duration
+from course_scraper.duration import parse_duration
+
+# 시드를 고정한 무작위 입력 (hypothesis 없이 매번 같은 케이스로 재현 가능)
+SEED = 20250101
+CASES = 2000
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('25:50', 25.83),
+    ('1:30:45', 90.75),
+    ('0:00', 0),
+    ('00:30', 0.5),
+    ('1시간 30분', 90),
+    ('1시간', 60),
+    ('30분', 30),
+    ('45', 45),
+    ('  12:00  ', 12),
+    ('', 0),
+    (None, 0),
+    ('1:2:3:4', 0),
+    ('12:ab', 0),
+    ('-5', 0),
+    ('1:²', 0),
+    ('약 10분', 10),
+])
+def test_known_formats(text, expected):
+    assert parse_duration(text) == expected
+
+
+def test_round_trip_minutes_seconds():
+    rng = random.Random(SEED)
+    for _ in range(CASES):
+        minutes, seconds = rng.randrange(0, 600), rng.randrange(0, 60)
+        expected = round(minutes + round(seconds / 60, 2), 2)
+        assert parse_duration(f'{minutes}:{seconds:02d}') == expected
+        assert parse_duration(f'{minutes}:{seconds}') == expected
+
+
+def test_round_trip_hours_minutes_seconds():
+    rng = random.Random(SEED + 1)
+    for _ in range(CASES):
+        hours, minutes, seconds = rng.randrange(0, 100), rng.randrange(0, 60), rng.randrange(0, 60)
+        expected = round(hours * 60 + minutes + round(seconds / 60, 2), 2)
+        assert parse_duration(f'{hours}:{minutes:02d}:{seconds:02d}') == expected
+
+
+def test_round_trip_korean_units():
+    rng = random.Random(SEED + 2)
+    for _ in range(CASES):
+        hours, minutes = rng.randrange(0, 100), rng.randrange(0, 60)
+        assert parse_duration(f'{hours}시간 {minutes}분') == hours * 60 + minutes
+        assert parse_duration(f'{hours}시간{minutes}분') == hours * 60 + minutes
+
+
+def random_text(rng):
+    alphabet = string.digits * 3 + ':::  ' + string.ascii_letters + '시간분.-²٣'
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randrange(0, 12)))
+
+
+def test_arbitrary_strings_never_fail_and_are_non_negative():
+    rng = random.Random(SEED + 3)
+    for _ in range(CASES * 5):
+        text = random_text(rng)
+        result = parse_duration(text)
+        assert isinstance(result, (int, float)), text
+        assert result >= 0, text
+
+
+def test_memo_returns_same_result_as_uncached():
+    rng = random.Random(SEED + 4)
+    texts = [random_text(rng) for _ in range(CASES)]
+    cached = [parse_duration(text) for text in texts]
+    duration._parse_duration.cache_clear()
+    assert [parse_duration(text) for text in texts] == cached
+
+
+def test_pipeline_and_spiders_share_one_parser():
+    from course_scraper import pipelines
+    from course_scraper.spiders import fastcampus_base, inflearn_spider, udemy_spider
+
+    for module in (pipelines, fastcampus_base, inflearn_spider, udemy_spider):
+        assert module.parse_duration is parse_duration, module.__name__
@@ -0,0 +1,17 @@
+from scrapy.utils.test import get_crawler
+
+from course_scraper import browser
+from course_scraper.metrics import CrawlMetrics
+
+
+def test_render_uses_sampled_rss_without_running_ps(monkeypatch):
+    metrics = CrawlMetrics(get_crawler(settings_dict={'METRICS_ENABLED': True}))
+    monkeypatch.setattr(browser, 'process_tree_rss_mb', lambda: 123.45)
+    metrics.stopping.set()
+    metrics.sample_rss()
+
+    def fail():
+        raise AssertionError('render() must not run ps on the reactor')
+
+    monkeypatch.setattr(browser, 'process_tree_rss_mb', fail)
+    assert 'course_scraper_memory_rss_megabytes{} 123.5' in metrics.render()
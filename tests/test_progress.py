@@ -0,0 +1,69 @@
+import pytest
+
+from course_scraper.progress import parse_progress_text
+
+
+SUMMARY = """
+수강률 42.5%
+수강시간 1:30:45
+강의시간 23:08:50
+"""
+
+
+def test_summary_widget_text():
+    result = parse_progress_text(SUMMARY)
+    assert result['progress_rate'] == 42.5
+    assert result['study_time'] == 90.75
+    assert result['total_lecture_time'] == pytest.approx(23 * 60 + 8 + 50 / 60)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('수강시간 25:50', 25.83),         # M:S
+    ('수강시간 1:30:45', 90.75),       # H:M:S
+    ('수강시간 0:00:30', 0.5),
+    ('수강시간 0:59', 0.98),
+    ('수강시간 100:00', 100),          # 콜론이 1개면 분:초
+])
+def test_study_time_formats(text, expected):
+    assert parse_progress_text(text)['study_time'] == expected
+
+
+def test_total_lecture_time_requires_h_m_s():
+    assert parse_progress_text('강의시간 10:20:30')['total_lecture_time'] == pytest.approx(620.5)
+    assert parse_progress_text('강의시간 10:20')['total_lecture_time'] == 0
+
+
+def test_integer_and_decimal_rate():
+    assert parse_progress_text('수강률 100%')['progress_rate'] == 100.0
+    assert parse_progress_text('수강률 3.25 %')['progress_rate'] == 3.25
+
+
+def test_first_match_wins():
+    text = '수강률 10% 수강시간 1:00 강의시간 1:00:00 수강률 99% 수강시간 9:00'
+    result = parse_progress_text(text)
+    assert result['progress_rate'] == 10.0
+    assert result['study_time'] == 1
+
+
+def test_values_on_one_line_without_spaces():
+    result = parse_progress_text('수강률12%수강시간12:30강의시간2:00:00')
+    assert result == {'progress_rate': 12.0, 'study_time': 12.5, 'total_lecture_time': 120}
+
+
+@pytest.mark.parametrize('text', [
+    None,
+    '',
+    '진도 정보 없음',
+    '수강률 %',
+    '수강시간 :30',
+    '수강시간 abc:de',
+    '강의시간 1::2',
+    '수강률 -5%',
+])
+def test_malformed_text_returns_defaults(text):
+    assert parse_progress_text(text) == {'progress_rate': 0.0, 'study_time': 0, 'total_lecture_time': 0}
+
+
+def test_missing_fields_keep_defaults():
+    result = parse_progress_text('수강률 50%')
+    assert result == {'progress_rate': 50.0, 'study_time': 0, 'total_lecture_time': 0}
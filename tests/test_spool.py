@@ -0,0 +1,38 @@
+import os
+
+from course_scraper.items import CourseItem
+from course_scraper.spool import Spool, read_progress, read_spool, remove_spool, spool_files, write_progress
+
+
+def touch(path, mtime=None):
+    path.write_text('')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_spool_files_oldest_crawl_first(tmp_path):
+    newer = touch(tmp_path / 'fastcampus_daily-20250107-090000.jsonl')
+    older = touch(tmp_path / 'udemy-20250106-090000.jsonl')
+    oldest = touch(tmp_path / 'fastcampus-20250105-230000.jsonl')
+    assert spool_files(str(tmp_path)) == [oldest, older, newer]
+
+
+def test_spool_files_without_timestamp_use_mtime(tmp_path):
+    renamed = touch(tmp_path / 'renamed.jsonl', mtime=0)
+    named = touch(tmp_path / 'fastcampus-20250105-230000.jsonl')
+    assert spool_files(str(tmp_path)) == [renamed, named]
+
+
+def test_progress_round_trip_and_remove(tmp_path):
+    spool = Spool(str(tmp_path / 'fastcampus-20250105-230000.jsonl'))
+    spool.append(CourseItem(course_id='1', url='https://fastcampus.co.kr/classroom/1'))
+    spool.close()
+    assert read_progress(spool.path) == 0
+    write_progress(spool.path, 1)
+    assert read_progress(spool.path) == 1
+    assert [item['course_id'] for item, _ in read_spool(spool.path)] == ['1']
+    assert spool_files(str(tmp_path)) == [spool.path]  # .done은 드레인 대상이 아님
+
+    remove_spool(spool.path)
+    assert os.listdir(tmp_path) == []
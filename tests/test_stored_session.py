@@ -0,0 +1,45 @@
+import json
+import time
+
+import pytest
+from scrapy.utils.project import get_project_settings
+
+from course_scraper.spiders.fastcampus_daily_spider import FastCampusDailySpider
+from course_scraper.spiders.fastcampus_discover_spider import FastCampusDiscoverSpider
+from course_scraper.spiders.inflearn_spider import InflearnSpider
+
+LOGIN_SPIDERS = [FastCampusDailySpider, FastCampusDiscoverSpider]
+
+
+def effective_settings(spidercls, storage_state):
+    settings = get_project_settings()
+    settings.set('BROWSER_STORAGE_STATE', str(storage_state), priority='cmdline')
+    settings.set('BROWSER_HEADLESS', 'auto', priority='cmdline')
+    spidercls.update_settings(settings)
+    return settings
+
+
+@pytest.fixture
+def stored_session(tmp_path):
+    path = tmp_path / 'storage_state.json'
+    path.write_text(json.dumps({'cookies': [{'domain': '.fastcampus.co.kr', 'expires': time.time() + 3600}]}))
+    return path
+
+
+@pytest.mark.parametrize('spidercls', LOGIN_SPIDERS)
+def test_login_spiders_reuse_stored_session(spidercls, stored_session):
+    settings = effective_settings(spidercls, stored_session)
+    assert settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS')['headless'] is True
+    assert settings.getdict('PLAYWRIGHT_CONTEXTS')['default']['storage_state'] == str(stored_session)
+
+
+@pytest.mark.parametrize('spidercls', LOGIN_SPIDERS)
+def test_login_spiders_show_browser_without_session(spidercls, tmp_path):
+    settings = effective_settings(spidercls, tmp_path / 'missing.json')
+    assert settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS')['headless'] is False
+    assert 'storage_state' not in settings.getdict('PLAYWRIGHT_CONTEXTS')['default']
+
+
+def test_http_spiders_do_not_read_session(stored_session):
+    settings = effective_settings(InflearnSpider, stored_session)
+    assert 'headless' not in settings.getdict('PLAYWRIGHT_LAUNCH_OPTIONS')